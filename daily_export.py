@@ -0,0 +1,217 @@
+"""
+날짜별 브리핑 정적 JSON 내보내기
+
+news.db 저장과 함께 날짜별 브리핑(분석 + 기사)을 gzip으로 미리 압축한 JSON으로
+내보냅니다. 웹 앱은 요청한 날짜의 작은 파일과 매니페스트만 읽으면 되므로, 콜드
+인스턴스가 news.db 전체를 메모리에 올리지 않아도 됩니다.
+
+출력 (news.db와 같은 디렉터리 아래):
+    daily/YYYY-MM-DD.json.gz   {"date", "briefing", "articles"} (웹 앱의 Article/DailyBriefing 형태)
+    daily/index.json           날짜별 기사 수·분석 여부·이전/다음 날짜·파일 해시 (briefing_index 기준)
+                               + 내보낼 때의 원본 DB 파일 해시(source)
+
+이전/다음 날짜는 매니페스트에만 두어, 새 날짜가 추가되어도 이웃 날짜의 파일은
+다시 쓰지 않습니다. gzip 헤더의 시각을 0으로 고정해 내용이 같으면 바이트도 같으므로
+바뀐 날짜만 git 변경으로 잡힙니다.
+
+웹 앱은 source 해시가 배포된 DB 파일과 같을 때만 매니페스트를 그대로 믿고, 다르면
+(내보내기 없이 DB만 바뀐 경우) DB의 날짜와 합쳐 어긋난 날짜는 DB에서 읽습니다.
+
+사용법:
+    python daily_export.py                  # 바뀐 날짜만 다시 내보내기 (전체 비교)
+    python daily_export.py 2026-08-21 ...   # 지정한 날짜 (+ 매니페스트가 DB와 어긋나면 전체 비교)
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+import news_store
+
+DBPath = Union[str, Path]
+
+MANIFEST_NAME = "index.json"
+MANIFEST_VERSION = 1
+
+
+def export_dir(db_path: DBPath) -> Path:
+    """news.db 옆의 내보내기 디렉터리 (예: web/data/daily)."""
+    return Path(db_path).parent / "daily"
+
+
+def _rows(conn: sqlite3.Connection, sql: str, params: tuple) -> List[Dict[str, Any]]:
+    cursor = conn.execute(sql, params)
+    columns = [c[0] for c in cursor.description]
+    return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+
+def _render(conn: sqlite3.Connection, date_str: str) -> Optional[bytes]:
+    """한 날짜의 JSON 본문 (기사가 없으면 None - 웹 앱에서도 없는 날짜)."""
+    articles = _rows(conn, "SELECT * FROM articles WHERE date = ? ORDER BY id ASC", (date_str,))
+    if not articles:
+        return None
+    briefing = _rows(conn, "SELECT * FROM daily_briefings WHERE date = ?", (date_str,))
+    doc = {"date": date_str, "briefing": briefing[0] if briefing else None, "articles": articles}
+    return json.dumps(doc, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+def source_fingerprint(db_path: DBPath) -> Optional[Dict[str, str]]:
+    """
+    briefing_index가 있는 DB 파일(monthly면 카탈로그)의 경로와 내용 해시 (파일이 없으면 None).
+    경로는 news.db가 있는 디렉터리(웹 앱의 data/) 기준입니다.
+    """
+    path = news_store.index_db_path(db_path)
+    if not path.exists():
+        return None
+    digest = hashlib.sha256(path.read_bytes()).hexdigest()[:16]
+    return {"file": path.relative_to(Path(db_path).parent).as_posix(), "sha": digest}
+
+
+def restamp_source(db_path: DBPath, previous: Optional[Dict[str, str]]) -> bool:
+    """
+    날짜 내용과 무관한 쓰기(실행 지표 등)로 DB 파일만 바뀐 뒤 매니페스트의 source 해시를 갱신합니다.
+    쓰기 전 지문(previous)이 매니페스트와 같았을 때만 갱신하므로, 이미 어긋난 매니페스트를 맞다고 덮지 않습니다.
+
+    Returns:
+        bool: 갱신했으면 True
+    """
+    out_dir = export_dir(db_path)
+    if previous is None or not (out_dir / MANIFEST_NAME).exists():
+        return False
+    manifest = load_manifest(out_dir)
+    if manifest.get("source") != previous:
+        return False
+    manifest["source"] = source_fingerprint(db_path)
+    _write_manifest(out_dir, manifest)
+    return True
+
+
+def _write_manifest(out_dir: Path, manifest: Dict[str, Any]) -> None:
+    _write_atomic(
+        out_dir / MANIFEST_NAME,
+        json.dumps(manifest, ensure_ascii=False, indent=1).encode("utf-8") + b"\n"
+    )
+
+
+def load_manifest(out_dir: Path) -> Dict[str, Any]:
+    """매니페스트를 읽습니다 (없거나 깨졌으면 빈 매니페스트)."""
+    try:
+        manifest = json.loads((out_dir / MANIFEST_NAME).read_text(encoding="utf-8"))
+        if manifest.get("version") == MANIFEST_VERSION:
+            return manifest
+    except (OSError, ValueError):
+        pass
+    return {"version": MANIFEST_VERSION, "latest": None, "dates": {}}
+
+
+def export_dates(
+    db_path: DBPath,
+    dates: Optional[Iterable[str]] = None,
+    previous_source: Optional[Dict[str, str]] = None
+) -> List[str]:
+    """
+    날짜별 JSON과 매니페스트를 갱신합니다. 내용 해시가 매니페스트와 같은 날짜는 건너뜁니다.
+
+    Args:
+        db_path: news.db 경로 (monthly면 카탈로그와 월별 샤드에서 읽음)
+        dates: 다시 내보낼 날짜들 (None이면 모든 날짜를 비교)
+        previous_source: 그 날짜들을 쓰기 직전의 source_fingerprint().
+            매니페스트가 그때의 DB와 맞지 않았다면(내보내기 없이 DB를 바꾼 작성자가 있었다면)
+            dates와 무관하게 모든 날짜를 비교합니다.
+
+    Returns:
+        List[str]: 실제로 다시 쓴 날짜 (삭제된 날짜 포함)
+    """
+    out_dir = export_dir(db_path)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    manifest = load_manifest(out_dir)
+    entries: Dict[str, Dict[str, Any]] = manifest["dates"]
+    if dates is not None and (previous_source is None or manifest.get("source") != previous_source):
+        dates = None
+
+    partitioned = news_store.is_partitioned(db_path)
+    conn = news_store.connect_index(db_path)
+    try:
+        index = _rows(
+            conn,
+            """SELECT date, article_count, domestic_count, overseas_count, has_analysis, prev_date, next_date
+               FROM briefing_index ORDER BY date""",
+            ()
+        )
+        indexed = {row["date"]: row for row in index}
+        # 지정한 날짜 외에도 매니페스트와 색인이 어긋난 날짜(첫 실행, 수동 수정)는 함께 맞춤
+        mismatched = set(indexed) ^ set(entries)
+        targets = set(indexed) | set(entries) if dates is None else set(dates) | mismatched
+
+        changed = []
+        for date_str in sorted(targets):
+            if date_str not in indexed:
+                body = None
+            elif partitioned:
+                # monthly: 그 날짜의 샤드만 붙여서 읽음
+                date_conn = news_store.connect_date(db_path, date_str)
+                try:
+                    body = _render(date_conn, date_str)
+                finally:
+                    date_conn.close()
+            else:
+                body = _render(conn, date_str)
+            path = out_dir / f"{date_str}.json.gz"
+            if body is None:
+                if date_str in entries or path.exists():
+                    path.unlink(missing_ok=True)
+                    entries.pop(date_str, None)
+                    changed.append(date_str)
+                continue
+            digest = hashlib.sha256(body).hexdigest()[:16]
+            if entries.get(date_str, {}).get("sha") == digest and path.exists():
+                continue
+            _write_atomic(path, gzip.compress(body, compresslevel=9, mtime=0))
+            entries[date_str] = {"sha": digest}
+            changed.append(date_str)
+    finally:
+        conn.close()
+
+    # 매니페스트의 날짜 메타데이터는 briefing_index에서 통째로 다시 씀 (작은 파일)
+    dates_meta = {}
+    for date_str, row in indexed.items():
+        if date_str not in entries:
+            continue
+        meta = {k: v for k, v in row.items() if k != "date"}
+        meta["has_analysis"] = bool(meta["has_analysis"])
+        meta["sha"] = entries[date_str]["sha"]
+        dates_meta[date_str] = meta
+    manifest = {
+        "version": MANIFEST_VERSION,
+        "latest": max(dates_meta) if dates_meta else None,
+        "source": source_fingerprint(db_path),
+        "dates": dict(sorted(dates_meta.items(), reverse=True)),
+    }
+    _write_manifest(out_dir, manifest)
+    return changed
+
+
+def main() -> int:
+    db_path = Path(__file__).parent / "web" / "data" / "news.db"
+    if not news_store.index_db_path(db_path).exists():
+        print(f"DB not found: {db_path}")
+        return 1
+    dates = sys.argv[1:] or None
+    changed = export_dates(db_path, dates)
+    print(f"Exported {len(changed)} date(s) to {export_dir(db_path)}: {', '.join(changed) or '-'}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,340 @@
+"""
+뉴스 기사 근사 중복 제거 엔진 (MinHash + LSH)
+
+같은 사건을 다룬 여러 언론사 기사 중 하나만 남기기 위한 엔진입니다.
+중복 판정 기준은 기존 news_bot.remove_duplicate_articles()와 동일합니다.
+    - 제목 유사도(SequenceMatcher) 60% 초과, 또는
+    - 핵심 키워드 중복률(작은 집합 기준) 50% 초과
+    - 중복이면 더 긴 제목(더 상세한 기사)을 유지
+
+기존 구현은 모든 기사 쌍을 비교하는 O(n²)였습니다. 이 엔진은
+    1) 제목 문자 2-gram의 MinHash 서명을 밴드로 나눈 LSH 버킷
+    2) 핵심 키워드 역색인
+으로 후보 쌍만 추려낸 뒤, 후보에 대해서만 기존 판정 기준을 적용합니다.
+
+RecentBriefingIndex는 같은 색인을 최근 N일 브리핑 기사에 적용해
+전날 이미 다룬 기사가 다시 선별되지 않도록 합니다.
+"""
+
+import hashlib
+import re
+import sqlite3
+from difflib import SequenceMatcher
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from urllib.parse import urlsplit
+
+# 보안 뉴스 공통 불용어 (중복 판단에서 제외)
+STOPWORDS = {
+    # 보안 분야 공통어
+    '해킹', '해커', '보안', '사이버', '공격', '방어', '위협', '취약점', '악성코드',
+    '랜섬웨어', '피싱', '유출', '침해', '탈취', '감염', '차단', '대응', '예방',
+    '정보보호', '개인정보', '데이터', '시스템', '네트워크', '서버', '클라우드',
+    # 일반 용어
+    '발생', '발견', '확인', '조사', '분석', '대상', '관련', '통해', '위해',
+    '피해', '사고', '사건', '문제', '경고', '주의', '강화', '도입', '추진',
+    '기업', '기관', '업계', '국내', '해외', '글로벌', '올해', '최근',
+}
+
+TITLE_SIMILARITY_THRESHOLD = 0.60
+KEYWORD_OVERLAP_THRESHOLD = 0.50
+
+# MinHash/LSH 파라미터: 64개 해시를 2개씩 32밴드로 나눔
+# (자카드 유사도 약 0.18 이상이면 높은 확률로 후보가 됨 → 0.6 유사도 기준 대비 재현율 우선)
+NUM_PERM = 64
+LSH_BANDS = 32
+LSH_ROWS = NUM_PERM // LSH_BANDS
+SHINGLE_SIZE = 2
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+
+def _make_permutations(num_perm: int) -> List[Tuple[int, int]]:
+    """실행마다 같은 결과가 나오도록 고정 시드로 해시 순열 계수를 생성합니다."""
+    perms = []
+    for i in range(num_perm):
+        digest = hashlib.blake2b(f"minhash-{i}".encode(), digest_size=16).digest()
+        a = int.from_bytes(digest[:8], "big") % (_MERSENNE_PRIME - 1) + 1
+        b = int.from_bytes(digest[8:], "big") % _MERSENNE_PRIME
+        perms.append((a, b))
+    return perms
+
+
+_PERMUTATIONS = _make_permutations(NUM_PERM)
+
+
+def extract_keywords(title: str) -> Set[str]:
+    """제목에서 고유명사 위주 키워드 추출 (공통 보안 용어 제외)"""
+    words = re.findall(r'[가-힣a-zA-Z0-9]+', title)
+    # 2글자 이상 단어 중 불용어 제외
+    return {w.lower() for w in words if len(w) >= 2 and w not in STOPWORDS}
+
+
+def shingles(title: str, size: int = SHINGLE_SIZE) -> Set[str]:
+    """공백을 제거한 소문자 제목의 문자 n-gram 집합을 반환합니다."""
+    text = re.sub(r'\s+', '', title.lower())
+    if len(text) <= size:
+        return {text} if text else set()
+    return {text[i:i + size] for i in range(len(text) - size + 1)}
+
+
+def minhash_signature(shingle_set: Set[str]) -> Tuple[int, ...]:
+    """shingle 집합의 MinHash 서명을 계산합니다."""
+    if not shingle_set:
+        return tuple([_MAX_HASH] * NUM_PERM)
+    hashes = [
+        int.from_bytes(hashlib.blake2b(s.encode(), digest_size=4).digest(), "big")
+        for s in shingle_set
+    ]
+    return tuple(
+        min(((a * h + b) % _MERSENNE_PRIME) & _MAX_HASH for h in hashes)
+        for a, b in _PERMUTATIONS
+    )
+
+
+def keyword_overlap(keywords: Set[str], other_keywords: Set[str]) -> float:
+    """공통 키워드 수를 작은 키워드 집합 크기로 나눈 중복률을 반환합니다."""
+    if keywords and other_keywords:
+        return len(keywords & other_keywords) / min(len(keywords), len(other_keywords))
+    return 0
+
+
+def title_similarity(title: str, other_title: str) -> float:
+    """
+    제목 유사도(SequenceMatcher ratio)를 반환합니다.
+    상한값(quick_ratio)이 기준 이하이면 정확한 계산을 생략하고 상한값을 돌려줍니다.
+    """
+    matcher = SequenceMatcher(None, title.lower(), other_title.lower())
+    if matcher.real_quick_ratio() <= TITLE_SIMILARITY_THRESHOLD:
+        return matcher.real_quick_ratio()
+    if matcher.quick_ratio() <= TITLE_SIMILARITY_THRESHOLD:
+        return matcher.quick_ratio()
+    return matcher.ratio()
+
+
+class NearDuplicateIndex:
+    """
+    대표 기사 집합에 대한 근사 중복 색인.
+
+    각 대표 기사(slot)는 MinHash 밴드 버킷과 키워드 역색인에 등록됩니다.
+    새 기사가 들어오면 버킷/역색인을 공유하는 slot만 후보로 보고,
+    slot 번호가 작은 순서대로 판정하여 기존 순차 비교와 같은 결과를 냅니다.
+    """
+
+    def __init__(self):
+        self.articles: List[Dict[str, str]] = []
+        self._keywords: List[Set[str]] = []
+        self._band_buckets: Dict[Tuple[int, Tuple[int, ...]], List[int]] = {}
+        self._keyword_postings: Dict[str, List[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self.articles)
+
+    def _bands(self, signature: Tuple[int, ...]):
+        for band in range(LSH_BANDS):
+            yield band, signature[band * LSH_ROWS:(band + 1) * LSH_ROWS]
+
+    def _register(self, slot: int, signature: Tuple[int, ...], keywords: Set[str]) -> None:
+        for key in self._bands(signature):
+            self._band_buckets.setdefault(key, []).append(slot)
+        for kw in keywords:
+            self._keyword_postings.setdefault(kw, []).append(slot)
+
+    def candidates(self, signature: Tuple[int, ...], keywords: Set[str]) -> Tuple[Set[int], Set[int]]:
+        """
+        후보 대표 기사 slot을 반환합니다.
+
+        Returns:
+            (MinHash 버킷을 공유하는 slot, 키워드를 공유하는 slot)
+        """
+        band_slots = set()
+        for key in self._bands(signature):
+            band_slots.update(self._band_buckets.get(key, ()))
+        keyword_slots = set()
+        for kw in keywords:
+            keyword_slots.update(self._keyword_postings.get(kw, ()))
+        return band_slots, keyword_slots
+
+    def find_duplicate(
+        self,
+        title: str,
+        keywords: Set[str],
+        signature: Tuple[int, ...]
+    ) -> Optional[Tuple[int, float, float]]:
+        """
+        중복인 첫 번째 대표 기사의 (slot, 유사도, 키워드 중복률)을 반환합니다.
+
+        키워드 중복률은 키워드를 공유하는 slot에 대해서만, 제목 유사도는
+        MinHash 버킷을 공유하는 slot에 대해서만 계산합니다.
+        """
+        band_slots, keyword_slots = self.candidates(signature, keywords)
+        for slot in sorted(band_slots | keyword_slots):
+            overlap = keyword_overlap(keywords, self._keywords[slot]) if slot in keyword_slots else 0
+            if overlap > KEYWORD_OVERLAP_THRESHOLD:
+                return slot, 0.0, overlap
+            if slot in band_slots:
+                similarity = title_similarity(title, self.articles[slot].get('title', ''))
+                if similarity > TITLE_SIMILARITY_THRESHOLD:
+                    return slot, similarity, overlap
+        return None
+
+    def lookup(self, title: str) -> Optional[Dict[str, str]]:
+        """색인을 바꾸지 않고 제목과 중복인 대표 기사를 찾습니다."""
+        keywords = extract_keywords(title)
+        match = self.find_duplicate(title, keywords, minhash_signature(shingles(title)))
+        return self.articles[match[0]] if match else None
+
+    def insert(self, article: Dict[str, str], title: Optional[str] = None) -> None:
+        """중복 판정 없이 기사를 새 대표로 등록합니다 (title로 다른 제목 변형을 색인 가능)."""
+        title = article.get('title', '') if title is None else title
+        keywords = extract_keywords(title)
+        slot = len(self.articles)
+        self.articles.append(article)
+        self._keywords.append(keywords)
+        self._register(slot, minhash_signature(shingles(title)), keywords)
+
+    def add(self, article: Dict[str, str]) -> Tuple[bool, Optional[Dict[str, str]]]:
+        """
+        기사를 색인에 추가합니다.
+
+        Returns:
+            (중복 여부, 교체된 기존 대표 기사 또는 None)
+        """
+        title = article.get('title', '')
+        keywords = extract_keywords(title)
+        signature = minhash_signature(shingles(title))
+
+        match = self.find_duplicate(title, keywords, signature)
+        if match is None:
+            slot = len(self.articles)
+            self.articles.append(article)
+            self._keywords.append(keywords)
+            self._register(slot, signature, keywords)
+            return False, None
+
+        slot = match[0]
+        existing = self.articles[slot]
+        # 더 긴 제목(더 상세한 기사)을 선택
+        if len(title) > len(existing.get('title', '')):
+            self.articles[slot] = article
+            self._keywords[slot] = keywords
+            # 새 대표 기사의 서명도 등록 (이전 서명 항목은 판정 시 현재 대표로 다시 검증됨)
+            self._register(slot, signature, keywords)
+            return True, existing
+        return True, None
+
+
+def normalize_url(url: str) -> str:
+    """스킴·www·프래그먼트·끝 슬래시 차이를 무시하도록 URL을 정규화합니다."""
+    parsed = urlsplit(url.strip())
+    host = parsed.netloc.lower()
+    if host.startswith("www."):
+        host = host[4:]
+    path = parsed.path.rstrip("/")
+    return f"{host}{path}?{parsed.query}" if parsed.query else f"{host}{path}"
+
+
+class RecentBriefingIndex:
+    """
+    최근 N일 브리핑 기사의 지문 색인 (날짜 간 중복 방지).
+
+    - URL: 정규화된 URL 집합 → O(1) 조회
+    - 제목: 국문 제목과 해외 기사 원문 제목을 NearDuplicateIndex에 등록 → 후보만 비교
+    """
+
+    def __init__(self):
+        self._urls: Dict[str, Dict[str, str]] = {}
+        self._titles = NearDuplicateIndex()
+
+    def __len__(self) -> int:
+        return len(self._urls)
+
+    def add(self, row: Dict[str, str]) -> None:
+        """과거 브리핑 기사 한 건을 색인에 등록합니다."""
+        if row.get('url'):
+            self._urls[normalize_url(row['url'])] = row
+        for title in {row.get('title') or '', row.get('title_original') or ''}:
+            if title:
+                self._titles.insert(row, title=title)
+
+    def match(self, article: Dict[str, str]) -> Tuple[Optional[str], Optional[Dict[str, str]]]:
+        """
+        기사가 최근 브리핑과 겹치는지 확인합니다.
+
+        Returns:
+            (매칭 종류 "url"/"title" 또는 None, 매칭된 과거 기사 또는 None)
+        """
+        url = article.get('url', '')
+        if url:
+            row = self._urls.get(normalize_url(url))
+            if row is not None:
+                return "url", row
+        row = self._titles.lookup(article.get('title', ''))
+        if row is not None:
+            return "title", row
+        return None, None
+
+    @classmethod
+    def from_db(cls, db_paths: Iterable[str], since: str, until: str) -> "RecentBriefingIndex":
+        """
+        news.db(또는 월별 샤드)의 articles 테이블에서 [since, until) 구간의 기사를 읽어 색인을 만듭니다.
+
+        Args:
+            db_paths: 기사 DB 경로들 (news_store.article_db_paths)
+            since: 포함할 시작 날짜 (YYYY-MM-DD)
+            until: 제외할 끝 날짜 (YYYY-MM-DD, 보통 오늘 - 같은 날 재실행이 자기 자신과 겹치지 않도록)
+        """
+        index = cls()
+        rows = []
+        for db_path in db_paths:
+            conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+            try:
+                rows.extend(conn.execute(
+                    """SELECT date, title, title_original, url FROM articles
+                       WHERE date >= ? AND date < ? ORDER BY date DESC, id ASC""",
+                    (since, until)
+                ).fetchall())
+            finally:
+                conn.close()
+        # 샤드를 합쳐도 최신 날짜 우선 (날짜 안에서는 id 순서 유지 - 정렬은 안정적)
+        rows.sort(key=lambda row: row[0], reverse=True)
+        for date, title, title_original, url in rows:
+            index.add({"date": date, "title": title, "title_original": title_original, "url": url})
+        return index
+
+
+def lsh_dedup(articles: List[Dict[str, str]]) -> List[Dict[str, str]]:
+    """MinHash/LSH 색인으로 중복 기사를 제거합니다 (입력 순서 유지)."""
+    index = NearDuplicateIndex()
+    for article in articles:
+        index.add(article)
+    return list(index.articles)
+
+
+def pairwise_dedup(articles: List[Dict[str, str]]) -> List[Dict[str, str]]:
+    """기존 O(n²) 전수 비교 방식. 벤치마크 기준 구현으로 그대로 유지합니다."""
+    unique = []
+    keywords_cache = []
+
+    for article in articles:
+        title = article.get('title', '')
+        current_keywords = extract_keywords(title)
+        is_duplicate = False
+
+        for i, existing in enumerate(unique):
+            existing_title = existing['title']
+            similarity = SequenceMatcher(None, title.lower(), existing_title.lower()).ratio()
+            overlap = keyword_overlap(current_keywords, keywords_cache[i])
+
+            if similarity > TITLE_SIMILARITY_THRESHOLD or overlap > KEYWORD_OVERLAP_THRESHOLD:
+                is_duplicate = True
+                if len(title) > len(existing_title):
+                    unique[i] = article
+                    keywords_cache[i] = current_keywords
+                break
+
+        if not is_duplicate:
+            unique.append(article)
+            keywords_cache.append(current_keywords)
+
+    return unique
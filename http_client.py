@@ -0,0 +1,198 @@
+"""
+공유 HTTP 클라이언트
+
+네이버, Groq, OpenAI, 텔레그램 호출이 모두 하나의 requests.Session을 재사용하도록
+모듈 스코프에 세션을 둡니다. Lambda 웜 컨테이너에서는 모듈이 유지되므로
+호출 간 TCP/TLS 핸드셰이크 비용 없이 keep-alive 커넥션을 그대로 씁니다.
+
+재시도 정책:
+- 연결 실패(요청 전송 전)는 모든 메서드에 대해 지수 백오프로 재시도
+- GET 요청은 502/503/504 응답도 재시도 (Retry-After 헤더 존중)
+- POST 요청의 상태 코드 기반 재시도(429 등)는 호출부에서 처리 (LLM 호출은 rate_limit이 대기 시간 결정)
+
+오프라인 재생·녹화 (scripts/replay_server.py, scripts/bench_pipeline.py):
+- HTTP_REPLAY_URL: 설정하면 모든 요청을 {HTTP_REPLAY_URL}/{원래 호스트}{경로}로 보냄
+- HTTP_RECORD_FILE: 설정하면 모든 응답을 JSONL 픽스처로 기록 (인증 헤더·봇 토큰은 저장하지 않음)
+"""
+
+import json
+import os
+import re
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional, Tuple, Union
+from urllib.parse import parse_qsl, urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.connection import is_connection_dropped
+from urllib3.util.retry import Retry
+
+# 커넥션 풀 설정
+POOL_CONNECTIONS = int(os.environ.get("HTTP_POOL_CONNECTIONS", "8"))   # 풀을 유지할 호스트 수
+POOL_MAXSIZE = int(os.environ.get("HTTP_POOL_MAXSIZE", "10"))          # 호스트당 keep-alive 커넥션 수
+HOST_MAX_CONCURRENCY = int(os.environ.get("HTTP_HOST_MAX_CONCURRENCY", "4"))
+
+# 타임아웃 (connect, read) - read는 호출부에서 서비스별로 지정
+CONNECT_TIMEOUT = 3.05
+DEFAULT_READ_TIMEOUT = 10
+
+RETRY_POLICY = Retry(
+    total=3,
+    connect=3,
+    read=0,
+    status=2,
+    backoff_factor=0.5,
+    status_forcelist=(502, 503, 504),
+    allowed_methods=frozenset({"GET"}),
+    respect_retry_after_header=True,
+    raise_on_status=False,
+)
+
+_session: Optional[requests.Session] = None
+_last_used: Optional[float] = None   # 마지막 요청 시각 (time.monotonic, 웜 컨테이너 상태 점검용)
+_session_lock = threading.Lock()
+_host_semaphores: Dict[str, threading.BoundedSemaphore] = {}
+_host_semaphores_lock = threading.Lock()
+_record_lock = threading.Lock()
+
+# 텔레그램 봇 토큰은 URL 경로에 들어가므로 녹화·재생 시 가림
+_BOT_TOKEN_PATTERN = re.compile(r"/bot[^/]+/")
+
+
+def get_session() -> requests.Session:
+    """프로세스 전체에서 공유하는 세션을 반환합니다 (최초 호출 시 생성)."""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=POOL_CONNECTIONS,
+                    pool_maxsize=POOL_MAXSIZE,
+                    max_retries=RETRY_POLICY,
+                )
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                install_recorder(session)
+                _session = session
+    return _session
+
+
+def close_session() -> None:
+    """공유 세션을 닫습니다. 다음 호출 시 새로 생성됩니다."""
+    global _session, _last_used
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+            _session = None
+        _last_used = None
+
+
+def idle_seconds() -> Optional[float]:
+    """공유 세션이 마지막으로 쓰인 뒤 지난 시간 (세션이 없으면 None)."""
+    if _session is None or _last_used is None:
+        return None
+    return time.monotonic() - _last_used
+
+
+def session_healthy(session: requests.Session) -> bool:
+    """
+    세션을 재사용해도 되는지 점검합니다 (웜 컨테이너에서 보관한 클라이언트용).
+
+    https 어댑터가 없거나, 풀에 남은 keep-alive 커넥션 중 상대(NAT·서버)가
+    이미 끊은 것이 있으면 False를 반환합니다.
+    """
+    adapter = session.adapters.get("https://")
+    if not isinstance(adapter, HTTPAdapter):
+        return False
+    pools = adapter.poolmanager.pools
+    for pool_key in list(pools.keys()):
+        pool = pools.get(pool_key)
+        queue = getattr(pool, "pool", None)
+        if queue is None:
+            continue
+        for conn in list(queue.queue):
+            if conn is not None and getattr(conn, "sock", None) is not None and is_connection_dropped(conn):
+                return False
+    return True
+
+
+def _timeout(read_timeout: Union[float, Tuple[float, float], None]) -> Tuple[float, float]:
+    if isinstance(read_timeout, tuple):
+        return read_timeout
+    return (CONNECT_TIMEOUT, read_timeout or DEFAULT_READ_TIMEOUT)
+
+
+@contextmanager
+def host_limit(url: str) -> Iterator[None]:
+    """호스트별 동시 요청 수를 HOST_MAX_CONCURRENCY로 제한합니다."""
+    host = urlparse(url).netloc
+    with _host_semaphores_lock:
+        if host not in _host_semaphores:
+            _host_semaphores[host] = threading.BoundedSemaphore(HOST_MAX_CONCURRENCY)
+        semaphore = _host_semaphores[host]
+    with semaphore:
+        yield
+
+
+def get(url: str, timeout: Union[float, Tuple[float, float], None] = None, **kwargs) -> requests.Response:
+    """공유 세션으로 GET 요청을 보냅니다."""
+    global _last_used
+    _last_used = time.monotonic()
+    return get_session().get(resolve_url(url), timeout=_timeout(timeout), **kwargs)
+
+
+def post(url: str, timeout: Union[float, Tuple[float, float], None] = None, **kwargs) -> requests.Response:
+    """공유 세션으로 POST 요청을 보냅니다."""
+    global _last_used
+    _last_used = time.monotonic()
+    return get_session().post(resolve_url(url), timeout=_timeout(timeout), **kwargs)
+
+
+# ==========================================
+# 오프라인 재생·녹화
+# ==========================================
+def resolve_url(url: str) -> str:
+    """HTTP_REPLAY_URL이 설정되어 있으면 요청 URL을 로컬 재생 서버 주소로 바꿉니다."""
+    replay_base = os.environ.get("HTTP_REPLAY_URL")
+    if not replay_base:
+        return url
+    parsed = urlparse(url)
+    rewritten = f"{replay_base.rstrip('/')}/{parsed.netloc}{parsed.path}"
+    return f"{rewritten}?{parsed.query}" if parsed.query else rewritten
+
+
+def redact_path(path: str) -> str:
+    """URL 경로의 비밀 값(텔레그램 봇 토큰)을 가립니다."""
+    return _BOT_TOKEN_PATTERN.sub("/bot<token>/", path)
+
+
+def _record_response(res: requests.Response, *args, **kwargs) -> None:
+    record_file = os.environ.get("HTTP_RECORD_FILE")
+    if not record_file:
+        return
+    parsed = urlparse(res.request.url)
+    entry = {
+        "method": res.request.method,
+        "host": parsed.netloc,
+        "path": redact_path(parsed.path),
+        "query": dict(parse_qsl(parsed.query)),
+        "status": res.status_code,
+        "headers": {
+            k: v for k, v in res.headers.items()
+            if k.lower() in ("content-type", "retry-after") or k.lower().startswith("x-ratelimit")
+        },
+        # 스트리밍 응답도 여기서 본문을 모두 읽어 둠 (이후 iter_lines는 버퍼에서 읽음)
+        "body": res.content.decode(res.encoding or "utf-8", errors="replace"),
+    }
+    with _record_lock:
+        with open(record_file, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+
+def install_recorder(session: requests.Session) -> None:
+    """세션의 모든 응답을 HTTP_RECORD_FILE에 기록하도록 응답 훅을 겁니다 (설정된 경우에만 동작)."""
+    if _record_response not in session.hooks["response"]:
+        session.hooks["response"].append(_record_response)
@@ -5,13 +5,21 @@ Lambda 진입점. news_bot.py의 main() 함수를 호출합니다.
 """
 import logging
 import sys
+import time
+
+_IMPORT_START = time.perf_counter()
 
 # Lambda 로깅 설정
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
-# 로컬 모듈 임포트
+# 로컬 모듈 임포트 (초기화 단계에서 실행 - 무거운 의존성은 news_bot 안에서 지연 로드)
 from news_bot import main
+import state_store
+import warm_state
+
+_IMPORT_MS = (time.perf_counter() - _IMPORT_START) * 1000
+_cold_start = True
 
 def lambda_handler(event, context):
     """
@@ -24,15 +32,37 @@ def lambda_handler(event, context):
     Returns:
         dict: 실행 결과
     """
+    global _cold_start
     try:
         logger.info("=" * 50)
         logger.info("AWS Lambda 뉴스봇 실행 시작")
         logger.info(f"Request ID: {context.request_id}")
         logger.info(f"Function: {context.function_name}")
+        if _cold_start:
+            logger.info(f"콜드 스타트: 모듈 임포트 {_IMPORT_MS:.0f}ms")
+            _cold_start = False
         logger.info("=" * 50)
 
+        # 웜 컨테이너 자원 점검 (수동 트리거에서 {"reset_warm_state": true}로 강제 초기화)
+        reset = isinstance(event, dict) and bool(event.get("reset_warm_state"))
+        warm_state.begin_invocation(reset=reset)
+
+        # 상태 DB(수집 커서·LLM 캐시·요약)는 /tmp에만 있으면 콜드 스타트마다 사라지므로 S3에서 복원
+        try:
+            if state_store.restore_from_s3():
+                logger.info("상태 DB를 S3에서 복원")
+        except Exception as e:
+            logger.warning(f"상태 DB 복원 실패 (빈 상태로 실행): {e}")
+
         # 뉴스봇 실행
-        main()
+        try:
+            main()
+        finally:
+            try:
+                if state_store.persist_to_s3():
+                    logger.info("상태 DB를 S3에 저장")
+            except Exception as e:
+                logger.warning(f"상태 DB S3 저장 실패 (다음 실행은 이전 상태로 시작): {e}")
 
         logger.info("=" * 50)
         logger.info("AWS Lambda 뉴스봇 실행 완료")
@@ -45,6 +75,8 @@ def lambda_handler(event, context):
 
     except Exception as e:
         logger.error(f"Lambda 실행 중 오류: {e}", exc_info=True)
+        # 실패한 실행의 자원은 다음 호출에 넘기지 않음
+        warm_state.invalidate()
 
         return {
             'statusCode': 500,
@@ -0,0 +1,247 @@
+"""
+OpenAI 호환 Chat Completions 클라이언트 (스트리밍 + 점진적 JSON 파싱)
+
+Groq와 OpenAI 모두 OpenAI 호환 `/chat/completions` 엔드포인트를 쓰므로
+하나의 클라이언트로 처리합니다.
+
+스트리밍 모드(`stream: true`)에서는 SSE 청크를 받는 즉시 텍스트를 누적하고,
+응답이 JSON 배열이면 원소(객체)가 닫히는 순간 개별적으로 파싱합니다.
+    - 연결이 중간에 끊겨도 그때까지 완성된 원소는 남음
+    - 전체 JSON 중 한 원소가 깨져도 나머지 원소는 살릴 수 있음
+
+limiter를 넘기면 보내기 전에 제공자의 요청·토큰 잔량을 기다리고(rate_limit),
+응답의 x-ratelimit-* 헤더로 잔량을 갱신합니다. cancel 이벤트가 설정되면 보내기 전이거나
+스트리밍 중인 요청을 바로 끊습니다 (헤지 요청에서 진 쪽의 생성 비용을 줄이기 위함).
+"""
+
+import json
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+import requests
+
+import http_client
+import rate_limit
+
+
+class JSONArrayStreamParser:
+    """
+    텍스트 조각을 받아 최상위 JSON 배열의 객체 원소가 완성될 때마다 파싱합니다.
+
+    ```json 코드 블록 표시나 {"articles": [...]}처럼 객체로 감싼 배열도 처리합니다.
+    (배열 바로 아래 객체만 원소로 취급하고, 더 깊은 중첩은 원소의 일부로 봄)
+    """
+
+    def __init__(self):
+        self.items: List[Dict[str, Any]] = []
+        self.errors = 0
+        self._stack: List[str] = []
+        self._in_string = False
+        self._escape = False
+        self._buffer: List[str] = []
+        self._capturing = False
+
+    def _is_element_level(self) -> bool:
+        # 원소 객체가 열리기 직전 스택: ['['] 또는 ['{', '[']
+        return self._stack in (['['], ['{', '['])
+
+    def feed(self, chunk: str) -> List[Dict[str, Any]]:
+        """텍스트 조각을 처리하고 이번에 새로 완성된 원소를 반환합니다."""
+        completed = []
+        for ch in chunk:
+            if self._capturing:
+                self._buffer.append(ch)
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == '\\':
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+                continue
+
+            if ch == '"':
+                # 원소 밖의 문자열(감싼 객체의 키 등)도 괄호 판정에서 제외
+                if self._stack:
+                    self._in_string = True
+            elif ch in '[{':
+                if ch == '{' and not self._capturing and self._is_element_level():
+                    self._capturing = True
+                    self._buffer = ['{']
+                self._stack.append(ch)
+            elif ch in ']}':
+                if self._stack:
+                    self._stack.pop()
+                if ch == '}' and self._capturing and self._is_element_level():
+                    self._capturing = False
+                    text = ''.join(self._buffer)
+                    self._buffer = []
+                    try:
+                        item = json.loads(text)
+                        if isinstance(item, dict):
+                            self.items.append(item)
+                            completed.append(item)
+                    except json.JSONDecodeError:
+                        self.errors += 1
+        return completed
+
+
+class ChatResult:
+    """Chat Completions 호출 결과 (스트리밍/일반 공통)."""
+
+    def __init__(self):
+        self.status_code: Optional[int] = None   # None이면 응답 상태를 받기 전 연결 오류
+        self.headers: Dict[str, str] = {}
+        self.text = ""                           # 누적된 응답 텍스트
+        self.items: List[Dict[str, Any]] = []    # 점진적으로 파싱된 배열 원소
+        self.complete = False                    # 응답 끝까지 정상 수신 여부
+        self.finish_reason: Optional[str] = None
+        self.usage: Dict[str, int] = {}
+        self.error: Optional[str] = None
+        self.body = ""                           # 오류 응답 본문 (앞부분)
+        self.elapsed_ms = 0.0                    # 요청 시작부터 마지막 청크까지 걸린 시간
+        self.queued_ms = 0.0                     # 보내기 전 속도 제한으로 기다린 시간
+        self.provider: Optional[str] = None      # 응답한 제공자 (llm_providers 경유 시)
+        self.cancelled = False                   # cancel 이벤트로 중단됨
+
+    @property
+    def ok(self) -> bool:
+        return self.status_code == 200
+
+
+def _parse_sse_line(line: str) -> Optional[Dict[str, Any]]:
+    """SSE `data:` 줄을 JSON으로 변환합니다. [DONE]이면 빈 dict를 반환합니다."""
+    if not line.startswith("data:"):
+        return None
+    data = line[5:].strip()
+    if data == "[DONE]":
+        return {}
+    try:
+        return json.loads(data)
+    except json.JSONDecodeError:
+        return None
+
+
+def chat_completion(
+    url: str,
+    headers: Dict[str, str],
+    payload: Dict[str, Any],
+    timeout: float,
+    stream: bool = True,
+    parse_array: bool = False,
+    include_usage: bool = False,
+    limiter: Optional[rate_limit.RateLimiter] = None,
+    cancel: Optional[threading.Event] = None
+) -> ChatResult:
+    """
+    Chat Completions 요청을 보냅니다. 예외를 던지지 않고 결과 객체에 상태를 담습니다.
+
+    Args:
+        url: chat/completions 엔드포인트
+        headers: 인증 헤더
+        payload: 요청 본문 (stream 필드는 이 함수가 설정)
+        timeout: 읽기 타임아웃 (스트리밍에서는 청크 간 최대 대기 시간)
+        stream: SSE 스트리밍 사용 여부
+        parse_array: 응답 텍스트를 JSON 배열로 보고 원소를 점진적으로 파싱할지 여부
+        include_usage: 스트리밍 시 마지막 청크에 토큰 사용량을 요청 (OpenAI stream_options)
+        limiter: 제공자 속도 제한 스케줄러 (None이면 바로 보냄)
+        cancel: 설정되면 요청을 중단 (보내기 전이면 보내지 않고, 스트리밍 중이면 연결을 끊음)
+
+    Returns:
+        ChatResult: 상태 코드, 누적 텍스트, 파싱된 원소, 완료 여부
+    """
+    result = ChatResult()
+    parser = JSONArrayStreamParser() if parse_array else None
+    pieces: List[str] = []
+    body = dict(payload)
+    if stream:
+        body["stream"] = True
+        if include_usage:
+            body["stream_options"] = {"include_usage": True}
+    else:
+        body.pop("stream", None)
+
+    if limiter is not None:
+        result.queued_ms = limiter.acquire(rate_limit.estimate_tokens(body)) * 1000
+    if cancel is not None and cancel.is_set():
+        result.cancelled = True
+        result.error = "요청 취소됨"
+        return result
+
+    start = time.perf_counter()
+    try:
+        res = http_client.post(url, headers=headers, json=body, timeout=timeout, stream=stream)
+    except requests.exceptions.RequestException as e:
+        result.error = str(e)
+        result.elapsed_ms = (time.perf_counter() - start) * 1000
+        return result
+
+    result.status_code = res.status_code
+    result.headers = dict(res.headers)
+    if limiter is not None:
+        limiter.observe(result.headers)
+
+    try:
+        if res.status_code != 200:
+            result.body = res.text[:500]
+            return result
+
+        if not stream:
+            response_data = res.json()
+            if 'choices' in response_data and len(response_data['choices']) > 0:
+                choice = response_data['choices'][0]
+                result.text = choice['message']['content'] or ""
+                result.finish_reason = choice.get('finish_reason')
+                result.usage = response_data.get('usage') or {}
+                result.complete = True
+                if parser is not None:
+                    parser.feed(result.text)
+            else:
+                result.error = "응답 형식 오류"
+            return result
+
+        # text/event-stream에 charset이 없으면 requests가 ISO-8859-1로 디코딩하므로 줄 단위로 직접 UTF-8 디코딩
+        for raw_line in res.iter_lines():
+            if cancel is not None and cancel.is_set():
+                result.cancelled = True
+                result.error = "요청 취소됨"
+                break
+            if not raw_line:
+                continue
+            event = _parse_sse_line(raw_line.decode("utf-8", errors="replace"))
+            if event is None:
+                continue
+            if not event:  # [DONE]
+                result.complete = True
+                break
+            # 일부 제공자는 마지막 청크에 usage를 실어 보냄
+            usage = event.get('usage') or (event.get('x_groq') or {}).get('usage')
+            if usage:
+                result.usage = usage
+            for choice in event.get('choices', []):
+                delta = (choice.get('delta') or {}).get('content')
+                if delta:
+                    pieces.append(delta)
+                    if parser is not None:
+                        parser.feed(delta)
+                if choice.get('finish_reason'):
+                    result.finish_reason = choice['finish_reason']
+        result.text = ''.join(pieces)
+        if result.finish_reason and not result.complete:
+            result.complete = True
+        if not result.complete and not result.cancelled:
+            result.error = "스트림이 완료 신호 없이 종료됨"
+    except (requests.exceptions.RequestException, ValueError) as e:
+        # 스트림 도중 끊김: 지금까지 받은 텍스트·원소는 보존
+        result.error = str(e)
+        if stream:
+            result.text = ''.join(pieces)
+    finally:
+        res.close()
+        result.elapsed_ms = (time.perf_counter() - start) * 1000
+        if parser is not None:
+            result.items = list(parser.items)
+
+    return result
@@ -0,0 +1,284 @@
+"""
+선별용 LLM 제공자 계층 (OpenAI 호환 Chat Completions, 장애 전환 + 헤지 요청)
+
+Groq, OpenAI, 로컬 대역(llama.cpp 서버·재생 서버 등)은 모두 OpenAI 호환
+`/chat/completions`를 쓰므로 같은 요청 본문에서 모델만 바꿔 보낼 수 있습니다.
+complete()는 SELECTION_PROVIDERS 순서대로
+    - 첫 제공자에 요청을 보내고
+    - 그 제공자의 최근 지연 백분위(LLM_HEDGE_PERCENTILE)를 넘기도록 응답이 없으면
+      다음 제공자에 같은 요청을 하나 더 보내(헤지) 먼저 유효한 응답을 쓰고, 진 쪽은 취소하며
+    - 응답이 오류이거나 유효하지 않으면 기다리지 않고 바로 다음 제공자로 넘깁니다.
+성공 표본이 LLM_HEDGE_MIN_SAMPLES개 모이기 전에는 헤지하지 않습니다 (장애 전환만).
+배치 선별처럼 원래 오래 걸리는 호출이 기준 없이 매번 두 제공자에 과금되지 않도록 하기 위함입니다.
+최근 오류율이 높은 제공자는 순서의 뒤로 밀리고, 429·5xx 뒤 재시도 대기 중인 제공자는
+맨 뒤로 밀려 대기가 풀리기를 기다리지 않고 다음 제공자에 바로 보냅니다.
+
+제공자·호출 종류별 지연과 성공 여부는 상태 DB(state_store.llm_latency)에 남겨
+콜드 스타트에서도 백분위를 계산하고, 각 호출은 run_metrics에 "{제공자}.{종류}"로 기록됩니다.
+
+환경변수:
+    SELECTION_PROVIDERS: 선별 호출에 쓸 제공자 순서 (기본값: groq,openai - 키가 없는 제공자는 건너뜀)
+    SELECTION_OPENAI_MODEL: OpenAI로 선별할 때의 모델 (기본값: gpt-4o-mini)
+    LOCAL_LLM_URL / LOCAL_LLM_MODEL / LOCAL_LLM_API_KEY: 로컬 대역 엔드포인트·모델·키(선택)
+    LLM_HEDGE_PERCENTILE: 헤지 요청 기준 지연 백분위 (기본값: 90)
+    LLM_HEDGE_MIN_SAMPLES: 백분위를 쓰기 위한 최소 성공 표본 수 (기본값: 5)
+"""
+
+import logging
+import os
+import threading
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+import llm_client
+import rate_limit
+import run_metrics
+import state_store
+
+GROQ_URL = "https://api.groq.com/openai/v1/chat/completions"
+GROQ_MODEL = "llama-3.3-70b-versatile"
+OPENAI_URL = "https://api.openai.com/v1/chat/completions"
+
+# LLM 응답 캐시 키의 엔드포인트 자리 (응답한 제공자와 무관하게 같은 요청이면 같은 키)
+CACHE_ENDPOINT = "selection"
+
+SELECTION_PROVIDERS = [
+    name.strip() for name in os.environ.get("SELECTION_PROVIDERS", "groq,openai").split(",") if name.strip()
+]
+LLM_HEDGE_PERCENTILE = float(os.environ.get("LLM_HEDGE_PERCENTILE", "90"))
+LLM_HEDGE_MIN_SAMPLES = int(os.environ.get("LLM_HEDGE_MIN_SAMPLES", "5"))
+LLM_HEDGE_MIN_SEC = 1.0                # 백분위가 아주 작아도 이보다 빨리 헤지하지 않음
+LLM_FAILOVER_ERROR_RATE = 0.5          # 최근 오류율이 이 이상이면 순서의 뒤로
+LATENCY_WINDOW = 50                    # 제공자·종류별로 유지하는 최근 호출 수
+LATENCY_MAX_AGE_SEC = 14 * 86400
+
+logger = logging.getLogger(__name__)
+
+
+class Provider:
+    """OpenAI 호환 엔드포인트 하나와 그 지연·오류 기록."""
+
+    def __init__(self, name: str, url: str, model: str, api_key: Optional[str], key_required: bool = True):
+        self.name = name
+        self.url = url
+        self.model = model
+        self.api_key = api_key
+        self.key_required = key_required
+        self.limiter = rate_limit.limiter(name)
+        self._samples: Dict[str, Deque[Tuple[float, bool]]] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def available(self) -> bool:
+        return bool(self.url) and (bool(self.api_key) or not self.key_required)
+
+    def _window(self, kind: str) -> Deque[Tuple[float, bool]]:
+        """최근 호출 기록 (처음 쓸 때 상태 DB에서 읽음, 호출자가 _lock을 잡고 있어야 함)."""
+        if kind not in self._samples:
+            window: Deque[Tuple[float, bool]] = deque(maxlen=LATENCY_WINDOW)
+            try:
+                window.extend(state_store.load_llm_latencies(self.name, kind, LATENCY_WINDOW))
+            except Exception as e:
+                logger.warning(f"   ⚠️ [{self.name}] 지연 기록 조회 실패: {e}")
+            self._samples[kind] = window
+        return self._samples[kind]
+
+    def record(self, kind: str, elapsed_ms: float, ok: bool) -> None:
+        with self._lock:
+            self._window(kind).append((elapsed_ms, ok))
+        try:
+            state_store.record_llm_latency(self.name, kind, elapsed_ms, ok, LATENCY_MAX_AGE_SEC)
+        except Exception as e:
+            logger.warning(f"   ⚠️ [{self.name}] 지연 기록 저장 실패: {e}")
+
+    def latency_percentile(self, kind: str, percentile: float) -> Optional[float]:
+        """성공한 호출의 지연 백분위 (초, 표본이 LLM_HEDGE_MIN_SAMPLES개 미만이면 None)."""
+        with self._lock:
+            latencies = sorted(ms for ms, ok in self._window(kind) if ok)
+        if len(latencies) < LLM_HEDGE_MIN_SAMPLES:
+            return None
+        index = min(len(latencies) - 1, int(len(latencies) * percentile / 100))
+        return latencies[index] / 1000
+
+    def error_rate(self, kind: str) -> Optional[float]:
+        with self._lock:
+            window = list(self._window(kind))
+        if len(window) < LLM_HEDGE_MIN_SAMPLES:
+            return None
+        return sum(1 for _, ok in window if not ok) / len(window)
+
+    def hedge_delay(self, kind: str) -> Optional[float]:
+        """이 제공자의 응답을 기다렸다가 헤지 요청을 보낼 시간 (초, 표본이 모자라면 None - 헤지하지 않음)."""
+        delay = self.latency_percentile(kind, LLM_HEDGE_PERCENTILE)
+        return None if delay is None else max(LLM_HEDGE_MIN_SEC, delay)
+
+    def complete(
+        self,
+        payload: Dict[str, Any],
+        kind: str,
+        timeout: float,
+        stream: bool,
+        parse_array: bool,
+        cancel: Optional[threading.Event] = None,
+        **extra: Any
+    ) -> llm_client.ChatResult:
+        """
+        요청 본문의 모델만 이 제공자 것으로 바꿔 보내고 지연·결과를 기록합니다.
+        취소된 호출은 끝까지 기다린 지연이 아니므로 지연·오류 표본에 넣지 않습니다.
+        """
+        headers = {'Content-Type': 'application/json'}
+        if self.api_key:
+            headers['Authorization'] = f'Bearer {self.api_key}'
+        res = llm_client.chat_completion(
+            self.url, headers, {**payload, "model": self.model}, timeout=timeout,
+            stream=stream, parse_array=parse_array, limiter=self.limiter, cancel=cancel
+        )
+        res.provider = self.name
+        if res.cancelled:
+            run_metrics.record_count("llm.cancelled", 1, provider=self.name, kind=kind)
+            return res
+        run_metrics.record_call(
+            f"{self.name}.{kind}", res.elapsed_ms, res.status_code or "error",
+            usage=res.usage, complete=res.complete, items=len(res.items), **extra
+        )
+        self.record(kind, res.elapsed_ms, res.ok and res.complete)
+        return res
+
+
+PROVIDERS: Dict[str, Provider] = {
+    "groq": Provider("groq", GROQ_URL, GROQ_MODEL, os.environ.get("GROQ_API_KEY")),
+    "openai": Provider(
+        "openai", OPENAI_URL, os.environ.get("SELECTION_OPENAI_MODEL", "gpt-4o-mini"),
+        os.environ.get("OPENAI_API_KEY")
+    ),
+    "local": Provider(
+        "local", os.environ.get("LOCAL_LLM_URL", ""), os.environ.get("LOCAL_LLM_MODEL", "local"),
+        os.environ.get("LOCAL_LLM_API_KEY"), key_required=False
+    ),
+}
+
+
+def chain(kind: str) -> List[Provider]:
+    """
+    호출 종류별 제공자 순서 (SELECTION_PROVIDERS 중 사용 가능한 것).
+
+    최근 오류율이 높은 제공자는 뒤로, 리미터가 재시도 대기 중인 제공자는 맨 뒤로
+    (대기가 먼저 풀리는 순) 보냅니다. 모두 대기 중이면 가장 빨리 풀리는 제공자가 앞에 옵니다.
+    """
+    providers = [PROVIDERS[name] for name in SELECTION_PROVIDERS if name in PROVIDERS and PROVIDERS[name].available]
+    blocked = {p.name: p.limiter.blocked_for() for p in providers}
+    ready_now = [p for p in providers if blocked[p.name] <= 0]
+    healthy = [p for p in ready_now if (p.error_rate(kind) or 0) < LLM_FAILOVER_ERROR_RATE]
+    waiting = sorted((p for p in providers if blocked[p.name] > 0), key=lambda p: blocked[p.name])
+    if waiting:
+        logger.info(f"   ⏸️ [{kind}] 재시도 대기 중인 제공자를 뒤로: {[p.name for p in waiting]}")
+    return healthy + [p for p in ready_now if p not in healthy] + waiting
+
+
+def ready() -> bool:
+    """선별에 쓸 수 있는 제공자가 하나라도 있는지."""
+    return any(name in PROVIDERS and PROVIDERS[name].available for name in SELECTION_PROVIDERS)
+
+
+def _should_back_off(res: llm_client.ChatResult) -> bool:
+    return res.status_code is None or res.status_code == 429 or res.status_code >= 500
+
+
+def complete(
+    payload: Dict[str, Any],
+    kind: str,
+    validate: Callable[[llm_client.ChatResult], bool],
+    timeout: float,
+    stream: bool = True,
+    parse_array: bool = False,
+    attempt: int = 0,
+    **extra: Any
+) -> llm_client.ChatResult:
+    """
+    제공자 순서대로 요청하되, 느리면 헤지하고 실패하면 바로 다음 제공자로 넘깁니다.
+
+    Args:
+        payload: 요청 본문 (model은 제공자별로 바뀜)
+        kind: 호출 종류 (지연 기록·지표 이름에 쓰임, 예: "selection")
+        validate: 응답을 그대로 써도 되는지 판단 (False면 다음 제공자로)
+        timeout: 읽기 타임아웃
+        stream: SSE 스트리밍 사용 여부
+        parse_array: 응답을 JSON 배열로 점진 파싱할지 여부
+        attempt: 호출부의 재시도 번호 (반환되지 않은 실패의 백오프 계산용)
+        **extra: run_metrics 호출 기록에 덧붙일 필드
+
+    Returns:
+        ChatResult: 먼저 도착한 유효한 응답, 모두 실패하면 가장 먼저 실패한 결과
+            (provider에 응답한 제공자 이름. 재시도 대기는 호출부가 그 제공자의 limiter로 결정)
+    """
+    providers = chain(kind)
+    if not providers:
+        res = llm_client.ChatResult()
+        res.error = "사용 가능한 LLM 제공자가 없음"
+        return res
+
+    executor = ThreadPoolExecutor(max_workers=len(providers))
+    pending: Dict[Future, Provider] = {}
+    cancel = threading.Event()
+    failures: List[llm_client.ChatResult] = []
+    launched = 0
+
+    def launch(hedged: bool) -> None:
+        nonlocal launched
+        provider = providers[launched]
+        launched += 1
+        pending[executor.submit(
+            provider.complete, payload, kind, timeout, stream, parse_array, cancel,
+            attempt=attempt + 1, hedged=hedged, **extra
+        )] = provider
+
+    try:
+        launch(hedged=False)
+        while pending:
+            current = providers[launched - 1]
+            # 표본이 모자라면 hedge_after가 None이라 응답(또는 실패)까지 기다림
+            hedge_after = current.hedge_delay(kind) if launched < len(providers) else None
+            done, _ = wait(pending, timeout=hedge_after, return_when=FIRST_COMPLETED)
+            if not done:
+                backup = providers[launched]
+                logger.warning(
+                    f"   🏁 [{kind}] {current.name} 응답이 {hedge_after:.1f}초를 넘김 → {backup.name}에 같은 요청 (헤지)"
+                )
+                run_metrics.record_count("llm.hedge", 1, kind=kind, primary=current.name, backup=backup.name)
+                launch(hedged=True)
+                continue
+
+            for future in done:
+                provider = pending.pop(future)
+                try:
+                    res = future.result()
+                    valid = validate(res)
+                except Exception as e:
+                    res = llm_client.ChatResult()
+                    res.provider = provider.name
+                    res.error = str(e)
+                    valid = False
+                if valid:
+                    if launched > 1:
+                        logger.info(f"   🏁 [{kind}] {provider.name} 응답 사용 (요청 제공자 {launched}곳)")
+                    return res
+                failures.append(res)
+
+            if not pending and launched < len(providers):
+                last = failures[-1]
+                logger.warning(
+                    f"   🔀 [{kind}] {last.provider} 실패 ({last.status_code or last.error}) → {providers[launched].name}로 전환"
+                )
+                run_metrics.record_count("llm.failover", 1, kind=kind, failed=last.provider, backup=providers[launched].name)
+                launch(hedged=False)
+    finally:
+        # 진 쪽 요청은 보내기 전이면 보내지 않고, 스트리밍 중이면 다음 청크에서 연결을 끊음
+        cancel.set()
+        executor.shutdown(wait=False)
+
+    # 반환하지 않는 실패는 여기서 해당 제공자의 재시도 대기를 잡아 둠
+    for res in failures[1:]:
+        if _should_back_off(res):
+            rate_limit.limiter(res.provider).backoff(attempt, res.headers)
+    return failures[0]
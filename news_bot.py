@@ -9,27 +9,32 @@
 import os
 import json
 import html
-import sqlite3
 import requests
 import re
 import time
+import queue
 import logging
 from datetime import datetime, timedelta
 from pathlib import Path
 from zoneinfo import ZoneInfo
-from typing import List, Dict, Optional
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from difflib import SequenceMatcher
-from tavily import TavilyClient
+from typing import Callable, List, Dict, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FuturesTimeoutError
+
+import dedup
+import http_client
+import llm_client
+import llm_providers
+import prompt_codec
+import rate_limit
+import run_metrics
+import scoring
+import state_store
+import warm_state
 
 # ==========================================
 # 로깅 설정
 # ==========================================
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    datefmt='%Y-%m-%d %H:%M:%S'
-)
+# 핸들러 설정(basicConfig)은 직접 실행할 때만 (__main__) - Lambda·벤치마크는 각자 설정
 logger = logging.getLogger(__name__)
 
 # ==========================================
@@ -43,6 +48,10 @@ GROQ_API_KEY = os.environ.get("GROQ_API_KEY")
 TELEGRAM_BOT_TOKEN = os.environ.get("TELEGRAM_BOT_TOKEN")
 TELEGRAM_CHAT_ID = os.environ.get("TELEGRAM_CHAT_ID")
 
+# LLM 제공자별 속도 제한 스케줄러 (응답 헤더로 잔량을 맞추고, 재시도 대기를 스레드 간에 공유)
+# 선별 호출은 llm_providers가 제공자마다 같은 이름의 리미터를 씀
+OPENAI_LIMITER = rate_limit.limiter("openai")
+
 # 대한민국 서울 시간(KST, UTC+9) 기준 날짜
 # Lambda 웜 컨테이너 캐시 방지를 위해 main()에서 재계산
 KST = ZoneInfo("Asia/Seoul")
@@ -51,130 +60,315 @@ NOW = _kst_now
 TODAY_STR = _kst_now.strftime("%Y-%m-%d")
 YESTERDAY = (_kst_now - timedelta(days=1)).strftime("%Y-%m-%d")
 
+# 웹사이트용 SQLite DB
+NEWS_DB_PATH = Path(__file__).parent / "web" / "data" / "news.db"
+
+# 선별 방식: batch (후보 전체를 한 프롬프트로) | sharded (샤드별 동시 채점 후 병합)
+#          | tiered (로컬 점수로 확실한 기사는 직접 결정, 경합 구간만 샤드 채점)
+SELECTION_MODE = os.environ.get("SELECTION_MODE", "batch")
+# 구분(국내/해외)별로 선별 단계에 넘길 후보 상한 (샤드 방식은 프롬프트가 샤드 크기로 고정되어 더 많이 보낼 수 있음)
+CANDIDATE_LIMIT = int(os.environ.get("CANDIDATE_LIMIT", "20" if SELECTION_MODE == "batch" else "100"))
+
 
 # ==========================================
 # 국내 뉴스 검색 (네이버 API)
 # ==========================================
-def search_naver_news() -> List[Dict[str, str]]:
+NAVER_NEWS_URL = "https://openapi.naver.com/v1/search/news.json"
+NAVER_KEYWORDS = ["AI보안", "정보보호", "해킹", "개인정보유출", "금융보안", "랜섬웨어", "개인정보보호법", "KISA 사이버"]
+
+# 동시 수집 설정 (키워드 수가 늘어도 수집 시간이 선형으로 늘지 않도록)
+NAVER_MAX_CONCURRENCY = int(os.environ.get("NAVER_MAX_CONCURRENCY", "4"))  # 동시 수집 워커 수 (호스트 제한은 http_client)
+NAVER_DEADLINE_SEC = float(os.environ.get("NAVER_DEADLINE_SEC", "25"))    # 전체 수집 마감 시간
+NAVER_REQUEST_TIMEOUT = 10
+
+# 페이지 수집 설정 (start 오프셋으로 지난 성공 실행의 high-water mark까지 탐색)
+NAVER_PAGE_SIZE = int(os.environ.get("NAVER_PAGE_SIZE", "50"))  # display (API 최대 100)
+NAVER_MAX_PAGES = int(os.environ.get("NAVER_MAX_PAGES", "5"))   # 키워드당 최대 페이지 수
+NAVER_MAX_START = 1000                                           # API start 파라미터 상한
+NAVER_PUBDATE_FORMAT = "%a, %d %b %Y %H:%M:%S +0900"
+
+
+def _parse_naver_item(item: Dict[str, str]) -> Tuple[Optional[Dict[str, str]], Optional[datetime]]:
+    """
+    네이버 검색 결과 항목을 기사 dict로 변환합니다.
+
+    Returns:
+        (기사 또는 None, 발행 시각 또는 None) - 날짜 필터에서 제외되면 기사는 None
+    """
+    pub_dt = None
+    try:
+        # 날짜 파싱 및 필터링
+        pub_date_str = item.get('pubDate', '')
+        if pub_date_str:
+            pub_dt = datetime.strptime(pub_date_str, NAVER_PUBDATE_FORMAT)
+            pub_date_fmt = pub_dt.strftime("%Y-%m-%d")
+            if pub_date_fmt < YESTERDAY:
+                return None, pub_dt
+        else:
+            pub_date_fmt = TODAY_STR
+    except Exception as e:
+        logger.warning(f"날짜 파싱 실패: {e}, 기본값 사용")
+        pub_date_fmt = TODAY_STR
+
+    link = item.get('originallink') or item.get('link', '')
+    if not link:
+        return None, pub_dt
+
+    # HTML 태그 제거 및 특수문자 처리
+    clean_title = re.sub('<.+?>', '', item.get('title', ''))
+    clean_title = html.unescape(clean_title)
+
+    clean_desc = re.sub('<.+?>', '', item.get('description', ''))
+    clean_desc = html.unescape(clean_desc)
+
+    article = {
+        "category": "[국내]",
+        "title": clean_title,
+        "url": link,
+        "published_date": pub_date_fmt,
+        "description": clean_desc
+    }
+    return article, pub_dt
+
+
+def _fetch_naver_keyword(
+    keyword: str,
+    headers: Dict[str, str],
+    deadline: float,
+    high_water: Optional[str] = None
+) -> Tuple[List[Dict[str, str]], Optional[str]]:
+    """
+    키워드 하나에 대한 네이버 뉴스 검색 결과를 페이지 단위로 가져옵니다.
+
+    첫 페이지는 항상 요청하고, 이후 페이지는 페이지의 가장 오래된 기사가
+    high-water mark(지난 성공 실행에서 본 최신 발행 시각)와 어제 날짜보다
+    모두 새로울 때만 이어서 요청합니다. 따라서 기사가 많은 날에는 더 깊이,
+    조용한 날에는 한 페이지만 조회합니다.
+
+    두 번째 페이지부터 요청이 실패하거나 마감 시간에 걸리면 그때까지 받은 페이지는
+    반환하되, 탐색하지 못한 구간을 다음 실행이 다시 보도록 최신 발행 시각은 None으로 둡니다.
+
+    Args:
+        keyword: 검색 키워드
+        headers: 네이버 API 인증 헤더
+        deadline: 전체 수집 마감 시각 (time.monotonic 기준)
+        high_water: 지난 성공 실행의 최신 발행 시각 (ISO 8601, 없으면 None)
+
+    Returns:
+        (날짜 필터를 통과한 기사 리스트, 이번에 본 최신 발행 시각 ISO 문자열 - 중간에 끊겼으면 None)
+
+    Raises:
+        requests.exceptions.RequestException: 첫 페이지 요청이 실패한 경우
+    """
+    collected = []
+    newest = None
+    complete = True
+    start = 1
+    display = max(1, min(NAVER_PAGE_SIZE, 100))
+
+    for page in range(NAVER_MAX_PAGES):
+        params = {"query": keyword, "display": display, "start": start, "sort": "date"}
+
+        with http_client.host_limit(NAVER_NEWS_URL):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                logger.warning(f"네이버 수집 마감 시간 초과로 중단 (키워드: {keyword}, {page}페이지 수집)")
+                complete = False
+                break
+            timeout = min(NAVER_REQUEST_TIMEOUT, remaining)
+            call_start = time.perf_counter()
+            try:
+                res = http_client.get(NAVER_NEWS_URL, headers=headers, params=params, timeout=timeout)
+            except requests.exceptions.RequestException as e:
+                run_metrics.record_call("naver.search", (time.perf_counter() - call_start) * 1000, "error",
+                                        keyword=keyword, page=page + 1)
+                if page == 0:
+                    raise
+                logger.warning(f"네이버 API 요청 오류 (키워드: {keyword}, start: {start}): {e} → {page}페이지까지만 사용")
+                complete = False
+                break
+        run_metrics.record_call("naver.search", (time.perf_counter() - call_start) * 1000, res.status_code,
+                                keyword=keyword, page=page + 1)
+
+        if res.status_code != 200:
+            logger.warning(f"네이버 API 요청 실패 (키워드: {keyword}, start: {start}): {res.status_code}")
+            complete = False
+            break
+
+        items = res.json().get('items', [])
+        oldest = None
+        for item in items:
+            article, pub_dt = _parse_naver_item(item)
+            if pub_dt is not None:
+                pub_iso = pub_dt.isoformat()
+                if newest is None or pub_iso > newest:
+                    newest = pub_iso
+                if oldest is None or pub_iso < oldest:
+                    oldest = pub_iso
+            if article is not None:
+                collected.append(article)
+
+        # 다음 페이지 여부 판단
+        if len(items) < display:
+            break
+        if oldest is None or oldest[:10] < YESTERDAY:
+            break
+        if high_water and oldest <= high_water:
+            break
+        start += display
+        if start + display - 1 > NAVER_MAX_START:
+            break
+
+    # 끊긴 키워드는 커서를 전진시키지 않음 (받은 기사는 그대로 후보로 사용)
+    return collected, newest if complete else None
+
+
+def commit_naver_cursors(cursors: Dict[str, str]) -> None:
+    """
+    이번 실행에서 관측한 키워드별 high-water mark를 상태 DB에 저장합니다.
+
+    Args:
+        cursors: {키워드: 최신 발행 시각} (collect_candidates()가 실제로 사용한 키워드만)
+    """
+    if not cursors:
+        return
+    try:
+        state_store.save_cursors("naver", cursors)
+        logger.info(f"   📌 네이버 수집 커서 저장: {len(cursors)}개 키워드")
+    except Exception as e:
+        logger.warning(f"   ⚠️ 네이버 수집 커서 저장 실패: {e}")
+
+
+def calculate_priority_score(article: Dict[str, str]) -> int:
+    """
+    기사의 우선순위 점수를 계산합니다.
+    키워드 가중치 테이블(scoring.PRIORITY_KEYWORD_TIERS)은 미리 컴파일된 매처로 한 번에 평가합니다.
+    """
+    score = scoring.PRIORITY_SCORER.score(article['title'], article['description'])
+
+    # 날짜 가중치 (당일 기사 우대) - 2점
+    if article['published_date'] == TODAY_STR:
+        score += 2
+
+    return score
+
+
+def merge_naver_results(results_by_keyword: Dict[str, List[Dict[str, str]]]) -> List[Dict[str, str]]:
+    """
+    키워드별 수집 결과를 병합합니다 (URL 중복 제거 → 우선순위 점수순 → 상위 CANDIDATE_LIMIT개).
+
+    키워드 순서(NAVER_KEYWORDS)대로 병합하여 실행마다 결과 순서가 달라지지 않도록 합니다.
+    """
+    all_collected = {}  # 중복 제거를 위한 딕셔너리
+    for keyword in NAVER_KEYWORDS:
+        for article in results_by_keyword.get(keyword, []):
+            if article['url'] not in all_collected:
+                all_collected[article['url']] = article
+
+    final_list = list(all_collected.values())
+    logger.info(f"   👉 국내 후보 총 {len(final_list)}건 확보")
+
+    # 점수순으로 정렬하여 상위 CANDIDATE_LIMIT개만 선택
+    final_list.sort(key=calculate_priority_score, reverse=True)
+    if len(final_list) > CANDIDATE_LIMIT:
+        final_list = final_list[:CANDIDATE_LIMIT]
+        logger.info(f"   ✂️ 상위 {CANDIDATE_LIMIT}개로 압축 (우선순위 기반 선별)")
+
+    return final_list
+
+
+def search_naver_news(
+    on_keyword: Optional[Callable[[str, List[Dict[str, str]], Optional[str]], None]] = None
+) -> Tuple[List[Dict[str, str]], Dict[str, str]]:
     """
     네이버 뉴스 API를 사용하여 국내 보안 뉴스를 검색합니다.
-    
+    키워드별 요청은 공유 커넥션 풀 위에서 동시에 실행되며,
+    NAVER_DEADLINE_SEC 안에 끝나지 않은 키워드는 건너뜁니다.
+    각 키워드는 상태 DB의 high-water mark까지 페이지를 넘기며 수집합니다.
+
+    Args:
+        on_keyword: 키워드 하나가 끝날 때마다 (키워드, 기사 리스트, 최신 발행 시각)으로 호출되는 콜백
+                    (collect_candidates()가 부분 결과로 조기 종료할 때 사용)
+
     Returns:
-        List[Dict]: 수집된 뉴스 기사 리스트
+        (수집된 뉴스 기사 리스트, {키워드: 최신 발행 시각} 커서)
+        커서는 호출자가 전송 성공 후 commit_naver_cursors()로 저장합니다.
     """
-    keywords = ["AI보안", "정보보호", "해킹", "개인정보유출", "금융보안", "랜섬웨어", "개인정보보호법", "KISA 사이버"]
+    keywords = NAVER_KEYWORDS
     logger.info(f"🇰🇷 [국내] 네이버 분할 검색 시작: {keywords}")
     
     if not NAVER_ID or not NAVER_SECRET:
         logger.error("❌ 네이버 API 키가 없습니다.")
-        return []
+        return [], {}
 
-    url = "https://openapi.naver.com/v1/search/news.json"
     headers = {
         "X-Naver-Client-Id": NAVER_ID,
         "X-Naver-Client-Secret": NAVER_SECRET
     }
     
-    all_collected = {}  # 중복 제거를 위한 딕셔너리
+    try:
+        saved_cursors = state_store.load_cursors("naver")
+    except Exception as e:
+        logger.warning(f"   ⚠️ 네이버 수집 커서 로드 실패, 첫 페이지만 기준으로 수집: {e}")
+        saved_cursors = {}
 
-    for keyword in keywords:
+    deadline = time.monotonic() + NAVER_DEADLINE_SEC
+    results_by_keyword: Dict[str, List[Dict[str, str]]] = {}
+    new_cursors: Dict[str, str] = {}
+
+    # 마감 시간 초과 시 느린 요청을 기다리지 않도록 executor를 직접 종료
+    executor = ThreadPoolExecutor(max_workers=max(1, min(len(keywords), NAVER_MAX_CONCURRENCY)))
+    try:
+        futures = {
+            executor.submit(_fetch_naver_keyword, keyword, headers, deadline, saved_cursors.get(keyword)): keyword
+            for keyword in keywords
+        }
         try:
-            params = {"query": keyword, "display": 15, "sort": "date"}
-            res = requests.get(url, headers=headers, params=params, timeout=10)
-            
-            if res.status_code == 200:
-                items = res.json().get('items', [])
-                for item in items:
-                    try:
-                        # 날짜 파싱 및 필터링
-                        pub_date_str = item.get('pubDate', '')
-                        if pub_date_str:
-                            pub_dt = datetime.strptime(
-                                pub_date_str,
-                                "%a, %d %b %Y %H:%M:%S +0900"
-                            )
-                            pub_date_fmt = pub_dt.strftime("%Y-%m-%d")
-                            if pub_date_fmt < YESTERDAY:
-                                continue
-                        else:
-                            pub_date_fmt = TODAY_STR
-                    except Exception as e:
-                        logger.warning(f"날짜 파싱 실패: {e}, 기본값 사용")
-                        pub_date_fmt = TODAY_STR
-
-                    # 중복 체크
-                    link = item.get('originallink') or item.get('link', '')
-                    if not link or link in all_collected:
-                        continue
+            for future in as_completed(futures, timeout=NAVER_DEADLINE_SEC):
+                keyword = futures[future]
+                try:
+                    articles, newest = future.result()
+                except requests.exceptions.RequestException as e:
+                    logger.error(f"네이버 API 요청 오류 (키워드: {keyword}): {e}")
+                    continue
+                except Exception as e:
+                    logger.error(f"예상치 못한 오류 (키워드: {keyword}): {e}")
+                    continue
+                results_by_keyword[keyword] = articles
+                if newest:
+                    new_cursors[keyword] = newest
+                if on_keyword is not None:
+                    on_keyword(keyword, articles, newest)
+        except FuturesTimeoutError:
+            pending = [kw for f, kw in futures.items() if not f.done()]
+            logger.warning(f"⏱️ 네이버 수집 마감({NAVER_DEADLINE_SEC:.0f}초) 초과, 미완료 키워드 제외: {pending}")
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
 
-                    # HTML 태그 제거 및 특수문자 처리
-                    clean_title = re.sub('<.+?>', '', item.get('title', ''))
-                    clean_title = html.unescape(clean_title)
-
-                    clean_desc = re.sub('<.+?>', '', item.get('description', ''))
-                    clean_desc = html.unescape(clean_desc)
-
-                    all_collected[link] = {
-                        "category": "[국내]",
-                        "title": clean_title,
-                        "url": link,
-                        "published_date": pub_date_fmt,
-                        "description": clean_desc
-                    }
-            else:
-                logger.warning(f"네이버 API 요청 실패 (키워드: {keyword}): {res.status_code}")
-                
-        except requests.exceptions.RequestException as e:
-            logger.error(f"네이버 API 요청 오류 (키워드: {keyword}): {e}")
-        except Exception as e:
-            logger.error(f"예상치 못한 오류 (키워드: {keyword}): {e}")
-            
-    final_list = list(all_collected.values())
-    logger.info(f"   👉 국내 후보 총 {len(final_list)}건 확보")
-    
-    # 우선순위 점수 계산 함수
-    def calculate_priority_score(article: Dict[str, str]) -> int:
-        """기사의 우선순위 점수를 계산합니다."""
-        score = 0
-        title = article['title'].lower()
-        desc = article['description'].lower()
-        
-        # 1순위 키워드 (AI보안, 침해사고) - 10점
-        high_priority = ['ai보안', 'ai 보안', '해킹', '유출', '랜섬웨어', '사이버공격', '보안사고', '침해']
-        score += sum(10 for k in high_priority if k in title or k in desc)
-
-        # 1순위 키워드 (규제/정책/법률) - 10점
-        regulation = ['개보법', '개인정보보호법', '신정법', '신용정보법', '전자금융거래법', '전자금융감독규정',
-                      'kisa', '금보원', '금융보안원', '금감원', '금융감독원', '과기정통부', '개인정보위',
-                      '사이버특사경', '수사권', '법개정', '법 개정', '재개정', '시행령']
-        score += sum(10 for k in regulation if k in title or k in desc)
-
-        # 2순위 키워드 (기술/취약점) - 5점
-        mid_priority = ['보안기술', '제로데이', '취약점', 'cve-']
-        score += sum(5 for k in mid_priority if k in title or k in desc)
-
-        # 3순위 키워드 (금융권/신한) - 3점
-        finance = ['신한', '금융권', '금융사', '은행']
-        score += sum(3 for k in finance if k in title or k in desc)
-        
-        # 날짜 가중치 (당일 기사 우대) - 2점
-        if article['published_date'] == TODAY_STR:
-            score += 2
-        
-        return score
-    
-    # 점수순으로 정렬하여 상위 20개만 선택
-    final_list.sort(key=calculate_priority_score, reverse=True)
-    if len(final_list) > 20:
-        final_list = final_list[:20]
-        logger.info(f"   ✂️ 상위 20개로 압축 (우선순위 기반 선별)")
-        
-    return final_list
+    return merge_naver_results(results_by_keyword), new_cursors
 
 
 # ==========================================
 # 해외 뉴스 검색 (Tavily API)
 # ==========================================
+TAVILY_API_BASE = "https://api.tavily.com"
+
+
+def _create_tavily_client(api_base: str):
+    """Tavily 클라이언트를 만듭니다 (재생 모드에서는 로컬 재생 서버 주소 사용)."""
+    # tavily는 httpx·asyncio까지 끌어와 임포트가 무거우므로 수집 스레드에서 지연 로드
+    # (네이버 수집과 겹쳐 실행되어 Lambda 콜드 스타트 초기화 시간에서 빠짐)
+    from tavily import TavilyClient
+
+    if api_base != TAVILY_API_BASE:
+        tavily = TavilyClient(api_key=TAVILY_KEY, api_base_url=api_base)
+    else:
+        tavily = TavilyClient(api_key=TAVILY_KEY)
+    if hasattr(tavily, "session"):
+        http_client.install_recorder(tavily.session)
+    return tavily
+
+
 def search_tavily_news() -> List[Dict[str, str]]:
     """
     Tavily API를 사용하여 해외 보안 뉴스를 검색합니다.
@@ -189,7 +383,16 @@ def search_tavily_news() -> List[Dict[str, str]]:
         return []
         
     try:
-        tavily = TavilyClient(api_key=TAVILY_KEY)
+        # 웜 컨테이너에서는 클라이언트(와 keep-alive 커넥션)를 재사용
+        api_base = http_client.resolve_url(TAVILY_API_BASE)
+        tavily = warm_state.get(
+            "tavily_client",
+            lambda: _create_tavily_client(api_base),
+            key=(TAVILY_KEY, api_base),
+            health_check=lambda client: http_client.session_healthy(client.session) if hasattr(client, "session") else True,
+            dispose=lambda client: client.session.close() if hasattr(client, "session") else None,
+            max_idle_sec=warm_state.HTTP_SESSION_MAX_IDLE_SEC
+        )
         
         domains = [
             "thehackernews.com",
@@ -200,13 +403,20 @@ def search_tavily_news() -> List[Dict[str, str]]:
             "techcrunch.com"
         ]
         
-        res = tavily.search(
-            query="Cyber Security Breach Hacking News",
-            topic="news",
-            days=2,
-            include_domains=domains,
-            max_results=40
-        )
+        call_start = time.perf_counter()
+        try:
+            res = tavily.search(
+                query="Cyber Security Breach Hacking News",
+                topic="news",
+                days=2,
+                include_domains=domains,
+                max_results=max(40, CANDIDATE_LIMIT)
+            )
+        except Exception:
+            run_metrics.record_call("tavily.search", (time.perf_counter() - call_start) * 1000, "error")
+            raise
+        run_metrics.record_call("tavily.search", (time.perf_counter() - call_start) * 1000, 200,
+                                results=len(res.get('results', [])))
         
         collected = []
         for item in res.get('results', []):
@@ -227,8 +437,8 @@ def search_tavily_news() -> List[Dict[str, str]]:
                 "description": item.get('content', '')[:200]
             })
         
-        # 상위 20개로 제한
-        collected = collected[:20]
+        # 상위 CANDIDATE_LIMIT개로 제한
+        collected = collected[:CANDIDATE_LIMIT]
         logger.info(f"   👉 해외 후보 {len(collected)}개 확보 (필터링 완료)")
         return collected
         
@@ -254,14 +464,13 @@ def simple_rule_filter(articles: List[Dict[str, str]]) -> List[Dict[str, str]]:
         return []
     
     filtered = []
-    exclude_keywords = ['채용', '인사발령', '이벤트', '프로모션', '광고', '모집']
     
     for article in articles:
-        title = article.get('title', '').lower()
-        desc = article.get('description', '').lower()
+        title = article.get('title', '')
+        desc = article.get('description', '')
         
-        # 명백히 관련 없는 것만 제외
-        if any(kw in title or kw in desc for kw in exclude_keywords):
+        # 명백히 관련 없는 것만 제외 (scoring.EXCLUDE_KEYWORDS)
+        if scoring.EXCLUDE_MATCHER.contains_any(f"{title}\n{desc}"):
             continue
         
         filtered.append(article)
@@ -274,6 +483,7 @@ def remove_duplicate_articles(articles: List[Dict[str, str]]) -> List[Dict[str,
     """
     제목 유사도 + 핵심 키워드 기반으로 중복 기사를 제거합니다.
     같은 사건을 다룬 여러 언론사의 기사 중 하나만 선택합니다.
+    (MinHash/LSH 색인으로 후보 쌍만 비교 - dedup.py 참고)
     
     Args:
         articles: 중복 제거할 뉴스 기사 리스트
@@ -284,68 +494,15 @@ def remove_duplicate_articles(articles: List[Dict[str, str]]) -> List[Dict[str,
     if not articles:
         return []
     
-    # 보안 뉴스 공통 불용어 (중복 판단에서 제외)
-    STOPWORDS = {
-        # 보안 분야 공통어
-        '해킹', '해커', '보안', '사이버', '공격', '방어', '위협', '취약점', '악성코드',
-        '랜섬웨어', '피싱', '유출', '침해', '탈취', '감염', '차단', '대응', '예방',
-        '정보보호', '개인정보', '데이터', '시스템', '네트워크', '서버', '클라우드',
-        # 일반 용어
-        '발생', '발견', '확인', '조사', '분석', '대상', '관련', '통해', '위해',
-        '피해', '사고', '사건', '문제', '경고', '주의', '강화', '도입', '추진',
-        '기업', '기관', '업계', '국내', '해외', '글로벌', '올해', '최근',
-    }
-
-    def extract_keywords(title: str) -> set:
-        """제목에서 고유명사 위주 키워드 추출 (공통 보안 용어 제외)"""
-        words = re.findall(r'[가-힣a-zA-Z0-9]+', title)
-        # 2글자 이상 단어 중 불용어 제외
-        keywords = {w.lower() for w in words if len(w) >= 2 and w not in STOPWORDS}
-        return keywords
-    
-    unique = []
-    keywords_cache = []  # 기존 기사 키워드 캐시 (unique와 동일 인덱스)
+    index = dedup.NearDuplicateIndex()
 
     for article in articles:
-        title = article.get('title', '')
-        is_duplicate = False
-
-        # 현재 기사의 키워드 추출
-        current_keywords = extract_keywords(title)
-
-        # 기존 unique 리스트의 기사들과 비교
-        for i, existing in enumerate(unique):
-            existing_title = existing['title']
-            existing_keywords = keywords_cache[i]
-
-            # 1. 제목 유사도 체크 (60% 이상 → 중복)
-            similarity = SequenceMatcher(
-                None,
-                title.lower(),
-                existing_title.lower()
-            ).ratio()
-
-            # 2. 키워드 중복률 체크 (공통 키워드가 50% 이상 → 중복)
-            if current_keywords and existing_keywords:
-                common_keywords = current_keywords & existing_keywords
-                keyword_overlap = len(common_keywords) / min(len(current_keywords), len(existing_keywords))
-            else:
-                keyword_overlap = 0
-
-            # 유사도 60% 이상 OR 키워드 중복 50% 이상 → 중복으로 간주
-            if similarity > 0.60 or keyword_overlap > 0.50:
-                is_duplicate = True
-                # 더 긴 제목(더 상세한 기사)을 선택
-                if len(title) > len(existing_title):
-                    unique[i] = article
-                    keywords_cache[i] = current_keywords
-                    logger.debug(f"   🔄 중복 교체 (유사도:{similarity:.0%}, 키워드:{keyword_overlap:.0%})")
-                    logger.debug(f"      '{existing_title[:30]}...' → '{title[:30]}...'")
-                break
+        is_duplicate, replaced = index.add(article)
+        if replaced is not None:
+            # 더 긴 제목(더 상세한 기사)으로 교체됨
+            logger.debug(f"   🔄 중복 교체: '{replaced['title'][:30]}...' → '{article['title'][:30]}...'")
 
-        if not is_duplicate:
-            unique.append(article)
-            keywords_cache.append(current_keywords)
+    unique = list(index.articles)
     
     removed_count = len(articles) - len(unique)
     if removed_count > 0:
@@ -357,36 +514,163 @@ def remove_duplicate_articles(articles: List[Dict[str, str]]) -> List[Dict[str,
 
 
 # ==========================================
-# AI 선별 (Groq API) - 배치 처리 방식
+# 날짜 간 중복 방지 (최근 브리핑 대비)
 # ==========================================
-def call_groq_batch_selection(
-    items: List[Dict[str, str]]
+CROSS_DAY_DEDUP_MODE = os.environ.get("CROSS_DAY_DEDUP_MODE", "drop")  # drop | demote | off
+CROSS_DAY_DEDUP_DAYS = int(os.environ.get("CROSS_DAY_DEDUP_DAYS", "3"))
+
+
+def load_recent_briefing_index() -> Optional[dedup.RecentBriefingIndex]:
+    """
+    최근 CROSS_DAY_DEDUP_DAYS일(오늘 제외) 브리핑 기사의 지문 색인을 만듭니다.
+
+    Returns:
+        RecentBriefingIndex 또는 None (비활성화/DB 없음/오류)
+    """
+    if CROSS_DAY_DEDUP_MODE == "off" or CROSS_DAY_DEDUP_DAYS <= 0:
+        return None
+
+    import news_store
+
+    since = (NOW - timedelta(days=CROSS_DAY_DEDUP_DAYS)).strftime("%Y-%m-%d")
+    db_paths = news_store.article_db_paths(NEWS_DB_PATH, since, TODAY_STR)
+    if not db_paths:
+        return None
+    try:
+        # 웜 컨테이너 재실행 시 기사 DB(월별 샤드)가 그대로이고 날짜 범위가 같으면 색인 재사용
+        stats = [(str(p), p.stat().st_mtime_ns, p.stat().st_size) for p in db_paths]
+        index = warm_state.get(
+            "recent_briefing_index",
+            lambda: dedup.RecentBriefingIndex.from_db([str(p) for p in db_paths], since, TODAY_STR),
+            key=(tuple(stats), since, TODAY_STR)
+        )
+        logger.info(f"   📚 최근 {CROSS_DAY_DEDUP_DAYS}일 브리핑 기사 {len(index)}건 색인 ({since} ~ {YESTERDAY})")
+        return index
+    except Exception as e:
+        logger.warning(f"   ⚠️ 최근 브리핑 색인 로드 실패 (날짜 간 중복 확인 생략): {e}")
+        return None
+
+
+def filter_recent_duplicates(
+    articles: List[Dict[str, str]],
+    index: Optional[dedup.RecentBriefingIndex]
 ) -> List[Dict[str, str]]:
     """
-    Groq API (Llama 3.3 70B)를 사용하여 국내·해외 뉴스를 한 번에 선별합니다.
-    (API 호출 2회 → 1회로 절감)
+    최근 브리핑과 같은 기사(URL)나 같은 사건(제목 근사 중복)을 걸러냅니다.
+    CROSS_DAY_DEDUP_MODE가 "demote"이면 제거 대신 목록 맨 뒤로 보냅니다.
 
     Args:
-        items: 선별할 뉴스 기사 리스트 (국내 + 해외)
+        articles: 후보 기사 리스트 (우선순위 순)
+        index: 최근 브리핑 색인 (None이면 그대로 반환)
 
     Returns:
-        List[Dict]: 선별된 뉴스 기사 리스트
+        List[Dict]: 걸러진 후보 기사 리스트
     """
-    if not items:
-        return []
+    if not articles or index is None:
+        return articles
 
-    if not GROQ_API_KEY:
-        logger.error("❌ Groq API 키가 없습니다.")
-        return []
+    fresh = []
+    repeated = []
+    for article in articles:
+        kind, row = index.match(article)
+        if kind is None:
+            fresh.append(article)
+        else:
+            repeated.append(article)
+            logger.debug(f"   🔁 최근 브리핑과 중복({kind}, {row.get('date')}): '{article['title'][:30]}...'")
 
-    url = "https://api.groq.com/openai/v1/chat/completions"
-    headers = {
-        'Authorization': f'Bearer {GROQ_API_KEY}',
-        'Content-Type': 'application/json'
-    }
-    
-    # 시스템 프롬프트 (역할 정의)
-    system_prompt = """너는 금융권 보안 뉴스 전문 큐레이터다.
+    if repeated:
+        action = "후순위로 이동" if CROSS_DAY_DEDUP_MODE == "demote" else "제거"
+        logger.info(f"   🔁 최근 브리핑 중복 {len(repeated)}개 {action}: {len(articles)}개 → {len(fresh)}개")
+
+    if CROSS_DAY_DEDUP_MODE == "demote":
+        return fresh + repeated
+    return fresh
+
+
+# ==========================================
+# LLM 응답 캐시 (재실행·로컬 디버깅용)
+# ==========================================
+LLM_CACHE_TTL_SEC = float(os.environ.get("LLM_CACHE_TTL_HOURS", "24")) * 3600
+LLM_CACHE_BYPASS = os.environ.get("LLM_CACHE_BYPASS", "").lower() in ("1", "true", "yes")
+
+
+def _llm_cache_get(cache_key: str) -> Optional[str]:
+    """캐시 조회 (LLM_CACHE_BYPASS면 항상 미스, 오류는 미스로 처리)."""
+    if LLM_CACHE_BYPASS:
+        return None
+    try:
+        return state_store.llm_cache_get(cache_key)
+    except Exception as e:
+        logger.warning(f"   ⚠️ LLM 캐시 조회 실패: {e}")
+        return None
+
+
+def _llm_cache_put(cache_key: str, model: str, content: str) -> None:
+    """캐시 저장 (실패해도 본 흐름에 영향 없음). 바이패스 중에도 최신 응답으로 갱신합니다."""
+    if LLM_CACHE_TTL_SEC <= 0:
+        return
+    try:
+        state_store.llm_cache_put(cache_key, model, content, LLM_CACHE_TTL_SEC)
+    except Exception as e:
+        logger.warning(f"   ⚠️ LLM 캐시 저장 실패: {e}")
+
+
+# ==========================================
+# 기사별 요약 캐시 (Groq 프롬프트 축소)
+# ==========================================
+SUMMARY_CACHE_MAX_AGE_SEC = float(os.environ.get("SUMMARY_CACHE_DAYS", "7")) * 86400
+
+
+def load_known_summaries(items: List[Dict[str, str]]) -> Dict[str, Dict[str, str]]:
+    """후보 중 이미 요약·번역된 기사의 저장된 요약을 조회합니다 (오류 시 빈 dict)."""
+    try:
+        return state_store.load_article_summaries(
+            (item.get('url', '') for item in items), SUMMARY_CACHE_MAX_AGE_SEC
+        )
+    except Exception as e:
+        logger.warning(f"   ⚠️ 기사 요약 캐시 조회 실패: {e}")
+        return {}
+
+
+def save_known_summaries(articles: List[Dict[str, str]]) -> None:
+    """선별 결과의 요약·번역을 저장합니다 (실패해도 본 흐름에 영향 없음)."""
+    try:
+        state_store.save_article_summaries(articles, SUMMARY_CACHE_MAX_AGE_SEC)
+    except Exception as e:
+        logger.warning(f"   ⚠️ 기사 요약 캐시 저장 실패: {e}")
+
+
+def hydrate_known_summaries(
+    result: List[Dict[str, str]],
+    known: Dict[str, Dict[str, str]]
+) -> None:
+    """설명 없이 보낸 기사의 제목·원문 제목·요약을 저장된 값으로 채웁니다."""
+    for item in result:
+        if not isinstance(item, dict):
+            continue
+        stored = known.get(item.get('url', ''))
+        if stored is None:
+            continue
+        item.setdefault('title', stored['title'])
+        if not item.get('summary'):
+            item['summary'] = stored['summary']
+        if stored.get('title_original') and not item.get('title_original'):
+            item['title_original'] = stored['title_original']
+        item.pop('cached', None)
+
+
+# ==========================================
+# AI 선별 (Groq API) - 배치 처리 방식
+# ==========================================
+GROQ_PROMPT_TOKEN_BUDGET = int(os.environ.get("GROQ_PROMPT_TOKEN_BUDGET", "6000"))  # 입력 프롬프트 추정 토큰 상한
+LLM_STREAMING = os.environ.get("LLM_STREAMING", "true").lower() in ("1", "true", "yes")   # SSE 스트리밍 사용 여부
+SELECTION_ID_MAX_TOKENS = 256   # 선별 응답은 id 배열뿐 ([{"id": 번호}] × 10)
+SELECTION_ATTEMPTS = 3
+
+
+# 선별 시스템 프롬프트 (역할 정의·점수 기준)
+SELECTION_SYSTEM_PROMPT = """너는 금융권 보안 뉴스 전문 큐레이터다.
 각 기사에 점수를 매기고, 점수가 높은 순서로 선별한다.
 
 [점수 기준] (중복 적용 가능, 합산)
@@ -403,224 +687,866 @@ def call_groq_batch_selection(
 - 홍보성·광고성 기사: -10점 (사실상 제외)
 - 단순 인사·조직개편: -10점
 - 이미 선택한 기사와 같은 사건: 제외 (중복)"""
+
+
+def parse_json_array(content: str) -> List[Dict[str, str]]:
+    """
+    응답 텍스트에서 JSON 배열을 꺼냅니다 ({"articles": [...]}처럼 객체로 감싼 경우 포함).
+
+    Raises:
+        json.JSONDecodeError: JSON 파싱 실패 시
+    """
+    clean_text = content.replace("```json", "").replace("```", "").strip()
+
+    # JSON 파싱 (배열 또는 객체)
+    parsed = json.loads(clean_text)
+
+    # 배열이 아니라 객체로 감싸진 경우 처리
+    if isinstance(parsed, dict):
+        # 모든 키를 검사하여 배열 찾기
+        result = []
+        for key, value in parsed.items():
+            if isinstance(value, list) and len(value) > 0:
+                result = value
+                logger.info(f"   📋 JSON 키 '{key}'에서 {len(value)}개 항목 발견")
+                break
+
+        if not result:
+            logger.warning(f"   ⚠️ JSON 객체에서 배열을 찾을 수 없음")
+            logger.warning(f"   📄 응답 키: {list(parsed.keys())}")
+    else:
+        result = parsed
+
+    return result if isinstance(result, list) else []
+
+
+def finalize_selection(
+    items: List[Dict[str, str]],
+    known: Optional[Dict[str, Dict[str, str]]] = None,
+    table: Optional[prompt_codec.CandidateTable] = None
+) -> List[Dict[str, str]]:
+    """
+    파싱된 선별 원소를 기사 리스트로 정리합니다.
+    (전체 응답 파싱 결과와 스트리밍 중 점진적으로 파싱된 원소에 공통 적용)
+
+    Args:
+        items: 모델이 출력한 원소 리스트 (id 또는 url 포함)
+        known: 설명 없이 보낸 기사의 저장된 요약 (URL → 요약)
+        table: 후보 표 (응답의 id를 URL로 되돌릴 때 사용)
+
+    Returns:
+        List[Dict]: 필수 필드가 있는 기사만, URL 중복 없이 국내 → 해외 순서로 정렬
+    """
+    if table is not None:
+        table.decode(items)
+    if known:
+        hydrate_known_summaries(items, known)
+
+    # 필수 필드 검증 (이어받기로 합친 결과의 URL 중복도 제거)
+    required_fields = {'title', 'url', 'category'}
+    result = []
+    seen_urls = set()
+    for item in items:
+        if not isinstance(item, dict) or not required_fields.issubset(item.keys()):
+            continue
+        if item['url'] in seen_urls:
+            continue
+        seen_urls.add(item['url'])
+        result.append(item)
+
+    # 국내 → 해외 순서로 정렬
+    domestic = [a for a in result if '[국내]' in a.get('category', '')]
+    overseas = [a for a in result if '[해외]' in a.get('category', '')]
+    return domestic + overseas
+
+
+def build_continuation_request(
+    data: Dict,
+    partial: List[Dict[str, str]],
+    table: prompt_codec.CandidateTable
+) -> Optional[Dict]:
+    """
+    스트림이 끊겨 일부만 받은 경우, 이미 받은 기사는 제외하고 모자란 수만 다시 요청합니다.
+
+    Args:
+        data: 원래 요청 본문
+        partial: 끊기기 전까지 완성된 선별 결과
+        table: 후보 표 (URL → id 역변환용)
+
+    Returns:
+        Optional[Dict]: 이어받기 요청 본문 (더 받을 기사가 없으면 None)
+    """
+    domestic_count = sum(1 for a in partial if '[국내]' in a.get('category', ''))
+    overseas_count = sum(1 for a in partial if '[해외]' in a.get('category', ''))
+    kr_left = max(0, 7 - domestic_count)
+    en_left = max(0, 3 - overseas_count)
+    if kr_left == 0 and en_left == 0:
+        return None
+
+    url_to_id = {source.get('url'): item_id for item_id, source in table.by_id.items()}
+    done_ids = [url_to_id[a['url']] for a in partial if a.get('url') in url_to_id]
+    continuation = (
+        f"이전 응답이 중간에 끊겼다. 이미 선별된 id: {done_ids}\n"
+        f"위 후보 표에서 이 id들과 같은 사건을 제외하고 [국내] {kr_left}개, [해외] {en_left}개만 추가로 선별해라. "
+        f"출력 포맷은 동일 (JSON 배열만)."
+    )
+    return {**data, "messages": data["messages"] + [{"role": "user", "content": continuation}]}
+
+
+def call_groq_batch_selection(
+    items: List[Dict[str, str]]
+) -> List[Dict[str, str]]:
+    """
+    Groq API (Llama 3.3 70B)로 국내·해외 뉴스를 한 번에 선별하고 (출력은 선택한 id만),
+    선택된 기사만 summarize_winners()로 기사별 동시 요약합니다.
+    Groq가 느리거나 실패하면 llm_providers가 다음 제공자로 헤지·전환합니다.
+
+    Args:
+        items: 선별할 뉴스 기사 리스트 (국내 + 해외)
+
+    Returns:
+        List[Dict]: 선별된 뉴스 기사 리스트
+    """
+    if not items:
+        return []
+
+    if not llm_providers.ready():
+        logger.error("❌ 선별용 LLM API 키가 없습니다.")
+        return []
+
+    # 선별 보조 모듈은 선별 단계에서만 로드 (SELECTION_MODE별 경로가 각자 임포트)
+    import selection
+
+    # 시스템 프롬프트 (역할 정의·점수 기준 - 샤드 채점과 공유)
+    system_prompt = SELECTION_SYSTEM_PROMPT
     
-    # 사용자 프롬프트 (중복 제거 규칙 강화)
-    user_prompt = f"""아래 기사 중에서:
-- [국내] 태그 기사 중 상위 7개
-- [해외] 태그 기사 중 상위 3개
-총 10개를 선별해라.
+    # 이미 요약·번역된 기사는 설명 없이 전달 (요약은 선별 뒤 summarize_winners가 저장된 값을 씀)
+    known = load_known_summaries(items)
+    if known:
+        logger.info(f"   ♻️ 요약 캐시 적중 {len(known)}개 → 설명 생략")
+
+    # 사용자 프롬프트 (시스템 프롬프트의 점수 기준은 반복하지 않음, 출력은 id만)
+    def render_user_prompt(table_text: str) -> str:
+        return f"""아래 후보 표에서 [국내] 상위 7개, [해외] 상위 3개, 총 10개를 선별해라.
 
 ⚠️ **중복 제거 규칙 (매우 중요)**:
-1. 같은 사건/사고를 다룬 기사는 **반드시 1개만** 선택
-2. 제목이 비슷한 기사들 중 **가장 상세한 1개**만 선택
-3. 예시:
-   ✅ "SK쉴더스, 충전기 해킹 성공" (선택)
-   ❌ "SK쉴더스, 폰투온서 충전기 해킹" (위와 중복, 제외)
-   ❌ "전기차 충전기 해킹... SK쉴더스" (위와 중복, 제외)
-4. 다양한 사건을 다룬 기사를 선택 (한 사건에 5개 X)
-
-⚠️ **해외 기사 필수**:
-- [해외] 태그 기사를 **반드시 찾아서** 3개 선택
-- [해외] 기사가 3개 미만이면 있는 만큼만 포함
-- [해외] 기사가 없으면 국내 기사로만 10개 구성
-
-[입력 데이터]
-{json.dumps(items, ensure_ascii=False, indent=2)}
-
-[출력 포맷]
-JSON 배열로만 출력:
-[
-  {{
-    "category": "[국내 or 해외]",
-    "title": "제목 (해외 기사는 한글로 번역)",
-    "title_original": "원문 제목 (해외 기사만, 국내는 생략)",
-    "url": "링크",
-    "detected_date": "YYYY-MM-DD",
-    "summary": "150자 이내 3줄 요약. 기사의 핵심 사실만 간결하게 정리"
-  }}
-]
-
-⚠️ **summary 규칙**:
-- summary: 기사의 핵심 사실을 150자 이내, 3줄로 요약
-- 전략적 제언, 시사점, 대응방안 등은 쓰지 말 것
-- 기사에 나온 사실(누가, 무엇을, 어떻게)만 간결하게 정리
-
-⚠️ **해외 기사 번역 규칙**:
-- [해외] 기사의 title은 **반드시 한글로 번역**
-- title_original에 영어 원문 보관
-- 번역은 자연스럽고 이해하기 쉽게 (직역X, 의역O)
-- 국내 기사는 title_original 필드 생략"""
+- 같은 사건/사고를 다룬 기사는 **가장 상세한 1개만** 선택
+  예: "SK쉴더스, 충전기 해킹 성공" 선택 시 "전기차 충전기 해킹... SK쉴더스"는 제외
+- 다양한 사건을 다룬 기사를 선택 (한 사건에 여러 개 X)
+- 해외 기사가 3개 미만이면 있는 만큼만, 없으면 국내 기사로만 10개 구성
+
+[후보 표] (설명이 {prompt_codec.CACHED_MARK}인 기사는 이미 요약이 있음)
+{table_text}
+
+[출력 포맷] JSON 배열로만 출력 (설명·요약 없이 선택한 id만):
+[{{"id": 번호}}]"""
+
+    # 토큰 예산에 맞춰 후보 표 인코딩 (URL → 번호, 설명 축약, 필요 시 저우선순위 제외)
+    overhead = prompt_codec.estimate_tokens(system_prompt + render_user_prompt(""))
+    table = prompt_codec.encode_candidates(
+        items,
+        token_budget=GROQ_PROMPT_TOKEN_BUDGET - overhead,
+        cached_urls=set(known)
+    )
+    user_prompt = render_user_prompt(table.text)
+    prompt_tokens = overhead + table.tokens
+    logger.info(
+        f"   📏 프롬프트 추정 토큰 {prompt_tokens} / 예산 {GROQ_PROMPT_TOKEN_BUDGET} "
+        f"(후보 {len(table.by_id)}개, 설명 {table.desc_chars}자, 제외 {table.dropped}개)"
+    )
+    run_metrics.record_count("groq.prompt_tokens_estimate", prompt_tokens,
+                             candidates=len(table.by_id), dropped=table.dropped, cached_summaries=len(known))
     
-    # OpenAI API 요청
+    # OpenAI API 요청 (id 10개만 출력하므로 짧은 출력 상한)
     data = {
-        "model": "llama-3.3-70b-versatile",
+        "model": GROQ_MODEL,
         "messages": [
             {"role": "system", "content": system_prompt},
             {"role": "user", "content": user_prompt}
         ],
         "temperature": 0.1,
-        "max_tokens": 4096
+        "max_tokens": SELECTION_ID_MAX_TOKENS
     }
     
-    # 최대 3회 재시도
-    for attempt in range(3):
+    def has_selection(res: llm_client.ChatResult) -> bool:
+        """선택한 id가 하나라도 있는 응답만 사용 (없으면 다음 제공자로)."""
+        if not res.ok:
+            return False
+        if selection.pick_ids(res.items, table):
+            return True
         try:
-            res = requests.post(url, headers=headers, json=data, timeout=60)
-            
-            if res.status_code == 200:
-                response_data = res.json()
-                
-                # OpenAI 응답에서 텍스트 추출
-                if 'choices' in response_data and len(response_data['choices']) > 0:
-                    content = response_data['choices'][0]['message']['content']
-                    clean_text = content.replace("```json", "").replace("```", "").strip()
-                    
+            return bool(selection.pick_ids(parse_json_array(res.text), table))
+        except json.JSONDecodeError:
+            return False
+
+    def select_winners() -> List[Dict[str, str]]:
+        # 같은 요청(프롬프트·후보 집합)이면 어느 제공자가 답했든 캐시된 응답 재사용
+        cache_key = state_store.llm_cache_key(llm_providers.CACHE_ENDPOINT, data)
+        cached = _llm_cache_get(cache_key)
+        if cached is not None:
+            try:
+                winners = selection.pick_ids(parse_json_array(cached), table)
+                if winners:
+                    logger.info(f"   ♻️ LLM 캐시 적중: {len(winners)}개 선별 결과 재사용")
+                    run_metrics.record_count("llm_cache.hit", 1, endpoint="groq")
+                    return winners
+            except json.JSONDecodeError:
+                pass
+
+        # 최대 3회 재시도 (스트림이 끊기면 완성된 원소는 보존하고 나머지만 재요청)
+        partial: List[Dict[str, str]] = []
+        for attempt in range(SELECTION_ATTEMPTS):
+            last = attempt == SELECTION_ATTEMPTS - 1
+            try:
+                request_data = data
+                if partial:
+                    request_data = build_continuation_request(data, partial, table) or data
+                res = llm_providers.complete(
+                    request_data, "selection", has_selection, timeout=60,
+                    stream=LLM_STREAMING, parse_array=True, attempt=attempt,
+                    continuation=request_data is not data
+                )
+
+                if res.ok:
                     try:
-                        # JSON 파싱 (배열 또는 객체)
-                        parsed = json.loads(clean_text)
-
-                        # 배열이 아니라 객체로 감싸진 경우 처리
-                        if isinstance(parsed, dict):
-                            # 모든 키를 검사하여 배열 찾기
-                            result = []
-                            for key, value in parsed.items():
-                                if isinstance(value, list) and len(value) > 0:
-                                    result = value
-                                    logger.info(f"   📋 JSON 키 '{key}'에서 {len(value)}개 항목 발견")
-                                    break
-
-                            if not result:
-                                logger.warning(f"   ⚠️ JSON 객체에서 배열을 찾을 수 없음")
-                                logger.warning(f"   📄 응답 키: {list(parsed.keys())}")
-                        else:
-                            result = parsed
-                        
-                        # 필수 필드 검증
-                        required_fields = {'title', 'url', 'category'}
-                        result = [
-                            item for item in result
-                            if isinstance(item, dict) and required_fields.issubset(item.keys())
-                        ]
-
-                        if result:
-                            # 국내 → 해외 순서로 정렬
-                            domestic = [a for a in result if '[국내]' in a.get('category', '')]
-                            overseas = [a for a in result if '[해외]' in a.get('category', '')]
-                            result = domestic + overseas
-
-                            overseas_count = len(overseas)
-                            domestic_count = len(domestic)
-
-                            # 국내 기사 부족 시 재시도 (Groq 모델 불안정 대응)
-                            if domestic_count < 5 and attempt < 2:
-                                logger.warning(f"   ⚠️ 국내 기사 {domestic_count}개만 선별됨 (목표: 7개). 재시도...")
-                                time.sleep(3)
-                                continue
-
-                            # 해외 기사 부족 시 경고
-                            if overseas_count == 0:
-                                logger.warning("   ⚠️ 해외 기사가 선별되지 않았습니다.")
-                            elif overseas_count < 3:
-                                logger.warning(f"   ⚠️ 해외 기사 {overseas_count}개만 선별됨 (목표: 3개)")
-
-                            logger.info(f"   ✅ AI 배치 선별 완료 (Groq): {len(result)}개 (국내 {domestic_count}, 해외 {overseas_count})")
-                            return result
-                        else:
-                            logger.warning(f"   ⚠️ 선별된 기사가 없음")
+                        winners = selection.pick_ids(parse_json_array(res.text), table)
                     except json.JSONDecodeError as e:
-                        logger.warning(f"   ⚠️ JSON 파싱 실패: {e}")
-                        logger.debug(f"   응답 내용: {clean_text[:200]}")
-                        if attempt < 2:
+                        # 전체 JSON이 깨져도 스트리밍 중 완성된 원소는 사용
+                        winners = selection.pick_ids(res.items, table)
+                        if res.complete:
+                            logger.warning(f"   ⚠️ JSON 파싱 실패: {e} → 완성된 원소 {len(winners)}개 사용")
+                            logger.debug(f"   응답 내용: {res.text[:200]}")
+
+                    if partial:
+                        winners = selection.take_quotas(partial + [w for w in winners if w not in partial])
+
+                    # 연결 끊김 또는 출력 길이 초과: 받은 만큼 보존 후 나머지만 재요청
+                    if (not res.complete or res.finish_reason == 'length') and not last:
+                        partial = winners
+                        if not partial or build_continuation_request(data, partial, table) is not None:
+                            logger.warning(
+                                f"   ⚠️ [스트림 중단] {res.error or res.finish_reason}. "
+                                f"완성된 {len(partial)}개 보존, 나머지만 재요청 ({attempt+1}/{SELECTION_ATTEMPTS})..."
+                            )
+                            continue
+
+                    if winners:
+                        domestic_count = sum(1 for a in winners if not selection.is_overseas(a))
+                        # 국내 기사 부족 시 재시도 (Groq 모델 불안정 대응)
+                        if domestic_count < 5 and not last:
+                            logger.warning(f"   ⚠️ 국내 기사 {domestic_count}개만 선별됨 (목표: 7개). 재시도...")
+                            partial = []
                             continue
-                        return []
+                        # 끝까지 받은 응답만 캐시 (이어받기로 합친 결과는 id 배열로 저장)
+                        if res.complete:
+                            url_to_id = {source.get('url'): i for i, source in table.by_id.items()}
+                            _llm_cache_put(cache_key, data["model"], json.dumps(
+                                [{"id": url_to_id[w['url']]} for w in winners if w.get('url') in url_to_id]
+                            ))
+                        logger.info(f"   🎯 선별 완료 ({res.provider}): {len(winners)}개")
+                        return winners
+
+                    logger.warning(f"   ⚠️ 선별된 기사가 없음")
+                    if not last:
+                        continue
+                    return []
+
+                # 마지막 시도의 실패는 백오프하지 않음 (다음 호출을 불필요하게 막지 않도록)
+                elif res.status_code == 429:
+                    if last:
+                        logger.warning("   ⏳ [API 과부하] 재시도 횟수 소진")
+                        break
+                    wait_time = selection_backoff(res, attempt)
+                    logger.warning(f"   ⏳ [API 과부하] {wait_time:.1f}초 대기 후 재시도...")
+                    continue
+                elif res.status_code is None:
+                    if last:
+                        logger.warning(f"   ⚠️ [연결 불안정] {res.error}")
+                        break
+                    wait_time = selection_backoff(res, attempt)
+                    logger.warning(f"   ⚠️ [연결 불안정] {res.error}. {wait_time:.1f}초 후 재시도 ({attempt+1}/{SELECTION_ATTEMPTS})...")
+                    continue
                 else:
-                    logger.warning(f"   ⚠️ 응답 형식 오류")
+                    logger.error(f"   ❌ API 오류: {res.status_code} - {res.body[:200]}")
+                    if res.status_code >= 500 and not last:
+                        selection_backoff(res, attempt)
+                        continue
                     return []
-                    
-            elif res.status_code == 429:
-                wait_time = (attempt + 1) * 10
-                logger.warning(f"   ⏳ [API 과부하] {wait_time}초 대기 후 재시도...")
-                time.sleep(wait_time)
-                continue
-            else:
-                logger.error(f"   ❌ API 오류: {res.status_code} - {res.text[:200]}")
-                if res.status_code >= 500:
-                    time.sleep(10)
+
+            except Exception as e:
+                logger.error(f"   ❌ 예상치 못한 오류: {e}")
+                if not last:
+                    llm_providers.chain("selection")[0].limiter.backoff(attempt)
                     continue
                 return []
-                
-        except requests.exceptions.RequestException as e:
-            logger.warning(f"   ⚠️ [연결 불안정] {e}. 10초 후 재시도 ({attempt+1}/3)...")
-            time.sleep(10)
-            continue
-        except Exception as e:
-            logger.error(f"   ❌ 예상치 못한 오류: {e}")
-            if attempt < 2:
-                time.sleep(10)
-                continue
-            return []
-            
-    logger.error(f"   ❌ 3회 재시도 실패")
-    return []
+
+        logger.error(f"   ❌ {SELECTION_ATTEMPTS}회 재시도 실패")
+        return []
+
+    winners = select_winners()
+    if not winners:
+        return []
+
+    # 선택된 기사만 기사별로 동시에 요약·번역
+    result = summarize_winners(winners)
+    domestic_count = sum(1 for a in result if '[국내]' in a.get('category', ''))
+    overseas_count = len(result) - domestic_count
+    if overseas_count == 0:
+        logger.warning("   ⚠️ 해외 기사가 선별되지 않았습니다.")
+    elif overseas_count < 3:
+        logger.warning(f"   ⚠️ 해외 기사 {overseas_count}개만 선별됨 (목표: 3개)")
+    logger.info(f"   ✅ AI 배치 선별 완료: {len(result)}개 (국내 {domestic_count}, 해외 {overseas_count})")
+    return result
+
+
+# ==========================================
+# AI 선별 (Groq API) - 샤드 방식 (map-reduce)
+# ==========================================
+SELECTION_SHARD_SIZE = int(os.environ.get("SELECTION_SHARD_SIZE", "25"))          # 샤드당 후보 수
+SELECTION_MAX_CONCURRENCY = int(os.environ.get("SELECTION_MAX_CONCURRENCY", "4"))  # 동시 채점 호출 수
+SELECTION_MIN_SCORE = float(os.environ.get("SELECTION_MIN_SCORE", "0"))           # 이 점수 미만(감점 기사)은 제외
+GROQ_MODEL = llm_providers.GROQ_MODEL
+
+
+def selection_backoff(res: llm_client.ChatResult, attempt: int) -> float:
+    """실패한 선별 호출을 응답한 제공자의 리미터로 백오프하고 재시도까지 남은 초를 반환합니다."""
+    return rate_limit.limiter(res.provider or "groq").backoff(attempt, res.headers)
+
+
+def call_groq_json_array(data: Dict, metric: str, attempts: int = 2) -> Optional[List[Dict]]:
+    """
+    선별 제공자(기본 Groq)에 JSON 배열 응답을 요청합니다 (샤드 채점·요약 같은 짧은 호출용).
+    같은 요청이면 캐시된 응답을 쓰고, 느리거나 실패하면 다음 제공자로 헤지·전환하며,
+    모든 제공자가 429·5xx·연결 오류면 재시도합니다.
+
+    Args:
+        data: 요청 본문
+        metric: 호출 종류 (run_metrics에는 "{제공자}.{종류}"로 기록, 예: "shard")
+        attempts: 최대 시도 횟수
+
+    Returns:
+        Optional[List[Dict]]: 파싱된 배열 원소 (실패 시 None)
+    """
+    cache_key = state_store.llm_cache_key(llm_providers.CACHE_ENDPOINT, data)
+    cached = _llm_cache_get(cache_key)
+    if cached is not None:
+        try:
+            items = parse_json_array(cached)
+            run_metrics.record_count("llm_cache.hit", 1, endpoint=metric)
+            return items
+        except json.JSONDecodeError:
+            pass
+
+    def has_array(res: llm_client.ChatResult) -> bool:
+        if not res.ok:
+            return False
+        if res.items:
+            return True
+        try:
+            return bool(parse_json_array(res.text))
+        except json.JSONDecodeError:
+            return False
+
+    for attempt in range(attempts):
+        res = llm_providers.complete(
+            data, metric, has_array, timeout=60,
+            stream=LLM_STREAMING, parse_array=True, attempt=attempt
+        )
+        last = attempt == attempts - 1
+        if res.ok:
+            try:
+                items = parse_json_array(res.text)
+            except json.JSONDecodeError:
+                # 깨진 응답이라도 스트리밍 중 완성된 원소는 사용
+                items = list(res.items)
+            else:
+                if res.complete:
+                    _llm_cache_put(cache_key, data["model"], res.text)
+            if items or last:
+                return items
+            logger.warning(f"   ⚠️ [{metric}] 빈 응답, 재시도 ({attempt+1}/{attempts})...")
+        elif res.status_code == 429 or res.status_code is None or res.status_code >= 500:
+            # 마지막 시도의 실패는 백오프하지 않음 (다음 호출을 불필요하게 막지 않도록)
+            if last:
+                return None
+            wait_time = selection_backoff(res, attempt)
+            if res.status_code == 429:
+                logger.warning(f"   ⏳ [{metric}] API 과부하, {wait_time:.1f}초 대기 후 재시도...")
+            else:
+                logger.warning(f"   ⚠️ [{metric}] {res.error or res.status_code}. {wait_time:.1f}초 후 재시도 ({attempt+1}/{attempts})...")
+        else:
+            logger.error(f"   ❌ [{metric}] API 오류: {res.status_code} - {res.body[:200]}")
+            return None
+    return None
+
+
+def score_shard(shard: List[Dict[str, str]]) -> Optional[Dict[str, float]]:
+    """
+    샤드 하나를 선별 기준으로 채점합니다 (기사당 숫자 하나만 출력하는 짧은 호출).
+
+    Returns:
+        Optional[Dict[str, float]]: URL → 점수 (호출 실패 시 None)
+    """
+    import selection
+
+    table = prompt_codec.encode_candidates(
+        shard,
+        token_budget=GROQ_PROMPT_TOKEN_BUDGET,
+        min_per_category=(len(shard), len(shard))
+    )
+    user_prompt = f"""아래 후보 표의 모든 기사에 [점수 기준]대로 점수를 매겨라.
+- 같은 사건을 다룬 기사가 여러 개면 가장 상세한 1개에만 점수를 주고 나머지는 -10점
+
+[후보 표]
+{table.text}
+
+[출력 포맷] JSON 배열로만 출력 (설명 없이 점수만):
+[{{"id": 번호, "s": 점수}}]"""
+    data = {
+        "model": GROQ_MODEL,
+        "messages": [
+            {"role": "system", "content": SELECTION_SYSTEM_PROMPT},
+            {"role": "user", "content": user_prompt}
+        ],
+        "temperature": 0.1,
+        "max_tokens": 32 + 16 * len(shard)
+    }
+    items = call_groq_json_array(data, "shard")
+    if items is None:
+        return None
+    return selection.parse_scores(items, table)
+
+
+def score_candidates(items: List[Dict[str, str]]) -> Dict[str, float]:
+    """
+    후보를 샤드로 나눠 SELECTION_MAX_CONCURRENCY개씩 동시에 채점합니다.
+    실패한 샤드의 기사는 결과에 없습니다 (모두 실패하면 빈 dict).
+
+    Returns:
+        Dict[str, float]: URL → LLM 점수
+    """
+    import selection
+
+    shards = selection.split_shards(items, SELECTION_SHARD_SIZE)
+    if not shards:
+        return {}
+    logger.info(f"   🧩 후보 {len(items)}개 → 샤드 {len(shards)}개 (샤드당 최대 {SELECTION_SHARD_SIZE}개) 동시 채점")
+
+    scores: Dict[str, float] = {}
+    failed = 0
+    with ThreadPoolExecutor(max_workers=max(1, min(len(shards), SELECTION_MAX_CONCURRENCY))) as executor:
+        futures = [executor.submit(score_shard, shard) for shard in shards]
+        for future in futures:
+            try:
+                shard_scores = future.result()
+            except Exception as e:
+                logger.error(f"   ❌ 샤드 채점 오류: {e}")
+                shard_scores = None
+            if shard_scores is None:
+                failed += 1
+            else:
+                scores.update(shard_scores)
+    run_metrics.record_count("selection.shards", len(shards), failed=failed, scored=len(scores))
+
+    if not scores:
+        logger.error(f"   ❌ 모든 샤드 채점 실패 ({failed}/{len(shards)})")
+    elif failed:
+        logger.warning(f"   ⚠️ 샤드 {failed}/{len(shards)}개 채점 실패 → 해당 기사는 로컬 우선순위로 후순위 배치")
+    return scores
+
+
+def local_summary_item(article: Dict[str, str]) -> Dict[str, str]:
+    """LLM 요약 없이 수집 정보만으로 만든 선별 결과 항목 (로컬 fallback과 같은 형태)."""
+    return {
+        "category": article.get('category', '[국내]'),
+        "title": article['title'],
+        "url": article['url'],
+        "detected_date": article.get('published_date', TODAY_STR),
+        "summary": article.get('description', '')[:150]
+    }
+
+
+# 기사별 요약 시스템 프롬프트 (선별 점수 기준 없이 요약만 - 동시 호출마다 반복되므로 짧게)
+SUMMARY_SYSTEM_PROMPT = """너는 금융권 보안 뉴스 편집자다.
+주어진 기사의 제목을 다듬고(해외 기사는 자연스러운 한글로 의역) 사실만 담은 요약을 쓴다."""
+SUMMARY_MAX_CONCURRENCY = int(os.environ.get("SUMMARY_MAX_CONCURRENCY", "4"))  # 동시 요약 호출 수
+SUMMARY_ATTEMPTS = int(os.environ.get("SUMMARY_ATTEMPTS", "3"))                # 기사별 최대 시도 횟수
+
+
+def summarize_one(winner: Dict[str, str]) -> Optional[Dict[str, str]]:
+    """
+    기사 하나의 제목(해외는 한글 의역)과 요약을 작성합니다.
+    기사마다 요청이 따로라 실패하면 이 기사만 재시도하고, 캐시도 기사 단위로 적중합니다.
+
+    Returns:
+        Optional[Dict]: 선별 결과 항목 (실패 시 None)
+    """
+    table = prompt_codec.encode_candidates(
+        [winner],
+        token_budget=GROQ_PROMPT_TOKEN_BUDGET,
+        min_per_category=(1, 1)
+    )
+    user_prompt = f"""아래 후보 표의 기사에 대해 제목과 요약을 작성해라 (선별 없이).
+
+[후보 표]
+{table.text}
+
+[출력 포맷] JSON 배열로만 출력:
+[{{"id": 번호, "title": "제목 (해외 기사는 자연스러운 한글 의역)", "summary": "150자 이내 3줄 요약"}}]
+- summary: 기사에 나온 사실(누가, 무엇을, 어떻게)만 간결하게. 전략적 제언·시사점·대응방안 금지"""
+    data = {
+        "model": GROQ_MODEL,
+        "messages": [
+            {"role": "system", "content": SUMMARY_SYSTEM_PROMPT},
+            {"role": "user", "content": user_prompt}
+        ],
+        "temperature": 0.1,
+        "max_tokens": 320
+    }
+    items = call_groq_json_array(data, "summary", attempts=SUMMARY_ATTEMPTS) or []
+    result = finalize_selection(items, table=table)
+    return result[0] if result else None
+
+
+def summarize_winners(winners: List[Dict[str, str]]) -> List[Dict[str, str]]:
+    """
+    선택된 기사에만 요약·해외 제목 번역을 작성합니다.
+    기사별 요청을 SUMMARY_MAX_CONCURRENCY개씩 동시에 보내므로 전체 시간은 가장 느린 요약 하나 수준이고,
+    이미 요약이 저장된 기사는 호출하지 않으며, 요약에 실패한 기사는 수집된 설명으로 채웁니다.
+
+    Args:
+        winners: 선택된 후보 원본 (국내 → 해외)
+
+    Returns:
+        List[Dict]: 선별 결과 기사 리스트 (국내 → 해외)
+    """
+    known = load_known_summaries(winners)
+    need = [w for w in winners if w.get('url') not in known]
+    by_url: Dict[str, Dict[str, str]] = {}
+
+    if need:
+        logger.info(f"   📝 선택 기사 {len(need)}개 요약 (동시 {min(len(need), SUMMARY_MAX_CONCURRENCY)}개, 저장된 요약 {len(winners) - len(need)}개)")
+        with ThreadPoolExecutor(max_workers=max(1, min(len(need), SUMMARY_MAX_CONCURRENCY))) as executor:
+            futures = {executor.submit(summarize_one, w): w for w in need}
+            for future, winner in futures.items():
+                try:
+                    item = future.result()
+                except Exception as e:
+                    logger.error(f"   ❌ 요약 오류: {e}")
+                    item = None
+                # 모델이 다른 id를 돌려준 경우를 막기 위해 요청한 기사와 URL이 같을 때만 사용
+                if item is not None and item['url'] == winner.get('url'):
+                    by_url[item['url']] = item
+        failed = len(need) - len(by_url)
+        run_metrics.record_count("selection.summaries", len(need), failed=failed, cached=len(winners) - len(need))
+        if failed:
+            logger.warning(f"   ⚠️ 요약 {failed}/{len(need)}개 실패 → 수집된 설명으로 대체")
+
+    results = []
+    for winner in winners:
+        url = winner.get('url')
+        if url in by_url:
+            results.append(by_url[url])
+        elif url in known:
+            item = {
+                "category": winner.get('category', ''),
+                "url": url,
+                "detected_date": winner.get('published_date', ''),
+            }
+            hydrate_known_summaries([item], known)
+            results.append(item)
+        else:
+            results.append(local_summary_item(winner))
+    save_known_summaries([r for r in results if r.get('url') in by_url])
+    return finalize_selection(results)
+
+
+def call_groq_sharded_selection(items: List[Dict[str, str]]) -> List[Dict[str, str]]:
+    """
+    후보를 샤드로 나눠 동시에 채점한 뒤, 점수로 국내 7개 + 해외 3개를 고르고 그 기사만 요약합니다.
+    일부 샤드가 실패해도 나머지 점수로 선별하며, 모든 샤드가 실패하면 빈 리스트를 반환합니다
+    (process_news가 로컬 fallback 적용).
+
+    Args:
+        items: 선별할 뉴스 기사 리스트 (국내 + 해외, 구분별로 우선순위 순서)
+
+    Returns:
+        List[Dict]: 선별된 뉴스 기사 리스트
+    """
+    if not items:
+        return []
+
+    if not llm_providers.ready():
+        logger.error("❌ 선별용 LLM API 키가 없습니다.")
+        return []
+
+    import selection
+
+    scores = score_candidates(items)
+    if not scores:
+        return []
+
+    winners = selection.merge_scored(items, scores, min_score=SELECTION_MIN_SCORE)
+    result = summarize_winners(winners)
+    domestic_count = sum(1 for a in result if '[국내]' in a.get('category', ''))
+    logger.info(
+        f"   ✅ AI 샤드 선별 완료: {len(result)}개 "
+        f"(국내 {domestic_count}, 해외 {len(result) - domestic_count}, 채점 {len(scores)}/{len(items)})"
+    )
+    return result
+
+
+# ==========================================
+# AI 선별 - 2단계 방식 (로컬 점수로 확실한 기사는 직접 결정, 경합 구간만 LLM)
+# ==========================================
+SELECTION_TIER_ACCEPT = float(os.environ.get("SELECTION_TIER_ACCEPT", "25"))  # 로컬 점수 이상이면 LLM 없이 선택
+SELECTION_TIER_REJECT = float(os.environ.get("SELECTION_TIER_REJECT", "5"))   # 로컬 점수 미만이면 LLM 없이 제외
+SELECTION_TIER_AUDIT = int(os.environ.get("SELECTION_TIER_AUDIT", "4"))       # 합의도 측정용으로 함께 채점할 경계 기사 수
+SELECTION_TIER_KEEP = float(os.environ.get("SELECTION_TIER_KEEP", "5"))       # LLM 점수가 이 이상이면 "선택할 만함"으로 봄
+
+
+def call_groq_tiered_selection(items: List[Dict[str, str]]) -> List[Dict[str, str]]:
+    """
+    국내 후보를 로컬 우선순위 점수로 확정 선택 / 경합 / 확정 제외로 나누고,
+    경합 구간(과 해외 후보, 경계 감사 표본)만 샤드 채점으로 보냅니다.
+    Groq가 느리거나 실패해도 확정 선택과 경합 기사의 로컬 순서로 선별을 마칩니다.
+
+    Args:
+        items: 선별할 뉴스 기사 리스트 (국내 + 해외, 구분별로 우선순위 순서)
+
+    Returns:
+        List[Dict]: 선별된 뉴스 기사 리스트
+    """
+    if not items:
+        return []
+
+    import selection
+
+    local_scores = {
+        a['url']: calculate_priority_score(a) for a in items if not selection.is_overseas(a)
+    }
+    accepted, contested, rejected = selection.split_tiers(
+        items, local_scores, SELECTION_TIER_ACCEPT, SELECTION_TIER_REJECT
+    )
+    audit = selection.pick_audit(accepted, rejected, SELECTION_TIER_AUDIT)
+    logger.info(
+        f"   🎚️ 로컬 점수 구간: 확정 선택 {len(accepted)} / 경합 {len(contested)} / 확정 제외 {len(rejected)} "
+        f"(기준 ≥{SELECTION_TIER_ACCEPT:g} / <{SELECTION_TIER_REJECT:g}, 감사 표본 {len(audit)})"
+    )
+
+    scores: Dict[str, float] = {}
+    if llm_providers.ready():
+        # 감사 표본은 경합 기사와 같은 샤드에서 채점되도록 원래 우선순위 순서로 합침
+        to_score = {a['url'] for a in contested + audit}
+        scores = score_candidates([a for a in items if a['url'] in to_score])
+    else:
+        logger.error("❌ 선별용 LLM API 키가 없습니다. 경합 기사는 로컬 순서로 선별")
+
+    report = selection.tier_agreement(accepted, rejected, local_scores, scores, SELECTION_TIER_KEEP)
+    run_metrics.record_count(
+        "selection.tiers", len(contested),
+        accepted=len(accepted), rejected=len(rejected), scored=len(scores), **report
+    )
+    if report["audited"]:
+        correlation = report["correlation"]
+        logger.info(
+            f"   🤝 로컬·LLM 합의: 감사 {report['audited']}개 중 {report['agreed']}개 일치"
+            f" ({report['agreement']:.0%}), 점수 순위 상관 "
+            + (f"{correlation:.2f}" if correlation is not None else "-")
+        )
+
+    winners = selection.merge_tiered(accepted, contested, scores, min_score=SELECTION_MIN_SCORE)
+    result = summarize_winners(winners) if llm_providers.ready() else [local_summary_item(w) for w in winners]
+    decided = {a['url'] for a in accepted}
+    logger.info(
+        f"   ✅ AI 2단계 선별 완료: {len(result)}개 "
+        f"(로컬 확정 {sum(1 for w in winners if w['url'] in decided)}, LLM 채점 {len(scores)}/{len(items)})"
+    )
+    return result
+
+
+# ==========================================
+# 수집 → 선별 파이프라인
+# ==========================================
+PIPELINE_DEADLINE_SEC = float(os.environ.get("PIPELINE_DEADLINE_SEC", "40"))  # 수집 단계 마감 (네이버 마감 + 요청 타임아웃보다 길게)
+# 해외 수집이 끝났고 국내 부분 결과가 이만큼 모이면 남은 네이버 키워드를 기다리지 않음 (0이면 끝까지 대기)
+NAVER_SUFFICIENT_CANDIDATES = int(os.environ.get("NAVER_SUFFICIENT_CANDIDATES", "0"))
+
+
+def prepare_candidates(
+    label: str,
+    candidates: List[Dict[str, str]],
+    recent_index: Optional[dedup.RecentBriefingIndex]
+) -> List[Dict[str, str]]:
+    """
+    한쪽(국내 또는 해외) 후보에 로컬 필터링 → 중복 제거 → 최근 브리핑 중복 제외를 적용합니다.
+
+    Args:
+        label: 로그용 구분 이름 ("국내"/"해외")
+        candidates: 수집된 후보 기사 리스트 (우선순위 순)
+        recent_index: 최근 브리핑 색인 (None이면 날짜 간 중복 확인 생략)
+
+    Returns:
+        List[Dict]: 선별 후보 기사 리스트
+    """
+    run_metrics.record_count("candidates.collected", len(candidates), side=label)
+    if not candidates:
+        logger.warning(f"   ⚠️ {label} 후보 기사가 없습니다.")
+        return []
+
+    logger.info(f"\n🔍 [2단계] {label} 로컬 필터링 및 중복 제거 중...")
+    with run_metrics.span("filter", side=label) as m:
+        filtered = simple_rule_filter(candidates)
+        m["output"] = len(filtered)
+    with run_metrics.span("dedup", side=label) as m:
+        unique = remove_duplicate_articles(filtered) if filtered else []
+        m["output"] = len(unique)
+
+    # 최근 브리핑에서 이미 다룬 기사 제외 (Groq 프롬프트도 그만큼 줄어듦)
+    with run_metrics.span("cross_day_dedup", side=label) as m:
+        fresh = filter_recent_duplicates(unique, recent_index)
+        m["output"] = len(fresh)
+    run_metrics.record_count("candidates.prepared", len(fresh), side=label)
+    return fresh
+
+
+def collect_candidates() -> Tuple[List[Dict[str, str]], List[Dict[str, str]], Dict[str, str]]:
+    """
+    국내·해외 수집기를 동시에 실행하고, 먼저 끝난 쪽부터 바로 후처리합니다.
+
+    수집기는 결과를 큐에 넣고, 메인 스레드는 도착 순서대로 필터링·중복 제거를 진행하므로
+    (보통 먼저 끝나는) 해외 후보 처리와 최근 브리핑 색인 로드가 네이버 수집 시간에 겹쳐집니다.
+    네이버는 키워드가 끝날 때마다 부분 결과를 보내므로, 해외 수집이 끝났고 국내 부분 결과가
+    NAVER_SUFFICIENT_CANDIDATES건 이상이면 남은 키워드를 기다리지 않고 선별을 시작합니다.
+    PIPELINE_DEADLINE_SEC 안에 끝나지 않은 쪽은 그때까지 받은 부분 결과(없으면 빈 후보)로 진행합니다.
+
+    Returns:
+        (국내 후보 리스트, 해외 후보 리스트, 네이버 수집 커서)
+        커서는 메인 스레드가 실제로 사용한 키워드의 것만 담기므로,
+        버려진 수집 스레드가 나중에 끝나도 저장될 커서에 영향을 주지 않습니다.
+    """
+    logger.info("\n📰 [1단계] 뉴스 수집 중 (병렬 처리, 도착 순서대로 후처리)...")
+    events: "queue.Queue[Tuple[str, str, List[Dict[str, str]], object]]" = queue.Queue()
+
+    def on_naver_keyword(keyword: str, articles: List[Dict[str, str]], newest: Optional[str]) -> None:
+        events.put(("keyword", keyword, articles, newest))
+
+    collectors = {
+        "국내": lambda: search_naver_news(on_keyword=on_naver_keyword),
+        "해외": lambda: (search_tavily_news(), {}),
+    }
+
+    def run_collector(label: str) -> None:
+        with run_metrics.span("collect", side=label) as m:
+            try:
+                result, cursors = collectors[label]()
+            except Exception as e:
+                logger.error(f"❌ {label} 수집 중 오류: {e}")
+                m["status"] = "error"
+                result, cursors = [], {}
+            m["output"] = len(result)
+        events.put(("done", label, result, cursors))
+
+    prepared: Dict[str, List[Dict[str, str]]] = {}
+    naver_cursors: Dict[str, str] = {}
+    # 키워드별 부분 결과 {키워드: (기사 리스트, 최신 발행 시각)} - 메인 스레드에서만 갱신
+    naver_partial: Dict[str, Tuple[List[Dict[str, str]], Optional[str]]] = {}
+    recent_index = None
+
+    def naver_sufficient() -> bool:
+        if NAVER_SUFFICIENT_CANDIDATES <= 0 or "국내" in prepared or "해외" not in prepared:
+            return False
+        urls = {a['url'] for articles, _ in naver_partial.values() for a in articles}
+        return len(urls) >= NAVER_SUFFICIENT_CANDIDATES
+
+    def use_naver_partial() -> None:
+        merged = merge_naver_results({kw: articles for kw, (articles, _) in naver_partial.items()})
+        naver_cursors.update({kw: newest for kw, (_, newest) in naver_partial.items() if newest})
+        run_metrics.record_count("candidates.partial_keywords", len(naver_partial), side="국내")
+        prepared["국내"] = prepare_candidates("국내", merged, recent_index)
+
+    deadline = time.monotonic() + PIPELINE_DEADLINE_SEC
+    executor = ThreadPoolExecutor(max_workers=len(collectors) + 1)
+    try:
+        for label in collectors:
+            executor.submit(run_collector, label)
+        recent_future = executor.submit(load_recent_briefing_index)
+
+        while len(prepared) < len(collectors):
+            remaining = deadline - time.monotonic()
+            try:
+                kind, label, candidates, extra = events.get(timeout=max(remaining, 0.001))
+            except queue.Empty:
+                pending = [label for label in collectors if label not in prepared]
+                logger.warning(f"⏱️ 수집 마감({PIPELINE_DEADLINE_SEC:.0f}초) 초과, 미완료 수집 제외: {pending}")
+                if "국내" not in prepared and naver_partial:
+                    if recent_index is None:
+                        recent_index = recent_future.result()
+                    logger.info(f"   ⏩ 국내는 완료된 키워드 {len(naver_partial)}개의 부분 결과로 진행")
+                    use_naver_partial()
+                break
+
+            if kind == "keyword":
+                naver_partial[label] = (candidates, extra)
+            else:
+                if recent_index is None:
+                    recent_index = recent_future.result()
+                prepared[label] = prepare_candidates(label, candidates, recent_index)
+                if label == "국내":
+                    naver_cursors.update(extra)
+
+            if naver_sufficient():
+                logger.info(
+                    f"   ⏩ 국내 부분 결과가 충분({NAVER_SUFFICIENT_CANDIDATES}건 이상, "
+                    f"키워드 {len(naver_partial)}/{len(NAVER_KEYWORDS)}) → 남은 키워드를 기다리지 않고 진행"
+                )
+                if recent_index is None:
+                    recent_index = recent_future.result()
+                use_naver_partial()
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    # 국내 수집이 버려졌다면 커서도 비어 있으므로 전진하지 않음 (놓친 기사를 다음 실행에서 다시 탐색)
+    return prepared.get("국내", []), prepared.get("해외", []), naver_cursors
 
 
 # ==========================================
 # 뉴스 처리 메인 함수 (배치 처리 최적화)
 # ==========================================
-def process_news() -> List[Dict[str, str]]:
+def process_news() -> Tuple[List[Dict[str, str]], Dict[str, str]]:
     """
     국내 및 해외 뉴스를 수집하고 AI로 선별합니다.
     (배치 처리: API 호출 2회 → 1회로 절감)
     
     Returns:
-        List[Dict]: 최종 선별된 뉴스 기사 리스트
+        (최종 선별된 뉴스 기사 리스트, 전송 성공 후 저장할 네이버 수집 커서)
     """
     try:
-        # 1. 국내 + 해외 뉴스 병렬 수집
-        logger.info("\n📰 [1단계] 뉴스 수집 중 (병렬 처리)...")
-        with ThreadPoolExecutor(max_workers=2) as executor:
-            kr_future = executor.submit(search_naver_news)
-            en_future = executor.submit(search_tavily_news)
-            kr_candidates = kr_future.result()
-            en_candidates = en_future.result()
-        
-        # 3. 로컬 필터링 (명백한 제외 대상 사전 제거)
-        logger.info("\n🔍 [2단계] 로컬 필터링 중...")
-        if kr_candidates:
-            kr_filtered = simple_rule_filter(kr_candidates)
-        else:
-            kr_filtered = []
-            logger.warning("   ⚠️ 국내 후보 기사가 없습니다.")
-        
-        if en_candidates:
-            en_filtered = simple_rule_filter(en_candidates)
-        else:
-            en_filtered = []
-            logger.warning("   ⚠️ 해외 후보 기사가 없습니다.")
-        
-        # 4. 중복 제거 (제목 유사도 기반)
-        logger.info("\n🗑️ [2.5단계] 중복 기사 제거 중...")
-        all_candidates = kr_filtered + en_filtered
-        
-        if not all_candidates:
-            logger.warning("⚠️ 필터링 후 후보 기사가 없습니다.")
-            return []
-        
-        # 국내, 해외 각각 중복 제거 후 합치기
-        kr_unique = remove_duplicate_articles(kr_filtered) if kr_filtered else []
-        en_unique = remove_duplicate_articles(en_filtered) if en_filtered else []
+        # 1~2.5단계: 수집 → 필터링 → 중복 제거 (먼저 끝난 쪽부터 처리)
+        kr_unique, en_unique, naver_cursors = collect_candidates()
         all_candidates = kr_unique + en_unique
-        
+
         logger.info(f"   📊 중복 제거 후: {len(all_candidates)}개 (국내 {len(kr_unique)} + 해외 {len(en_unique)})")
         
         if not all_candidates:
             logger.warning("⚠️ 중복 제거 후 후보 기사가 없습니다.")
-            return []
+            return [], naver_cursors
         
         logger.info(f"\n🤖 [3단계] AI가 국내 7개 + 해외 3개를 선별합니다...")
-        logger.info(f"   💡 배치 처리로 API 호출 1회만 사용 (Groq Llama-3.3-70B)")
+        if SELECTION_MODE == "sharded":
+            logger.info(f"   💡 샤드별 동시 채점 후 병합, 선택된 기사만 요약 (Groq Llama-3.3-70B)")
+            select = call_groq_sharded_selection
+        elif SELECTION_MODE == "tiered":
+            logger.info(f"   💡 로컬 점수로 확실한 기사는 직접 결정, 경합 구간만 LLM 채점 (Groq Llama-3.3-70B)")
+            select = call_groq_tiered_selection
+        else:
+            logger.info(f"   💡 한 번의 호출로 id만 선별 후 선택된 기사만 동시 요약 (Groq Llama-3.3-70B)")
+            select = call_groq_batch_selection
 
-        final_list = call_groq_batch_selection(all_candidates)
+        with run_metrics.span("llm_selection", mode=SELECTION_MODE) as m:
+            final_list = select(all_candidates)
+            m["input"] = len(all_candidates)
+            m["output"] = len(final_list)
 
         if final_list:
             # Groq 결과 검증 및 fallback
@@ -691,11 +1617,11 @@ def process_news() -> List[Dict[str, str]]:
             final_list = domestic + overseas
             logger.info(f"   🔄 로컬 fallback 완료: {len(final_list)}개 (국내 {len(domestic)}, 해외 {len(overseas)})")
 
-        return final_list
+        return final_list, naver_cursors
         
     except Exception as e:
         logger.error(f"❌ 뉴스 처리 중 오류: {e}")
-        return []
+        return [], {}
 
 
 # ==========================================
@@ -794,39 +1720,76 @@ def generate_strategic_analysis(articles: List[Dict[str, str]]) -> str:
         "max_tokens": 4000
     }
 
+    cache_key = state_store.llm_cache_key(url, data)
+    cached = _llm_cache_get(cache_key)
+    if cached:
+        logger.info(f"   ♻️ LLM 캐시 적중 (GPT-4o): 분석 리포트 재사용 ({len(cached)}자)")
+        run_metrics.record_count("llm_cache.hit", 1, endpoint="openai")
+        return cached
+
+    # 스트림이 끊기면 받은 부분을 assistant 메시지로 넘겨 이어서 작성하게 함
+    partial_text = ""
     for attempt in range(3):
+        last = attempt == 2
         try:
-            res = requests.post(url, headers=headers, json=data, timeout=90)
+            request_data = data
+            if partial_text:
+                request_data = {**data, "messages": data["messages"] + [
+                    {"role": "assistant", "content": partial_text},
+                    {"role": "user", "content": "응답이 중간에 끊겼다. 앞 내용을 반복하지 말고 끊긴 지점부터 이어서 작성하라."}
+                ]}
+            res = llm_client.chat_completion(
+                url, headers, request_data, timeout=90,
+                stream=LLM_STREAMING, include_usage=True, limiter=OPENAI_LIMITER
+            )
+            run_metrics.record_call(
+                "openai.analysis", res.elapsed_ms, res.status_code or "error",
+                attempt=attempt + 1, usage=res.usage,
+                complete=res.complete, continuation=request_data is not data
+            )
 
-            if res.status_code == 200:
-                response_data = res.json()
-                if 'choices' in response_data and len(response_data['choices']) > 0:
-                    content = response_data['choices'][0]['message']['content']
+            if res.ok:
+                content = partial_text + res.text
+                if not res.complete and not last:
+                    partial_text = content
+                    logger.warning(
+                        f"   ⚠️ [스트림 중단] {res.error}. {len(content)}자 보존, 이어서 요청 ({attempt+1}/3)..."
+                    )
+                    continue
+                if content:
+                    if res.complete:
+                        _llm_cache_put(cache_key, data["model"], content)
                     logger.info(f"   ✅ 전략적 분석 리포트 생성 완료 ({len(content)}자)")
                     return content
                 else:
-                    logger.warning("   ⚠️ 응답 형식 오류")
+                    logger.warning(f"   ⚠️ 응답 형식 오류")
                     return ""
+            # 마지막 시도의 실패는 백오프하지 않음 (다음 호출을 불필요하게 막지 않도록)
             elif res.status_code == 429:
-                wait_time = (attempt + 1) * 15
-                logger.warning(f"   ⏳ [API 과부하] {wait_time}초 대기 후 재시도...")
-                time.sleep(wait_time)
+                if last:
+                    logger.warning("   ⏳ [API 과부하] 재시도 횟수 소진")
+                    break
+                wait_time = OPENAI_LIMITER.backoff(attempt, res.headers)
+                logger.warning(f"   ⏳ [API 과부하] {wait_time:.1f}초 대기 후 재시도...")
+                continue
+            elif res.status_code is None:
+                if last:
+                    logger.warning(f"   ⚠️ [연결 불안정] {res.error}")
+                    break
+                wait_time = OPENAI_LIMITER.backoff(attempt)
+                logger.warning(f"   ⚠️ [연결 불안정] {res.error}. {wait_time:.1f}초 후 재시도 ({attempt+1}/3)...")
                 continue
             else:
-                logger.error(f"   ❌ API 오류: {res.status_code} - {res.text[:200]}")
-                if res.status_code >= 500:
-                    time.sleep(10)
+                logger.error(f"   ❌ API 오류: {res.status_code} - {res.body[:200]}")
+                if res.status_code >= 500 and not last:
+                    OPENAI_LIMITER.backoff(attempt, res.headers)
                     continue
                 return ""
 
-        except requests.exceptions.RequestException as e:
-            logger.warning(f"   ⚠️ [연결 불안정] {e}. 10초 후 재시도 ({attempt+1}/3)...")
-            time.sleep(10)
-            continue
         except Exception as e:
             logger.error(f"   ❌ 예상치 못한 오류: {e}")
-            if attempt < 2:
-                time.sleep(10)
+            if not last:
+                OPENAI_LIMITER.backoff(attempt)
                 continue
             return ""
 
@@ -857,80 +1820,45 @@ def save_to_sqlite(
         logger.warning("⚠️ 저장할 기사가 없습니다.")
         return False
 
-    db_path = Path(__file__).parent / "web" / "data" / "news.db"
-    db_path.parent.mkdir(parents=True, exist_ok=True)
+    # 저장·내보내기·검색 색인 모듈은 저장 단계에서만 로드 (선별 실패·키 누락 실행의 임포트 비용에서 빠짐)
+    import daily_export
+    import news_search
+    import news_store
+
+    db_path = NEWS_DB_PATH
 
     logger.info(f"\n💾 [SQLite] {db_path} 에 저장 중...")
 
+    # 쓰기 전 DB 지문 - 매니페스트가 이때의 DB와 맞았으면 오늘 날짜만 내보내면 됨
     try:
-        conn = sqlite3.connect(str(db_path))
-        cursor = conn.cursor()
-
-        # 테이블 생성 (없으면)
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS daily_briefings (
-                date        TEXT PRIMARY KEY,
-                analysis    TEXT NOT NULL,
-                created_at  TEXT NOT NULL
-            )
-        """)
-
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS articles (
-                id              INTEGER PRIMARY KEY AUTOINCREMENT,
-                date            TEXT NOT NULL,
-                category        TEXT,
-                title           TEXT NOT NULL,
-                title_original  TEXT,
-                url             TEXT NOT NULL,
-                summary         TEXT,
-                insight         TEXT,
-                detected_date   TEXT,
-                created_at      TEXT NOT NULL
-            )
-        """)
+        previous_source = daily_export.source_fingerprint(db_path)
+    except Exception as e:
+        logger.warning(f"   ⚠️ DB 지문 계산 실패 (정적 JSON은 전체 비교로 갱신): {e}")
+        previous_source = None
 
+    try:
         now_iso = datetime.now(KST).isoformat()
-
-        # 기존 데이터 삭제 (같은 날짜 중복 방지)
-        cursor.execute("DELETE FROM daily_briefings WHERE date = ?", (date_str,))
-        cursor.execute("DELETE FROM articles WHERE date = ?", (date_str,))
-
-        # 분석 리포트 저장
-        if analysis:
-            cursor.execute(
-                "INSERT INTO daily_briefings (date, analysis, created_at) VALUES (?, ?, ?)",
-                (date_str, analysis, now_iso)
-            )
-
-        # 기사 저장
-        for art in articles:
-            cursor.execute(
-                """INSERT INTO articles
-                   (date, category, title, title_original, url, summary, insight, detected_date, created_at)
-                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                (
-                    date_str,
-                    art.get('category', ''),
-                    art.get('title', ''),
-                    art.get('title_original', ''),
-                    art.get('url', ''),
-                    art.get('summary', ''),
-                    '',
-                    art.get('detected_date', ''),
-                    now_iso
-                )
-            )
-
-        conn.commit()
-        conn.close()
+        news_store.save_daily_briefing(db_path, date_str, articles, analysis, now_iso)
         logger.info(f"   ✅ SQLite 저장 완료: 기사 {len(articles)}건, 분석 리포트 1건")
-        return True
-
     except Exception as e:
         logger.error(f"   ❌ SQLite 저장 오류: {e}")
         return False
 
+    # 웹 앱용 날짜별 정적 JSON (실패해도 DB 저장은 유효 - 웹 앱은 DB로 대체)
+    try:
+        changed = daily_export.export_dates(db_path, [date_str], previous_source)
+        logger.info(f"   ✅ 정적 JSON 내보내기: {len(changed)}개 날짜 갱신")
+    except Exception as e:
+        logger.warning(f"   ⚠️ 정적 JSON 내보내기 실패: {e}")
+
+    # 아카이브 검색 색인 (로컬 파생 데이터 - 실패해도 다음 검색 때 밀린 날짜를 맞춤)
+    try:
+        news_search.index_dates(db_path, [date_str])
+        logger.info("   ✅ 검색 색인 갱신")
+    except Exception as e:
+        logger.warning(f"   ⚠️ 검색 색인 갱신 실패: {e}")
+    return True
+
 
 # ==========================================
 # 텔레그램 전송
@@ -1022,7 +1950,9 @@ def send_telegram(articles: List[Dict[str, str]]) -> bool:
                 "disable_web_page_preview": False
             }
 
-            res = requests.post(telegram_api_url, json=data, timeout=10)
+            call_start = time.perf_counter()
+            res = http_client.post(telegram_api_url, json=data, timeout=10)
+            run_metrics.record_call("telegram.send", (time.perf_counter() - call_start) * 1000, res.status_code)
             
             if res.status_code == 200:
                 success_count += 1
@@ -1065,6 +1995,25 @@ def send_telegram(articles: List[Dict[str, str]]) -> bool:
         return False
 
 
+# ==========================================
+# 실행 지표 저장
+# ==========================================
+def save_run_metrics() -> None:
+    """이번 실행의 단계별 지표를 news.db(monthly면 이번 달 샤드)의 run_metrics 테이블에 기록합니다."""
+    import daily_export
+    import news_store
+
+    try:
+        previous_source = daily_export.source_fingerprint(NEWS_DB_PATH)
+        saved = run_metrics.save(news_store.date_db_path(NEWS_DB_PATH, TODAY_STR))
+        if saved:
+            logger.info(f"   📈 실행 지표 {saved}건 저장 (run_metrics)")
+            # 지표는 날짜별 내보내기와 무관하므로 매니페스트의 원본 해시만 따라 갱신
+            daily_export.restamp_source(NEWS_DB_PATH, previous_source)
+    except Exception as e:
+        logger.warning(f"   ⚠️ 실행 지표 저장 실패 (실행 결과에는 영향 없음): {e}")
+
+
 # ==========================================
 # 메인 실행
 # ==========================================
@@ -1076,26 +2025,40 @@ def main():
     YESTERDAY = (NOW - timedelta(days=1)).strftime("%Y-%m-%d")
     logger.info(f"📅 기준 날짜(KST): {TODAY_STR} (어제: {YESTERDAY} 이후 기사만 허용)")
 
+    run_metrics.start_run(TODAY_STR)
+
     try:
         logger.info("=" * 50)
         logger.info("금융권 보안 뉴스 봇 시작")
         logger.info("=" * 50)
         
-        final_news = process_news()
-
-        if final_news:
-            logger.info(f"\n📊 최종 선별된 뉴스: {len(final_news)}개")
-
-            # 텔레그램 전송 (기존)
-            send_telegram(final_news)
-
-            # 웹사이트용 처리 - 기사만 저장 (분석은 텔레그램 /분석 명령어로 별도 제공)
-            try:
-                save_to_sqlite(final_news, "", TODAY_STR)
-            except Exception as e:
-                logger.error(f"❌ 웹사이트 데이터 처리 실패 (텔레그램 전송에는 영향 없음): {e}")
-        else:
-            logger.warning("⚠️ 최종 선별된 뉴스가 없습니다.")
+        with run_metrics.span("run") as run_span:
+            final_news, naver_cursors = process_news()
+            run_span["articles"] = len(final_news)
+
+            if final_news:
+                logger.info(f"\n📊 최종 선별된 뉴스: {len(final_news)}개")
+
+                # 텔레그램 전송 (기존)
+                with run_metrics.span("telegram") as m:
+                    delivered = send_telegram(final_news)
+                    m["status"] = "ok" if delivered else "failed"
+
+                # 웹사이트용 처리 - 기사만 저장 (분석은 텔레그램 /분석 명령어로 별도 제공)
+                try:
+                    with run_metrics.span("save_sqlite") as m:
+                        m["status"] = "ok" if save_to_sqlite(final_news, "", TODAY_STR) else "failed"
+                except Exception as e:
+                    logger.error(f"❌ 웹사이트 데이터 처리 실패 (텔레그램 전송에는 영향 없음): {e}")
+
+                # 전송에 성공한 실행에 한해 수집 커서 전진 (다음 실행은 이후 기사만 깊게 탐색)
+                # 전송이 실패하면 커서를 두어 다음 실행이 같은 구간을 다시 수집하도록 함
+                if delivered:
+                    commit_naver_cursors(naver_cursors)
+                else:
+                    logger.warning("   ⚠️ 텔레그램 전송 실패 → 네이버 수집 커서를 전진하지 않음")
+            else:
+                logger.warning("⚠️ 최종 선별된 뉴스가 없습니다.")
             
         logger.info("=" * 50)
         logger.info("프로그램 종료")
@@ -1104,7 +2067,14 @@ def main():
     except Exception as e:
         logger.error(f"프로그램 실행 중 치명적 오류: {e}", exc_info=True)
         raise
+    finally:
+        save_run_metrics()
 
 
 if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S'
+    )
     main()
@@ -0,0 +1,302 @@
+"""
+브리핑 아카이브 전문 검색 (SQLite FTS5)
+
+기사 제목·원문 제목·요약과 날짜별 분석 리포트를 FTS5 trigram 색인으로 검색합니다.
+trigram 토크나이저는 형태소 분석 없이 3글자 조각으로 색인하므로 조사가 붙은 한국어
+("랜섬웨어에", "신종랜섬웨어")에서도 부분 문자열을 찾고, 결과는 bm25 점수로 정렬합니다.
+3글자보다 짧은 검색어("해킹")는 trigram으로 찾을 수 없어 LIKE 조건으로 거릅니다.
+
+색인은 news.db에서 언제든 다시 만들 수 있는 파생 데이터라, 웹에 배포되는 news.db와
+분리된 로컬 파일(search.db)에 두며 git에는 커밋하지 않습니다. 날짜별 내용 해시를
+함께 저장해 바뀐 날짜만 다시 색인합니다.
+
+갱신:
+    - news_bot.save_to_sqlite / update_analysis.py: 저장한 날짜만 index_dates()로 갱신
+    - python news_search.py ...: 검색 전에 모든 날짜를 해시로 비교해 밀린 날짜를 맞춤
+
+환경변수:
+    NEWS_BOT_SEARCH_DB: 검색 색인 경로 (기본값: web/data/search.db)
+
+사용법:
+    python news_search.py 랜섬웨어
+    python news_search.py "금융 해킹" --limit 50 --since 2026-06-01
+    python news_search.py --rebuild          # 색인을 처음부터 다시 만들기
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
+
+import news_store
+
+DBPath = Union[str, Path]
+
+SEARCH_DB_PATH = Path(
+    os.environ.get("NEWS_BOT_SEARCH_DB")
+    or Path(__file__).parent / "web" / "data" / "search.db"
+)
+
+# 날짜 하나의 문서는 연속된 rowid로 들어가므로 indexed_dates의 범위로 바로 지움
+SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS docs USING fts5(
+    title, title_original, summary, analysis,
+    date UNINDEXED, kind UNINDEXED, url UNINDEXED,
+    tokenize = 'trigram'
+);
+
+CREATE TABLE IF NOT EXISTS indexed_dates (
+    date        TEXT PRIMARY KEY,
+    sha         TEXT NOT NULL,
+    min_rowid   INTEGER,
+    max_rowid   INTEGER
+) WITHOUT ROWID;
+"""
+
+# bm25 열 가중치 (title, title_original, summary, analysis, date, kind, url)
+BM25_WEIGHTS = (4.0, 2.0, 1.0, 1.0, 0.0, 0.0, 0.0)
+TRIGRAM = 3
+EXCERPT_CHARS = 40
+
+Doc = Tuple[Optional[str], Optional[str], Optional[str], Optional[str], str, str, Optional[str]]
+
+# 스키마를 이미 확인한 색인 경로
+_schema_ready: Set[str] = set()
+
+
+def connect(search_db: DBPath = SEARCH_DB_PATH) -> sqlite3.Connection:
+    """검색 색인에 연결하고 스키마를 보장합니다."""
+    path = str(search_db)
+    conn = sqlite3.connect(path, isolation_level=None)
+    if path not in _schema_ready or not os.path.exists(path):
+        conn.executescript(SCHEMA)
+        _schema_ready.add(path)
+    return conn
+
+
+# ==========================================
+# 색인 갱신
+# ==========================================
+def _load_docs(conn: sqlite3.Connection, date_str: str) -> List[Doc]:
+    """한 날짜의 검색 문서 (기사마다 하나 + 분석 리포트 하나)."""
+    docs: List[Doc] = [
+        (title, title_original, summary, None, date_str, "article", url)
+        for title, title_original, summary, url in conn.execute(
+            "SELECT title, title_original, summary, url FROM articles WHERE date = ? ORDER BY id ASC",
+            (date_str,)
+        )
+    ]
+    row = conn.execute("SELECT analysis FROM daily_briefings WHERE date = ?", (date_str,)).fetchone()
+    if docs and row and row[0]:
+        docs.append((None, None, None, row[0], date_str, "analysis", None))
+    return docs
+
+
+def index_dates(
+    db_path: DBPath,
+    dates: Optional[Iterable[str]] = None,
+    search_db: DBPath = SEARCH_DB_PATH
+) -> List[str]:
+    """
+    날짜별 문서를 다시 색인합니다. 내용 해시가 색인과 같은 날짜는 건너뜁니다.
+
+    Args:
+        db_path: news.db 경로 (monthly면 카탈로그와 월별 샤드에서 읽음)
+        dates: 다시 색인할 날짜들 (None이면 모든 날짜를 비교하고, 사라진 날짜는 색인에서 뺌)
+        search_db: 검색 색인 경로
+
+    Returns:
+        List[str]: 실제로 다시 색인한 날짜 (삭제된 날짜 포함)
+    """
+    partitioned = news_store.is_partitioned(db_path)
+    src = news_store.connect_index(db_path)
+    out = connect(search_db)
+    try:
+        indexed = {
+            date: (sha, min_rowid, max_rowid)
+            for date, sha, min_rowid, max_rowid in out.execute("SELECT * FROM indexed_dates")
+        }
+        live = {row[0] for row in src.execute("SELECT date FROM briefing_index")}
+        targets = live | set(indexed) if dates is None else set(dates)
+
+        updates = []
+        for date_str in sorted(targets):
+            if date_str not in live:
+                docs: List[Doc] = []
+            elif partitioned:
+                date_conn = news_store.connect_date(db_path, date_str)
+                try:
+                    docs = _load_docs(date_conn, date_str)
+                finally:
+                    date_conn.close()
+            else:
+                docs = _load_docs(src, date_str)
+            digest = hashlib.sha256(
+                json.dumps(docs, ensure_ascii=False).encode("utf-8")
+            ).hexdigest()[:16]
+            previous = indexed.get(date_str)
+            if (previous is None and not docs) or (previous and previous[0] == digest):
+                continue
+            updates.append((date_str, digest, docs, previous))
+
+        out.execute("BEGIN IMMEDIATE")
+        try:
+            for date_str, digest, docs, previous in updates:
+                if previous is not None:
+                    out.execute(
+                        "DELETE FROM docs WHERE rowid BETWEEN ? AND ?", (previous[1], previous[2])
+                    )
+                    out.execute("DELETE FROM indexed_dates WHERE date = ?", (date_str,))
+                if not docs:
+                    continue
+                first = out.execute("SELECT COALESCE(MAX(rowid), 0) + 1 FROM docs").fetchone()[0]
+                out.executemany(
+                    """INSERT INTO docs (rowid, title, title_original, summary, analysis, date, kind, url)
+                       VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
+                    [(first + i, *doc) for i, doc in enumerate(docs)]
+                )
+                out.execute(
+                    "INSERT INTO indexed_dates (date, sha, min_rowid, max_rowid) VALUES (?, ?, ?, ?)",
+                    (date_str, digest, first, first + len(docs) - 1)
+                )
+            out.execute("COMMIT")
+        except Exception:
+            out.execute("ROLLBACK")
+            raise
+    finally:
+        src.close()
+        out.close()
+    return [date_str for date_str, *_ in updates]
+
+
+# ==========================================
+# 검색
+# ==========================================
+def _excerpt(texts: Iterable[Optional[str]], terms: List[str]) -> str:
+    """검색어가 처음 나오는 필드에서 앞뒤 EXCERPT_CHARS자를 잘라 보여줍니다."""
+    for text in texts:
+        if not text:
+            continue
+        lowered = text.lower()
+        positions = [p for p in (lowered.find(t.lower()) for t in terms) if p >= 0]
+        if positions:
+            start = max(min(positions) - EXCERPT_CHARS, 0)
+            end = min(positions) + EXCERPT_CHARS * 2
+            excerpt = " ".join(text[start:end].split())
+            return ("…" if start else "") + excerpt + ("…" if end < len(text) else "")
+    return ""
+
+
+def search(
+    query: str,
+    limit: int = 20,
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+    search_db: DBPath = SEARCH_DB_PATH
+) -> List[Dict[str, Any]]:
+    """
+    색인에서 검색어를 모두 포함한 문서를 찾습니다 (공백으로 나눈 검색어는 AND).
+
+    Args:
+        query: 검색어
+        limit: 최대 결과 수
+        since: 시작 날짜 (YYYY-MM-DD, 포함)
+        until: 끝 날짜 (YYYY-MM-DD, 포함)
+        search_db: 검색 색인 경로
+
+    Returns:
+        List[Dict]: 순위 순 결과 (date, kind, title, url, excerpt, score - 짧은 검색어만 있으면 None)
+    """
+    terms = query.split()
+    if not terms:
+        return []
+    long_terms = [t for t in terms if len(t) >= TRIGRAM]
+    short_terms = [t for t in terms if len(t) < TRIGRAM]
+
+    where, params = [], []
+    if long_terms:
+        where.append("docs MATCH ?")
+        params.append(" ".join('"' + t.replace('"', '""') + '"' for t in long_terms))
+    for term in short_terms:
+        pattern = "%" + term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+        where.append(
+            "(" + " OR ".join(f"{col} LIKE ? ESCAPE '\\'" for col in ("title", "title_original", "summary", "analysis")) + ")"
+        )
+        params.extend([pattern] * 4)
+    if since:
+        where.append("date >= ?")
+        params.append(since)
+    if until:
+        where.append("date <= ?")
+        params.append(until)
+    # 긴 검색어가 없으면 bm25를 쓸 수 없어 최신순
+    score = f"bm25(docs, {', '.join(str(w) for w in BM25_WEIGHTS)})" if long_terms else "NULL"
+    order = "score ASC, date DESC" if long_terms else "date DESC, rowid ASC"
+
+    conn = connect(search_db)
+    try:
+        rows = conn.execute(
+            f"""SELECT date, kind, title, title_original, summary, analysis, url, {score} AS score
+                FROM docs WHERE {' AND '.join(where)}
+                ORDER BY {order} LIMIT ?""",
+            (*params, limit)
+        ).fetchall()
+    finally:
+        conn.close()
+
+    return [
+        {
+            "date": date,
+            "kind": kind,
+            "title": title if kind == "article" else f"{date} 분석 리포트",
+            "url": url,
+            "excerpt": _excerpt((summary, analysis, title_original, title), terms),
+            "score": round(-score, 3) if score is not None else None,
+        }
+        for date, kind, title, title_original, summary, analysis, url, score in rows
+    ]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="브리핑 아카이브 전문 검색")
+    parser.add_argument("query", nargs="*")
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--since")
+    parser.add_argument("--until")
+    parser.add_argument("--rebuild", action="store_true", help="색인을 지우고 처음부터 다시 만들기")
+    args = parser.parse_args()
+
+    db_path = Path(__file__).parent / "web" / "data" / "news.db"
+    if not news_store.index_db_path(db_path).exists():
+        print(f"DB not found: {db_path}")
+        return 1
+
+    if args.rebuild:
+        SEARCH_DB_PATH.unlink(missing_ok=True)
+    started = time.perf_counter()
+    changed = index_dates(db_path)
+    if changed:
+        print(f"Indexed {len(changed)} date(s) in {(time.perf_counter() - started) * 1000:.0f}ms")
+    if not args.query:
+        return 0
+
+    started = time.perf_counter()
+    hits = search(" ".join(args.query), args.limit, args.since, args.until)
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    for hit in hits:
+        print(f"{hit['date']}  {hit['title']}")
+        if hit["url"]:
+            print(f"    {hit['url']}")
+        if hit["excerpt"]:
+            print(f"    {hit['excerpt']}")
+    print(f"{len(hits)} hit(s) in {elapsed_ms:.1f}ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,654 @@
+"""
+웹 게시용 브리핑 DB(news.db) 저장소
+
+news.db는 git에 커밋되어 Vercel의 웹 앱(sql.js)이 파일 하나를 통째로 읽습니다.
+그래서 저널 모드는 WAL이 아닌 롤백 저널(DELETE)을 유지합니다. WAL은 커밋
+시점에 체크포인트되지 않은 변경이 -wal 파일에 남아 커밋된 news.db에서 빠질 수 있고,
+-wal/-shm 파일이 작업 트리에 생깁니다. 쓰기는 하루 한 번의 단일 작성자라 WAL의
+동시성 이점도 없습니다.
+
+스키마는 PRAGMA user_version으로 버전을 관리하며, 프로세스마다 경로별로
+한 번만 확인하고 밀린 마이그레이션만 적용합니다.
+
+사용처:
+    - news_bot.save_to_sqlite: 일일 브리핑(기사 + 분석) 저장
+    - update_analysis.py: 수동 분석 리포트 갱신
+두 쓰기 모두 같은 트랜잭션에서 날짜 색인(briefing_index)을 함께 갱신합니다.
+news_store를 거치지 않고 articles에 직접 쓰는 작성자(Cowork 브리핑 프롬프트)는
+쓰기 뒤에 python news_store.py reindex로 색인을 통째로 다시 계산합니다.
+
+저장 방식 (NEWS_DB_LAYOUT):
+    single   news.db 한 파일 (기본)
+    monthly  news/YYYY-MM.db 월별 샤드(articles, daily_briefings, run_metrics)
+             + news/catalog.db(briefing_index). 매일 쓰기는 이번 달 샤드와 작은
+             카탈로그만 바꾸므로 git push·CI 체크아웃·웹 앱 메모리가 아카이브
+             크기와 무관해집니다. 읽는 쪽은 필요한 달의 샤드만 엽니다.
+    미지정   news/catalog.db가 있으면 monthly, 없으면 single
+             (단, news.db에 카탈로그보다 최근 날짜가 있으면 single - catalog_is_stale)
+기존 news.db는 split_by_month()로 (python news_store.py split) 월별 샤드로 나눕니다.
+분할 뒤에도 news.db에 직접 쓴 작성자(Cowork)가 있으면 reindex가 그 최근 날짜들을
+월별 샤드와 카탈로그로 옮깁니다 (fold_stale_catalog).
+"""
+
+import logging
+import os
+import sqlite3
+import sys
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Set, Tuple, Union
+
+import run_metrics
+
+DBPath = Union[str, Path]
+
+logger = logging.getLogger(__name__)
+
+# (버전, DDL) - 순서대로 한 번씩 적용. 기존 DB를 그대로 받아들이도록 IF NOT EXISTS 사용
+MIGRATIONS: List[Tuple[int, str]] = [
+    (1, """
+        CREATE TABLE IF NOT EXISTS daily_briefings (
+            date        TEXT PRIMARY KEY,
+            analysis    TEXT NOT NULL,
+            created_at  TEXT NOT NULL
+        );
+
+        CREATE TABLE IF NOT EXISTS articles (
+            id              INTEGER PRIMARY KEY AUTOINCREMENT,
+            date            TEXT NOT NULL,
+            category        TEXT,
+            title           TEXT NOT NULL,
+            title_original  TEXT,
+            url             TEXT NOT NULL,
+            summary         TEXT,
+            insight         TEXT,
+            detected_date   TEXT,
+            created_at      TEXT NOT NULL
+        );
+    """),
+    # 웹 앱의 날짜별 조회(WHERE date = ? ORDER BY id)·날짜 목록(DISTINCT date)·이전/다음
+    # 날짜 탐색과 중복 제거용 최근 기사 조회가 모두 이 인덱스만으로 처리됨
+    (2, """
+        CREATE INDEX IF NOT EXISTS idx_articles_date_id ON articles(date, id);
+        CREATE INDEX IF NOT EXISTS idx_articles_url ON articles(url);
+    """),
+    # 날짜 목록·이전/다음 날짜를 웹 앱이 스캔 없이 읽도록 쓰기 시점에 유지하는 날짜 색인
+    (3, """
+        CREATE TABLE IF NOT EXISTS briefing_index (
+            date            TEXT PRIMARY KEY,
+            article_count   INTEGER NOT NULL,
+            domestic_count  INTEGER NOT NULL,
+            overseas_count  INTEGER NOT NULL,
+            has_analysis    INTEGER NOT NULL,
+            prev_date       TEXT,
+            next_date       TEXT
+        ) WITHOUT ROWID;
+
+        INSERT OR REPLACE INTO briefing_index
+            (date, article_count, domestic_count, overseas_count, has_analysis, prev_date, next_date)
+        SELECT
+            a.date,
+            COUNT(*),
+            SUM(a.category = '[국내]'),
+            SUM(a.category = '[해외]'),
+            EXISTS (SELECT 1 FROM daily_briefings b WHERE b.date = a.date AND b.analysis != ''),
+            LAG(a.date) OVER (ORDER BY a.date),
+            LEAD(a.date) OVER (ORDER BY a.date)
+        FROM articles a
+        GROUP BY a.date;
+    """),
+]
+
+SCHEMA_VERSION = MIGRATIONS[-1][0]
+
+# 월별 샤드는 기사·분석 테이블과 인덱스만, 카탈로그는 날짜 색인만 가짐
+# (카탈로그 색인은 split_by_month 또는 쓰기 시점의 refresh_briefing_index가 채움)
+SHARD_MIGRATIONS: List[Tuple[int, str]] = MIGRATIONS[:2]
+CATALOG_MIGRATIONS: List[Tuple[int, str]] = [
+    (1, MIGRATIONS[2][1].split("INSERT OR REPLACE")[0]),
+]
+
+LAYOUT = os.environ.get("NEWS_DB_LAYOUT", "")  # single | monthly | "" (자동)
+CATALOG_NAME = "catalog.db"
+
+ARTICLE_COLUMNS = (
+    "date", "category", "title", "title_original", "url",
+    "summary", "insight", "detected_date", "created_at",
+)
+
+# 마이그레이션을 이미 확인한 DB 경로
+_migrated: Set[str] = set()
+
+# news.db 경로별 (news.db·카탈로그 stat, 카탈로그가 낡았는지) - 파일이 바뀌면 다시 판정
+_stale_catalogs: Dict[str, Tuple[Tuple, bool]] = {}
+
+
+def migrate(conn: sqlite3.Connection, migrations: List[Tuple[int, str]] = MIGRATIONS) -> int:
+    """
+    밀린 마이그레이션을 하나의 트랜잭션으로 적용합니다.
+
+    Args:
+        conn: news.db (또는 샤드·카탈로그) 연결
+        migrations: 적용할 마이그레이션 목록
+
+    Returns:
+        int: 적용 후 스키마 버전
+    """
+    current = conn.execute("PRAGMA user_version").fetchone()[0]
+    pending = [(version, ddl) for version, ddl in migrations if version > current]
+    if not pending:
+        return current
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        for version, ddl in pending:
+            for statement in ddl.split(";"):
+                if statement.strip():
+                    conn.execute(statement)
+            conn.execute(f"PRAGMA user_version = {int(version)}")
+        conn.execute("COMMIT")
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+    return pending[-1][0]
+
+
+def connect(db_path: DBPath, migrations: List[Tuple[int, str]] = MIGRATIONS) -> sqlite3.Connection:
+    """news.db에 연결하고 (경로별 첫 연결에서만) 저널 모드와 스키마를 보장합니다."""
+    path = str(db_path)
+    first = path not in _migrated or not os.path.exists(path)
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    # 트랜잭션은 migrate / write_transaction에서 직접 관리
+    conn = sqlite3.connect(path, isolation_level=None)
+    if first:
+        # WAL로 바뀐 DB가 커밋되지 않도록 단일 파일 롤백 저널로 되돌림
+        if conn.execute("PRAGMA journal_mode").fetchone()[0].lower() == "wal":
+            conn.execute("PRAGMA journal_mode = DELETE")
+        migrate(conn, migrations)
+        _migrated.add(path)
+    return conn
+
+
+# ==========================================
+# 월별 분할 (monthly layout)
+# ==========================================
+def partition_dir(db_path: DBPath) -> Path:
+    """news.db 옆의 월별 샤드 디렉터리 (예: web/data/news)."""
+    path = Path(db_path)
+    return path.parent / path.stem
+
+
+def is_partitioned(db_path: DBPath) -> bool:
+    """db_path가 월별 샤드로 저장되는지 여부 (NEWS_DB_LAYOUT, 없으면 카탈로그 존재로 판단)."""
+    if LAYOUT in ("single", "monthly"):
+        return LAYOUT == "monthly"
+    return (partition_dir(db_path) / CATALOG_NAME).exists() and not catalog_is_stale(db_path)
+
+
+def _read_one(path: Path, sql: str) -> Optional[str]:
+    """읽기 전용으로 한 값을 읽습니다 (테이블이 없으면 None, 마이그레이션하지 않음)."""
+    conn = sqlite3.connect(f"{path.resolve().as_uri()}?mode=ro", uri=True)
+    try:
+        return conn.execute(sql).fetchone()[0]
+    except sqlite3.OperationalError:
+        return None
+    finally:
+        conn.close()
+
+
+def catalog_is_stale(db_path: DBPath) -> bool:
+    """
+    분할 뒤 남은 news.db에 카탈로그보다 최근 날짜가 있는지 여부.
+    news_store를 거치지 않고 news.db에 쓴 작성자(Cowork)가 있었다는 뜻이라, 자동 판단에서는
+    낡은 샤드 대신 news.db를 씁니다. 웹 앱(web/lib/db.ts)도 같은 기준으로 고릅니다.
+    """
+    single = Path(db_path)
+    catalog = partition_dir(db_path) / CATALOG_NAME
+    if not (single.exists() and catalog.exists()):
+        return False
+    key = tuple((st.st_mtime_ns, st.st_size) for st in (single.stat(), catalog.stat()))
+    cached = _stale_catalogs.get(str(single))
+    if cached and cached[0] == key:
+        return cached[1]
+
+    latest = _read_one(single, "SELECT MAX(date) FROM articles")
+    indexed = _read_one(catalog, "SELECT MAX(date) FROM briefing_index")
+    stale = latest is not None and (indexed is None or latest > indexed)
+    if stale:
+        logger.warning(
+            f"{single}의 최근 날짜 {latest}가 카탈로그({indexed})보다 새로움 - 월별 샤드 대신 news.db 사용 "
+            f"(python news_store.py reindex로 샤드에 반영)"
+        )
+    _stale_catalogs[str(single)] = (key, stale)
+    return stale
+
+
+def shard_path(db_path: DBPath, date_str: str) -> Path:
+    """날짜(또는 YYYY-MM)가 속한 월별 샤드 경로."""
+    return partition_dir(db_path) / f"{date_str[:7]}.db"
+
+
+def date_db_path(db_path: DBPath, date_str: str) -> Path:
+    """날짜의 기사·분석·실행 지표가 저장되는 파일 (single이면 news.db 자체)."""
+    return shard_path(db_path, date_str) if is_partitioned(db_path) else Path(db_path)
+
+
+def index_db_path(db_path: DBPath) -> Path:
+    """briefing_index가 있는 파일 (monthly면 카탈로그)."""
+    return partition_dir(db_path) / CATALOG_NAME if is_partitioned(db_path) else Path(db_path)
+
+
+def article_db_paths(
+    db_path: DBPath,
+    since: Optional[str] = None,
+    until: Optional[str] = None
+) -> List[Path]:
+    """
+    [since, until) 날짜 구간의 기사를 담은 기존 파일 목록 (monthly면 해당 달 샤드만).
+
+    Args:
+        db_path: news.db 경로
+        since: 시작 날짜 (YYYY-MM-DD, None이면 처음부터)
+        until: 끝 날짜 (YYYY-MM-DD, 제외, None이면 끝까지)
+    """
+    if not is_partitioned(db_path):
+        return [Path(db_path)] if Path(db_path).exists() else []
+    paths = []
+    for path in sorted(partition_dir(db_path).glob("????-??.db")):
+        month = path.stem
+        if since is not None and month < since[:7]:
+            continue
+        if until is not None and month > until[:7]:
+            continue
+        paths.append(path)
+    return paths
+
+
+def connect_index(db_path: DBPath) -> sqlite3.Connection:
+    """briefing_index를 읽는 연결 (monthly면 카탈로그, 아니면 news.db)."""
+    if is_partitioned(db_path):
+        return connect(index_db_path(db_path), CATALOG_MIGRATIONS)
+    return connect(db_path)
+
+
+def connect_date(db_path: DBPath, date_str: str) -> sqlite3.Connection:
+    """
+    날짜의 articles·daily_briefings와 briefing_index를 함께 보는 연결.
+    monthly면 카탈로그에 그 달의 샤드를 ATTACH하므로 테이블 이름을 그대로 쓸 수 있고,
+    롤백 저널 모드에서 두 파일에 걸친 트랜잭션도 원자적으로 커밋됩니다.
+    """
+    if not is_partitioned(db_path):
+        return connect(db_path)
+    return connect_shard_and_catalog(db_path, date_str)
+
+
+def connect_shard_and_catalog(db_path: DBPath, date_str: str) -> sqlite3.Connection:
+    """레이아웃 판단과 무관하게 카탈로그에 날짜의 월별 샤드를 ATTACH한 연결 (connect_date의 monthly 경우)."""
+    shard = shard_path(db_path, date_str)
+    connect(shard, SHARD_MIGRATIONS).close()
+    conn = connect(partition_dir(db_path) / CATALOG_NAME, CATALOG_MIGRATIONS)
+    conn.execute("ATTACH DATABASE ? AS shard", (str(shard),))
+    return conn
+
+
+@contextmanager
+def write_transaction(db_path: DBPath, date_str: Optional[str] = None) -> Iterator[sqlite3.Connection]:
+    """
+    BEGIN IMMEDIATE ~ COMMIT 구간 (예외 시 ROLLBACK). 끝나면 연결도 닫습니다.
+    date_str이 없으면 briefing_index가 있는 파일(monthly면 카탈로그)에 씁니다.
+    """
+    conn = connect_date(db_path, date_str) if date_str else connect_index(db_path)
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+    finally:
+        conn.close()
+
+
+# ==========================================
+# 날짜 색인 (briefing_index)
+# ==========================================
+def refresh_briefing_index(conn: sqlite3.Connection, date_str: str) -> None:
+    """
+    한 날짜의 색인 행을 articles·daily_briefings에서 다시 계산하고 앞뒤 날짜 연결을 고칩니다.
+    기사가 없는 날짜는 색인에서 빠지고 이웃 날짜끼리 연결됩니다 (웹 앱의 날짜 목록과 같은 기준).
+    호출부의 쓰기 트랜잭션 안에서 실행해야 합니다.
+
+    Args:
+        conn: news.db 연결 (트랜잭션 진행 중)
+        date_str: 날짜 (YYYY-MM-DD)
+    """
+    total, domestic, overseas = conn.execute(
+        """SELECT COUNT(*), COALESCE(SUM(category = '[국내]'), 0), COALESCE(SUM(category = '[해외]'), 0)
+           FROM articles WHERE date = ?""",
+        (date_str,)
+    ).fetchone()
+    has_analysis = conn.execute(
+        "SELECT EXISTS (SELECT 1 FROM daily_briefings WHERE date = ? AND analysis != '')",
+        (date_str,)
+    ).fetchone()[0]
+    prev_date = conn.execute(
+        "SELECT MAX(date) FROM briefing_index WHERE date < ?", (date_str,)
+    ).fetchone()[0]
+    next_date = conn.execute(
+        "SELECT MIN(date) FROM briefing_index WHERE date > ?", (date_str,)
+    ).fetchone()[0]
+
+    if total:
+        conn.execute(
+            """INSERT OR REPLACE INTO briefing_index
+               (date, article_count, domestic_count, overseas_count, has_analysis, prev_date, next_date)
+               VALUES (?, ?, ?, ?, ?, ?, ?)""",
+            (date_str, total, domestic, overseas, has_analysis, prev_date, next_date)
+        )
+        link = date_str
+    else:
+        conn.execute("DELETE FROM briefing_index WHERE date = ?", (date_str,))
+        link = None
+    if prev_date is not None:
+        conn.execute(
+            "UPDATE briefing_index SET next_date = ? WHERE date = ?", (link or next_date, prev_date)
+        )
+    if next_date is not None:
+        conn.execute(
+            "UPDATE briefing_index SET prev_date = ? WHERE date = ?", (link or prev_date, next_date)
+        )
+
+
+# 날짜별 색인 값 (마이그레이션 3의 백필과 같은 기준, 앞뒤 연결은 rebuild_briefing_index가 채움)
+_INDEX_ROWS_SQL = """
+    SELECT
+        a.date,
+        COUNT(*),
+        SUM(a.category = '[국내]'),
+        SUM(a.category = '[해외]'),
+        EXISTS (SELECT 1 FROM daily_briefings b WHERE b.date = a.date AND b.analysis != '')
+    FROM articles a
+    GROUP BY a.date
+    ORDER BY a.date
+"""
+
+
+def rebuild_briefing_index(db_path: DBPath) -> int:
+    """
+    briefing_index 전체를 articles·daily_briefings에서 다시 만듭니다.
+    articles에 직접 쓴 작성자 뒤에 실행해 색인이 어긋나지 않게 합니다 (monthly면 모든 샤드를 읽음).
+
+    Args:
+        db_path: news.db 경로
+
+    Returns:
+        int: 색인된 날짜 수
+    """
+    rows: List[Tuple] = []
+    if is_partitioned(db_path):
+        for shard in article_db_paths(db_path):
+            conn = connect(shard, SHARD_MIGRATIONS)
+            try:
+                rows.extend(conn.execute(_INDEX_ROWS_SQL).fetchall())
+            finally:
+                conn.close()
+        rows.sort()
+
+    with write_transaction(db_path) as conn:
+        if not is_partitioned(db_path):
+            rows = conn.execute(_INDEX_ROWS_SQL).fetchall()
+        conn.execute("DELETE FROM briefing_index")
+        conn.executemany(
+            """INSERT INTO briefing_index
+               (date, article_count, domestic_count, overseas_count, has_analysis, prev_date, next_date)
+               VALUES (?, ?, ?, ?, ?, ?, ?)""",
+            [
+                (*row, rows[i - 1][0] if i > 0 else None, rows[i + 1][0] if i + 1 < len(rows) else None)
+                for i, row in enumerate(rows)
+            ]
+        )
+    return len(rows)
+
+
+# ==========================================
+# 쓰기
+# ==========================================
+def save_daily_briefing(
+    db_path: DBPath,
+    date_str: str,
+    articles: List[Dict[str, str]],
+    analysis: str,
+    now_iso: str
+) -> int:
+    """
+    하루치 브리핑(기사 + 분석)을 한 트랜잭션으로 교체 저장합니다.
+    같은 날짜의 기존 기사·분석은 지우고 새로 넣습니다 (재실행 시 중복 방지).
+
+    Args:
+        db_path: news.db 경로
+        date_str: 날짜 (YYYY-MM-DD)
+        articles: 기사 리스트 (category, title, title_original, url, summary, detected_date)
+        analysis: 분석 리포트 (빈 문자열이면 분석 행을 만들지 않음)
+        now_iso: 저장 시각 (ISO 8601)
+
+    Returns:
+        int: 저장한 기사 수
+    """
+    rows = [
+        (
+            date_str,
+            art.get('category', ''),
+            art.get('title', ''),
+            art.get('title_original', ''),
+            art.get('url', ''),
+            art.get('summary', ''),
+            '',
+            art.get('detected_date', ''),
+            now_iso
+        )
+        for art in articles
+    ]
+    with write_transaction(db_path, date_str) as conn:
+        conn.execute("DELETE FROM daily_briefings WHERE date = ?", (date_str,))
+        conn.execute("DELETE FROM articles WHERE date = ?", (date_str,))
+        if analysis:
+            conn.execute(
+                "INSERT INTO daily_briefings (date, analysis, created_at) VALUES (?, ?, ?)",
+                (date_str, analysis, now_iso)
+            )
+        conn.executemany(
+            f"INSERT INTO articles ({', '.join(ARTICLE_COLUMNS)}) "
+            f"VALUES ({', '.join('?' * len(ARTICLE_COLUMNS))})",
+            rows
+        )
+        refresh_briefing_index(conn, date_str)
+    return len(rows)
+
+
+def save_analysis(db_path: DBPath, date_str: str, analysis: str, now_iso: str) -> bool:
+    """
+    날짜의 분석 리포트를 넣거나 갱신합니다 (기사는 건드리지 않음).
+
+    Args:
+        db_path: news.db 경로
+        date_str: 날짜 (YYYY-MM-DD)
+        analysis: 분석 리포트 (마크다운)
+        now_iso: 저장 시각 (ISO 8601)
+
+    Returns:
+        bool: 기존 행을 갱신했으면 True, 새로 넣었으면 False
+    """
+    with write_transaction(db_path, date_str) as conn:
+        existed = conn.execute(
+            "SELECT 1 FROM daily_briefings WHERE date = ?", (date_str,)
+        ).fetchone() is not None
+        conn.execute(
+            """INSERT INTO daily_briefings (date, analysis, created_at) VALUES (?, ?, ?)
+               ON CONFLICT(date) DO UPDATE SET
+                   analysis = excluded.analysis,
+                   created_at = excluded.created_at""",
+            (date_str, analysis, now_iso)
+        )
+        refresh_briefing_index(conn, date_str)
+    return existed
+
+
+# ==========================================
+# news.db → 월별 샤드 변환
+# ==========================================
+def split_by_month(db_path: DBPath) -> Dict[str, int]:
+    """
+    news.db를 월별 샤드와 카탈로그로 나눕니다 (기사 id 유지). 이미 있는 샤드는 덮어씁니다.
+    원본 news.db는 그대로 두므로, 확인 후 직접 지우면 됩니다.
+
+    Args:
+        db_path: news.db 경로
+
+    Returns:
+        Dict[str, int]: 달(YYYY-MM)별 옮긴 기사 수
+    """
+    out_dir = partition_dir(db_path)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    src = connect(db_path)
+    try:
+        has_metrics = src.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'run_metrics'"
+        ).fetchone() is not None
+        months = [row[0] for row in src.execute(
+            """SELECT DISTINCT substr(date, 1, 7) FROM articles
+               UNION SELECT DISTINCT substr(date, 1, 7) FROM daily_briefings ORDER BY 1"""
+        )]
+        counts = {}
+        for month in months:
+            shard = shard_path(db_path, month)
+            shard.unlink(missing_ok=True)
+            _migrated.discard(str(shard))
+            conn = connect(shard, SHARD_MIGRATIONS)
+            try:
+                if has_metrics:
+                    conn.executescript(run_metrics.SCHEMA)
+            finally:
+                conn.close()
+            src.execute("ATTACH DATABASE ? AS shard", (str(shard),))
+            try:
+                src.execute("BEGIN IMMEDIATE")
+                for table, column in (("articles", "date"), ("daily_briefings", "date")):
+                    src.execute(
+                        f"INSERT INTO shard.{table} SELECT * FROM main.{table} WHERE substr({column}, 1, 7) = ?",
+                        (month,)
+                    )
+                if has_metrics:
+                    src.execute(
+                        "INSERT INTO shard.run_metrics SELECT * FROM main.run_metrics WHERE substr(run_date, 1, 7) = ?",
+                        (month,)
+                    )
+                src.execute("COMMIT")
+            except Exception:
+                src.execute("ROLLBACK")
+                raise
+            finally:
+                src.execute("DETACH DATABASE shard")
+            counts[month] = src.execute(
+                "SELECT COUNT(*) FROM articles WHERE substr(date, 1, 7) = ?", (month,)
+            ).fetchone()[0]
+
+        catalog = out_dir / CATALOG_NAME
+        catalog.unlink(missing_ok=True)
+        _migrated.discard(str(catalog))
+        connect(catalog, CATALOG_MIGRATIONS).close()
+        src.execute("ATTACH DATABASE ? AS catalog", (str(catalog),))
+        try:
+            src.execute("INSERT INTO catalog.briefing_index SELECT * FROM main.briefing_index")
+        finally:
+            src.execute("DETACH DATABASE catalog")
+    finally:
+        src.close()
+    return counts
+
+
+def fold_stale_catalog(db_path: DBPath) -> List[str]:
+    """
+    카탈로그보다 새로운 news.db(catalog_is_stale)의 최근 날짜들을 월별 샤드와 카탈로그로 옮깁니다.
+    분할 뒤 news.db에 직접 쓴 작성자(Cowork)의 날짜만 옮기므로, 그사이 샤드에만 쓴
+    날짜와 실행 지표는 그대로 남습니다. 옮기고 나면 다시 monthly로 판단됩니다.
+
+    Args:
+        db_path: news.db 경로
+
+    Returns:
+        List[str]: 옮긴 날짜
+    """
+    catalog = partition_dir(db_path) / CATALOG_NAME
+    indexed = _read_one(catalog, "SELECT MAX(date) FROM briefing_index")
+    src = connect(db_path)
+    try:
+        dates = [row[0] for row in src.execute(
+            "SELECT DISTINCT date FROM articles WHERE date > ? ORDER BY date", (indexed or "",)
+        )]
+        rows = {
+            date_str: (
+                src.execute(
+                    f"SELECT {', '.join(ARTICLE_COLUMNS)} FROM articles WHERE date = ? ORDER BY id", (date_str,)
+                ).fetchall(),
+                src.execute(
+                    "SELECT date, analysis, created_at FROM daily_briefings WHERE date = ?", (date_str,)
+                ).fetchall(),
+            )
+            for date_str in dates
+        }
+    finally:
+        src.close()
+
+    for date_str in dates:
+        article_rows, briefing_rows = rows[date_str]
+        conn = connect_shard_and_catalog(db_path, date_str)
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.execute("DELETE FROM articles WHERE date = ?", (date_str,))
+                conn.execute("DELETE FROM daily_briefings WHERE date = ?", (date_str,))
+                conn.executemany(
+                    f"INSERT INTO articles ({', '.join(ARTICLE_COLUMNS)}) "
+                    f"VALUES ({', '.join('?' * len(ARTICLE_COLUMNS))})",
+                    article_rows
+                )
+                conn.executemany(
+                    "INSERT INTO daily_briefings (date, analysis, created_at) VALUES (?, ?, ?)", briefing_rows
+                )
+                refresh_briefing_index(conn, date_str)
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+        finally:
+            conn.close()
+    return dates
+
+
+def main() -> int:
+    db_path = Path(__file__).parent / "web" / "data" / "news.db"
+    if sys.argv[1:] not in (["split"], ["reindex"]):
+        print("Usage: python news_store.py split|reindex")
+        return 2
+    if sys.argv[1] == "reindex":
+        if LAYOUT == "" and catalog_is_stale(db_path):
+            dates = fold_stale_catalog(db_path)
+            print(f"Folded {len(dates)} date(s) from {db_path} into {partition_dir(db_path)}: {', '.join(dates)}")
+            return 0
+        if not index_db_path(db_path).exists():
+            print(f"DB not found: {index_db_path(db_path)}")
+            return 1
+        print(f"Reindexed {rebuild_briefing_index(db_path)} date(s) in {index_db_path(db_path)}")
+        return 0
+    if not db_path.exists():
+        print(f"DB not found: {db_path}")
+        return 1
+    counts = split_by_month(db_path)
+    for month, count in counts.items():
+        print(f"{month}: {count} articles -> {shard_path(db_path, month)}")
+    print(f"Catalog: {partition_dir(db_path) / CATALOG_NAME} (news.db는 그대로 남아 있음)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
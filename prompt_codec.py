@@ -0,0 +1,135 @@
+"""
+LLM 선별 프롬프트용 후보 기사 압축 인코딩
+
+후보 기사를 들여쓰기 JSON 대신 번호가 매겨진 표 한 줄씩으로 직렬화합니다.
+    - URL은 번호(id)로 대체하고, 응답 파싱 후 원래 URL로 되돌림
+    - 설명은 글자 수 예산만큼만 포함
+    - 전송 전 토큰 수를 추정하여 예산을 넘으면 설명을 줄이고,
+      그래도 넘으면 각 구분(국내/해외) 목록의 뒤쪽(저우선순위) 기사부터 제외
+
+토큰 추정은 Llama 3 계열 토크나이저 기준 근사치입니다
+(ASCII 약 4자당 1토큰, 한글 등 비ASCII 문자는 1자당 약 1토큰).
+"""
+
+import re
+from typing import Dict, List, Optional, Set, Tuple
+
+TABLE_HEADER = "id|구분|날짜|제목|설명"
+CACHED_MARK = "(요약있음)"
+
+# 설명 길이 단계: 예산을 넘으면 다음 단계로 줄임
+DESC_CHAR_STEPS = (120, 90, 60, 40, 20, 0)
+
+
+def estimate_tokens(text: str) -> int:
+    """텍스트의 토큰 수를 근사 추정합니다."""
+    ascii_chars = sum(1 for ch in text if ord(ch) < 128)
+    return (ascii_chars + 3) // 4 + (len(text) - ascii_chars)
+
+
+def _clean(text: str, limit: Optional[int] = None) -> str:
+    """표 구분자와 줄바꿈을 제거하고 길이를 제한합니다."""
+    text = re.sub(r'[|\r\n]+', ' ', text or '').strip()
+    if limit is not None and len(text) > limit:
+        text = text[:limit].rstrip() + "…"
+    return text
+
+
+class CandidateTable:
+    """번호 매긴 후보 표와 번호 → 원본 기사 매핑."""
+
+    def __init__(self, rows: List[str], by_id: Dict[int, Dict[str, str]], dropped: int, desc_chars: int):
+        self.text = "\n".join([TABLE_HEADER] + rows)
+        self.by_id = by_id
+        self.dropped = dropped
+        self.desc_chars = desc_chars
+        self.tokens = estimate_tokens(self.text)
+
+    def decode(self, selected: List[Dict[str, str]]) -> List[Dict[str, str]]:
+        """
+        모델이 돌려준 id를 원래 URL·구분·날짜로 되돌립니다.
+        해외 기사는 원문 제목(title_original)도 원본 기사 제목으로 채웁니다.
+        id가 없거나 알 수 없는 항목은 그대로 둡니다 (url을 직접 준 경우 호환).
+        """
+        for item in selected:
+            if not isinstance(item, dict) or 'id' not in item:
+                continue
+            try:
+                source = self.by_id.get(int(item['id']))
+            except (TypeError, ValueError):
+                source = None
+            if source is None:
+                continue
+            item.pop('id')
+            item['url'] = source.get('url', '')
+            item['category'] = source.get('category', '')
+            item.setdefault('detected_date', source.get('published_date', ''))
+            if source.get('category') == '[해외]' and not item.get('title_original'):
+                item['title_original'] = source.get('title', '')
+        return selected
+
+
+def _build(
+    items: List[Dict[str, str]],
+    keep: List[int],
+    cached_urls: Set[str],
+    desc_chars: int
+) -> CandidateTable:
+    rows = []
+    by_id = {}
+    for new_id, idx in enumerate(keep, 1):
+        item = items[idx]
+        by_id[new_id] = item
+        kind = "해외" if '[해외]' in item.get('category', '') else "국내"
+        if item.get('url') in cached_urls:
+            desc = CACHED_MARK
+        else:
+            desc = _clean(item.get('description', ''), desc_chars) if desc_chars else ""
+        rows.append(f"{new_id}|{kind}|{_clean(item.get('published_date', ''))}|{_clean(item.get('title', ''))}|{desc}")
+    return CandidateTable(rows, by_id, len(items) - len(keep), desc_chars)
+
+
+def encode_candidates(
+    items: List[Dict[str, str]],
+    token_budget: int,
+    cached_urls: Optional[Set[str]] = None,
+    min_per_category: Tuple[int, int] = (7, 3)
+) -> CandidateTable:
+    """
+    후보 기사를 토큰 예산 안에 들어가는 번호 표로 인코딩합니다.
+
+    Args:
+        items: 후보 기사 리스트 (구분별로 우선순위 순서)
+        token_budget: 표에 허용할 추정 토큰 수
+        cached_urls: 이미 요약이 있어 설명을 생략할 기사 URL
+        min_per_category: 제외하더라도 남겨둘 (국내, 해외) 최소 기사 수
+
+    Returns:
+        CandidateTable: 인코딩 결과 (예산을 끝내 못 맞추면 최소 구성으로 반환)
+    """
+    cached_urls = cached_urls or set()
+    keep = list(range(len(items)))
+
+    # 1) 설명 길이를 단계적으로 줄여봄
+    for desc_chars in DESC_CHAR_STEPS:
+        table = _build(items, keep, cached_urls, desc_chars)
+        if table.tokens <= token_budget:
+            return table
+
+    # 2) 설명 없이도 넘치면 저우선순위 기사부터 제외 (기사 수가 많은 구분부터)
+    desc_chars = DESC_CHAR_STEPS[-1]
+    domestic = [i for i in keep if '[해외]' not in items[i].get('category', '')]
+    overseas = [i for i in keep if '[해외]' in items[i].get('category', '')]
+    min_kr, min_en = min_per_category
+    while table.tokens > token_budget:
+        can_drop_kr = len(domestic) > min_kr
+        can_drop_en = len(overseas) > min_en
+        if not can_drop_kr and not can_drop_en:
+            break
+        if can_drop_kr and (not can_drop_en or len(domestic) - min_kr >= len(overseas) - min_en):
+            domestic.pop()
+        else:
+            overseas.pop()
+        table = _build(items, domestic + overseas, cached_urls, desc_chars)
+
+    return table
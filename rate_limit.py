@@ -0,0 +1,227 @@
+"""
+LLM 제공자별 호출 속도 제한 스케줄러 (토큰 버킷)
+
+Groq와 OpenAI는 응답마다 남은 요청 수·토큰 수와 초기화까지 남은 시간을
+x-ratelimit-* 헤더로, 429 응답에는 다시 시도해도 되는 시점을 Retry-After로 알려줍니다.
+제공자마다 요청·토큰 버킷을 두고 이 헤더로 잔량과 충전 속도를 맞춰 두면
+    - 잔량이 부족한 호출은 보내기 전에 필요한 만큼만 정확히 기다리고
+    - 429·5xx 뒤 재시도 시점은 Retry-After (없으면 지터를 섞은 지수 백오프)로 정하며
+    - 그 시점까지 같은 제공자를 쓰는 다른 스레드(샤드 채점·기사별 요약)도 함께 멈춥니다.
+헤더를 받기 전에는 제한이 없는 것으로 보고 바로 보냅니다.
+
+리미터는 모듈 스코프에 있어 Lambda 웜 컨테이너에서는 다음 실행에도 잔량 정보가 이어집니다.
+
+환경변수:
+    RATE_LIMIT_BACKOFF_BASE_SEC: 지수 백오프 첫 대기 시간 (기본값: 1)
+    RATE_LIMIT_BACKOFF_MAX_SEC: 지수 백오프 최대 대기 시간 (기본값: 30)
+    RATE_LIMIT_MAX_WAIT_SEC: 호출 하나가 버킷을 기다리는 최대 시간, 넘으면 그대로 보냄 (기본값: 60)
+"""
+
+import json
+import os
+import random
+import re
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Optional
+
+import run_metrics
+
+RATE_LIMIT_BACKOFF_BASE_SEC = float(os.environ.get("RATE_LIMIT_BACKOFF_BASE_SEC", "1"))
+RATE_LIMIT_BACKOFF_MAX_SEC = float(os.environ.get("RATE_LIMIT_BACKOFF_MAX_SEC", "30"))
+RATE_LIMIT_MAX_WAIT_SEC = float(os.environ.get("RATE_LIMIT_MAX_WAIT_SEC", "60"))
+
+# "2m59.56s", "7.66s", "6ms" 같은 reset 헤더 값의 단위별 조각
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+_DURATION_UNITS = {"h": 3600.0, "m": 60.0, "s": 1.0, "ms": 0.001}
+
+
+def parse_duration(value: Optional[str]) -> Optional[float]:
+    """reset 헤더 값("1m2.5s", "350ms", "12")을 초로 바꿉니다 (해석할 수 없으면 None)."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    parts = _DURATION_PART.findall(value)
+    if not parts or "".join(n + u for n, u in parts) != value:
+        return None
+    return sum(float(n) * _DURATION_UNITS[u] for n, u in parts)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Retry-After 헤더(초 또는 HTTP 날짜)를 지금부터 기다릴 초로 바꿉니다."""
+    if not value:
+        return None
+    seconds = parse_duration(value)
+    if seconds is not None:
+        return seconds
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def estimate_tokens(payload: Dict[str, Any]) -> int:
+    """요청이 토큰 버킷에서 차지할 양 (메시지 길이로 추정한 입력 + 최대 출력 토큰)."""
+    text = json.dumps(payload.get("messages", []), ensure_ascii=False)
+    # 한글은 글자당 1토큰 이상, 영문은 4글자당 1토큰 정도라 보수적으로 글자 수 / 2
+    return len(text) // 2 + int(payload.get("max_tokens") or 0)
+
+
+class TokenBucket:
+    """잔량과 충전 속도를 응답 헤더로 맞추는 버킷 (capacity가 None이면 제한 없음)."""
+
+    def __init__(self):
+        self.capacity: Optional[float] = None
+        self.level = 0.0
+        self.rate = 0.0                  # 초당 충전량
+        self.reset_at = 0.0              # 헤더가 알려준 완전 초기화 시각 (monotonic)
+        self.updated = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        if self.capacity is None:
+            return
+        if now >= self.reset_at > 0:
+            self.level = self.capacity
+        else:
+            self.level = min(self.capacity, self.level + self.rate * (now - self.updated))
+        self.updated = now
+
+    def wait_time(self, amount: float, now: float) -> float:
+        """amount만큼 꺼낼 수 있을 때까지 남은 초."""
+        self._refill(now)
+        if self.capacity is None:
+            return 0.0
+        amount = min(amount, self.capacity)
+        if self.level >= amount:
+            return 0.0
+        if self.rate > 0:
+            return (amount - self.level) / self.rate
+        return max(0.0, self.reset_at - now)
+
+    def take(self, amount: float) -> None:
+        if self.capacity is not None:
+            self.level -= amount
+
+    def sync(self, limit: Optional[float], remaining: Optional[float], reset_sec: Optional[float], now: float) -> None:
+        """응답 헤더의 한도·잔량·초기화 시간으로 버킷을 맞춥니다."""
+        if remaining is None:
+            return
+        if limit is not None:
+            self.capacity = limit
+        elif self.capacity is None:
+            self.capacity = remaining
+        self.level = remaining
+        self.updated = now
+        if reset_sec is not None:
+            self.reset_at = now + reset_sec
+            # 소진된 만큼이 reset_sec 동안 고르게 충전된다고 봄
+            if reset_sec > 0 and self.capacity > remaining:
+                self.rate = (self.capacity - remaining) / reset_sec
+
+
+class RateLimiter:
+    """제공자 하나의 요청·토큰 버킷과 재시도 차단 시각을 관리합니다 (스레드 안전)."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.requests = TokenBucket()
+        self.tokens = TokenBucket()
+        self.blocked_until = 0.0         # 429·5xx 뒤 이 시각까지 모든 호출 대기 (monotonic)
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: int = 0) -> float:
+        """
+        요청 1개와 tokens만큼의 잔량이 생길 때까지 기다린 뒤 차감합니다.
+
+        Returns:
+            float: 실제로 기다린 초
+        """
+        start = time.monotonic()
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                wait = max(
+                    self.blocked_until - now,
+                    self.requests.wait_time(1, now),
+                    self.tokens.wait_time(tokens, now),
+                )
+                if wait <= 0 or now - start >= RATE_LIMIT_MAX_WAIT_SEC:
+                    self.requests.take(1)
+                    self.tokens.take(tokens)
+                    break
+            time.sleep(min(wait, RATE_LIMIT_MAX_WAIT_SEC - (now - start)))
+        waited = time.monotonic() - start
+        if waited >= 0.01:
+            run_metrics.record_count("ratelimit.wait_ms", round(waited * 1000, 1), provider=self.name)
+        return waited
+
+    def blocked_for(self) -> float:
+        """429·5xx 뒤 재시도 차단이 풀리기까지 남은 초 (차단 중이 아니면 0)."""
+        with self._lock:
+            return max(0.0, self.blocked_until - time.monotonic())
+
+    def observe(self, headers: Dict[str, str]) -> None:
+        """응답의 x-ratelimit-* 헤더로 버킷을 맞춥니다."""
+        lowered = {k.lower(): v for k, v in (headers or {}).items()}
+
+        def number(key: str) -> Optional[float]:
+            try:
+                return float(lowered[key])
+            except (KeyError, ValueError):
+                return None
+
+        now = time.monotonic()
+        with self._lock:
+            for kind, bucket in (("requests", self.requests), ("tokens", self.tokens)):
+                bucket.sync(
+                    number(f"x-ratelimit-limit-{kind}"),
+                    number(f"x-ratelimit-remaining-{kind}"),
+                    parse_duration(lowered.get(f"x-ratelimit-reset-{kind}")),
+                    now,
+                )
+
+    def backoff(self, attempt: int, headers: Optional[Dict[str, str]] = None) -> float:
+        """
+        실패한 호출(429·5xx·연결 오류) 뒤 재시도까지 기다릴 시간을 정하고,
+        그동안 이 제공자로 가는 모든 호출을 막습니다 (실제 대기는 다음 acquire에서).
+
+        Retry-After가 있으면 그 시간, 없으면 지터를 섞은 지수 백오프
+        (base * 2^attempt의 절반 ~ 전체 사이 임의 값)를 씁니다.
+
+        Args:
+            attempt: 0부터 시작하는 시도 번호
+            headers: 실패한 응답의 헤더 (연결 오류면 None)
+
+        Returns:
+            float: 재시도까지 남은 초
+        """
+        lowered = {k.lower(): v for k, v in (headers or {}).items()}
+        delay = parse_retry_after(lowered.get("retry-after"))
+        if delay is not None:
+            # 여러 스레드가 같은 순간에 다시 몰리지 않도록 약간의 지터
+            delay += random.uniform(0, min(1.0, delay * 0.1))
+        else:
+            ceiling = min(RATE_LIMIT_BACKOFF_MAX_SEC, RATE_LIMIT_BACKOFF_BASE_SEC * (2 ** attempt))
+            delay = random.uniform(ceiling / 2, ceiling)
+        self.observe(headers or {})
+        with self._lock:
+            now = time.monotonic()
+            self.blocked_until = max(self.blocked_until, now + delay)
+            return self.blocked_until - now
+
+
+_limiters: Dict[str, RateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def limiter(name: str) -> RateLimiter:
+    """제공자 이름("groq", "openai")별 리미터 (프로세스 안에서 공유)."""
+    with _limiters_lock:
+        if name not in _limiters:
+            _limiters[name] = RateLimiter(name)
+        return _limiters[name]
@@ -0,0 +1,192 @@
+"""
+실행 지표 계측 (단계별 소요 시간, 외부 호출, LLM 토큰 사용량)
+
+한 번의 실행 동안 다음 지표를 메모리에 모았다가 실행이 끝나면 news.db의
+run_metrics 테이블에 한 트랜잭션으로 기록합니다. 각 지표는 기록 즉시
+한 줄짜리 JSON 로그로도 출력되어 CloudWatch 등에서 바로 검색할 수 있습니다.
+    - stage: 수집·필터링·중복 제거·LLM 선별·저장·전송 단계별 소요 시간과 성공 여부
+    - call: 외부 API 호출별 지연 시간, 시도 횟수, HTTP 상태, 토큰 사용량
+    - count: 후보 기사 수 등 단계별 건수
+
+환경변수:
+    RUN_METRICS_LOG: JSON 지표 로그 출력 여부 (기본값: true)
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+from zoneinfo import ZoneInfo
+
+RUN_METRICS_LOG = os.environ.get("RUN_METRICS_LOG", "true").lower() in ("1", "true", "yes")
+
+KST = ZoneInfo("Asia/Seoul")
+
+logger = logging.getLogger("news_bot.metrics")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS run_metrics (
+    id                  INTEGER PRIMARY KEY AUTOINCREMENT,
+    run_id              TEXT NOT NULL,
+    run_date            TEXT NOT NULL,
+    kind                TEXT NOT NULL,
+    name                TEXT NOT NULL,
+    duration_ms         REAL,
+    status              TEXT,
+    attempt             INTEGER,
+    prompt_tokens       INTEGER,
+    completion_tokens   INTEGER,
+    value               REAL,
+    extra               TEXT,
+    created_at          TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_run_metrics_date_name ON run_metrics(run_date, name);
+"""
+
+_lock = threading.Lock()
+_records: List[Dict[str, Any]] = []
+_run_id = ""
+_run_date = ""
+
+
+def start_run(run_date: str) -> str:
+    """새 실행을 시작하고 이전 실행의 미저장 지표를 비웁니다. 실행 ID를 반환합니다."""
+    global _run_id, _run_date
+    with _lock:
+        _records.clear()
+        _run_date = run_date
+        _run_id = f"{run_date}-{os.urandom(4).hex()}"
+    return _run_id
+
+
+def _emit(kind: str, name: str, **fields: Any) -> Dict[str, Any]:
+    record = {
+        "run_id": _run_id,
+        "run_date": _run_date,
+        "kind": kind,
+        "name": name,
+        "created_at": datetime.now(KST).isoformat(),
+    }
+    record.update({k: v for k, v in fields.items() if v is not None})
+    with _lock:
+        _records.append(record)
+    if RUN_METRICS_LOG:
+        logger.info(json.dumps({"metric": record}, ensure_ascii=False, default=str))
+    return record
+
+
+@contextmanager
+def span(name: str, **extra: Any) -> Iterator[Dict[str, Any]]:
+    """
+    단계 소요 시간을 기록하는 컨텍스트 매니저.
+    yield된 dict에 값을 넣으면 extra 필드로 함께 기록됩니다 (예: 입력/출력 건수).
+
+    사용 예:
+        with run_metrics.span("dedup", side="kr") as m:
+            unique = remove_duplicate_articles(articles)
+            m["output"] = len(unique)
+    """
+    fields: Dict[str, Any] = dict(extra)
+    status = "ok"
+    start = time.perf_counter()
+    try:
+        yield fields
+    except BaseException:
+        status = "error"
+        raise
+    finally:
+        # 호출부가 지정한 상태(예: "failed")는 예외가 없을 때만 사용
+        explicit = fields.pop("status", None)
+        _emit(
+            "stage", name,
+            duration_ms=round((time.perf_counter() - start) * 1000, 1),
+            status=explicit if explicit and status == "ok" else status,
+            extra=fields or None
+        )
+
+
+def record_call(
+    name: str,
+    duration_ms: float,
+    status: Any,
+    attempt: Optional[int] = None,
+    usage: Optional[Dict[str, int]] = None,
+    **extra: Any
+) -> None:
+    """
+    외부 API 호출 1회를 기록합니다.
+
+    Args:
+        name: 호출 이름 (예: "groq.selection", "naver.search")
+        duration_ms: 응답까지 걸린 시간 (스트리밍은 마지막 청크까지)
+        status: HTTP 상태 코드 또는 "error" (연결 실패)
+        attempt: 재시도 루프의 시도 번호 (1부터)
+        usage: OpenAI 호환 usage dict (prompt_tokens, completion_tokens)
+    """
+    usage = usage or {}
+    _emit(
+        "call", name,
+        duration_ms=round(duration_ms, 1),
+        status=str(status),
+        attempt=attempt,
+        prompt_tokens=usage.get("prompt_tokens"),
+        completion_tokens=usage.get("completion_tokens"),
+        extra=extra or None
+    )
+
+
+def record_count(name: str, value: float, **extra: Any) -> None:
+    """건수 지표를 기록합니다 (예: 단계별 후보 기사 수)."""
+    _emit("count", name, value=value, extra=extra or None)
+
+
+def records() -> List[Dict[str, Any]]:
+    """이번 실행에서 모은 지표의 사본을 반환합니다."""
+    with _lock:
+        return [dict(r) for r in _records]
+
+
+def save(db_path: Path) -> int:
+    """
+    모은 지표를 run_metrics 테이블에 한 트랜잭션으로 기록합니다.
+
+    Returns:
+        int: 기록한 지표 수
+    """
+    with _lock:
+        rows = [
+            (
+                r["run_id"], r["run_date"], r["kind"], r["name"],
+                r.get("duration_ms"), r.get("status"), r.get("attempt"),
+                r.get("prompt_tokens"), r.get("completion_tokens"), r.get("value"),
+                json.dumps(r["extra"], ensure_ascii=False, default=str) if r.get("extra") else None,
+                r["created_at"],
+            )
+            for r in _records
+        ]
+    if not rows:
+        return 0
+
+    conn = sqlite3.connect(str(db_path))
+    try:
+        conn.executescript(SCHEMA)
+        with conn:
+            conn.executemany(
+                """INSERT INTO run_metrics
+                   (run_id, run_date, kind, name, duration_ms, status, attempt,
+                    prompt_tokens, completion_tokens, value, extra, created_at)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                rows
+            )
+    finally:
+        conn.close()
+
+    with _lock:
+        del _records[:len(rows)]
+    return len(rows)
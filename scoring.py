@@ -0,0 +1,139 @@
+"""
+키워드 가중치 기반 기사 점수 엔진
+
+우선순위 키워드 사전과 제외 키워드를 Aho–Corasick 오토마톤으로 한 번만 컴파일하고,
+기사 제목+본문 요약을 한 번만 훑어서 점수를 계산합니다.
+키워드 사전이 수백 개로 늘어나도 기사당 비용은 텍스트 길이에 비례합니다.
+
+점수 규칙은 기존 calculate_priority_score()와 동일합니다.
+    - 키워드가 제목 또는 설명에 한 번이라도 나오면 해당 가중치를 1회 가산
+    - 여러 티어에 중복 등록된 키워드는 각 티어 가중치를 모두 가산
+"""
+
+from collections import deque
+from typing import Dict, Iterable, List, Set, Tuple
+
+# ==========================================
+# 키워드 가중치 설정 테이블
+# ==========================================
+# 티어 이름: (가중치, 키워드 목록) - 키워드는 소문자로 비교
+PRIORITY_KEYWORD_TIERS: Dict[str, Tuple[int, List[str]]] = {
+    # 1순위 키워드 (AI보안, 침해사고) - 10점
+    "high_priority": (10, ['ai보안', 'ai 보안', '해킹', '유출', '랜섬웨어', '사이버공격', '보안사고', '침해']),
+    # 1순위 키워드 (규제/정책/법률) - 10점
+    "regulation": (10, ['개보법', '개인정보보호법', '신정법', '신용정보법', '전자금융거래법', '전자금융감독규정',
+                        'kisa', '금보원', '금융보안원', '금감원', '금융감독원', '과기정통부', '개인정보위',
+                        '사이버특사경', '수사권', '법개정', '법 개정', '재개정', '시행령']),
+    # 2순위 키워드 (기술/취약점) - 5점
+    "mid_priority": (5, ['보안기술', '제로데이', '취약점', 'cve-']),
+    # 3순위 키워드 (금융권/신한) - 3점
+    "finance": (3, ['신한', '금융권', '금융사', '은행']),
+}
+
+# 명백한 제외 대상 키워드 (채용/홍보성 기사)
+EXCLUDE_KEYWORDS: List[str] = ['채용', '인사발령', '이벤트', '프로모션', '광고', '모집']
+
+# 제목과 설명을 한 번에 훑기 위한 구분자 (키워드에 포함되지 않는 문자)
+_FIELD_SEPARATOR = "\n"
+
+
+class KeywordMatcher:
+    """
+    Aho–Corasick 다중 패턴 매처.
+
+    모든 키워드를 하나의 트라이 + 실패 링크로 컴파일하여, 텍스트를 한 번 훑는 동안
+    겹치는 매치까지 포함해 등장한 키워드를 모두 찾습니다.
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        self.keywords: List[str] = []
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[int]] = [[]]
+
+        for keyword in keywords:
+            keyword = keyword.lower()
+            if not keyword or keyword in self.keywords:
+                continue
+            self._insert(keyword, len(self.keywords))
+            self.keywords.append(keyword)
+        self._build_failure_links()
+
+    def _insert(self, keyword: str, keyword_id: int) -> None:
+        node = 0
+        for ch in keyword:
+            nxt = self._goto[node].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            node = nxt
+        self._output[node].append(keyword_id)
+
+    def _build_failure_links(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, child in self._goto[node].items():
+                queue.append(child)
+                fail = self._fail[node]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[child] = self._goto[fail].get(ch, 0)
+                if self._fail[child] == child:
+                    self._fail[child] = 0
+                self._output[child].extend(self._output[self._fail[child]])
+
+    def find_ids(self, text: str) -> Set[int]:
+        """텍스트(소문자화된 상태 가정)에 등장한 키워드 id 집합을 반환합니다."""
+        found: Set[int] = set()
+        goto, fail, output = self._goto, self._fail, self._output
+        node = 0
+        for ch in text:
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            if output[node]:
+                found.update(output[node])
+        return found
+
+    def find(self, text: str) -> Set[str]:
+        """텍스트에 등장한 키워드 집합을 반환합니다 (대소문자 무시)."""
+        return {self.keywords[i] for i in self.find_ids(text.lower())}
+
+    def contains_any(self, text: str) -> bool:
+        """키워드가 하나라도 등장하는지 확인합니다 (첫 매치에서 중단)."""
+        goto, fail, output = self._goto, self._fail, self._output
+        node = 0
+        for ch in text.lower():
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            if output[node]:
+                return True
+        return False
+
+
+class KeywordScorer:
+    """가중치 티어 테이블을 컴파일한 점수 계산기."""
+
+    def __init__(self, tiers: Dict[str, Tuple[int, List[str]]]):
+        weights: Dict[str, int] = {}
+        for weight, keywords in tiers.values():
+            for keyword in keywords:
+                keyword = keyword.lower()
+                weights[keyword] = weights.get(keyword, 0) + weight
+        self.matcher = KeywordMatcher(weights.keys())
+        self._weights = [weights[k] for k in self.matcher.keywords]
+
+    def score(self, title: str, description: str = "") -> int:
+        """제목과 설명을 한 번 훑어 키워드 가중치 합계를 반환합니다."""
+        text = f"{title}{_FIELD_SEPARATOR}{description}".lower()
+        return sum(self._weights[i] for i in self.matcher.find_ids(text))
+
+
+# 모듈 로드 시 한 번만 컴파일
+PRIORITY_SCORER = KeywordScorer(PRIORITY_KEYWORD_TIERS)
+EXCLUDE_MATCHER = KeywordMatcher(EXCLUDE_KEYWORDS)
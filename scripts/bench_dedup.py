@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Benchmark: pairwise (O(n²)) dedup vs MinHash/LSH dedup.
+
+Runs both engines on the recorded title fixture (scripts/fixtures/dedup_titles.json,
+exported from web/data/news.db) at several candidate-pool sizes and reports:
+- wall time per engine and speedup
+- agreement: identical kept-URL set, Jaccard of kept sets, and the number of
+  articles kept by only one engine
+
+Usage:
+    python scripts/bench_dedup.py                 # default sizes 20,100,500,1000
+    python scripts/bench_dedup.py --sizes 50,300  # custom sizes
+    python scripts/bench_dedup.py --repeat 3      # best-of-N timing
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import dedup  # noqa: E402
+
+FIXTURE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "dedup_titles.json")
+
+
+def load_articles(path: str) -> list[dict]:
+    with open(path, encoding="utf-8") as f:
+        rows = json.load(f)
+    # Newest first, like a morning candidate pool that includes a long tail.
+    rows.sort(key=lambda r: r["date"], reverse=True)
+    return [
+        {"category": r["category"], "title": r["title"], "url": f"fixture://{i}"}
+        for i, r in enumerate(rows)
+    ]
+
+
+def best_of(fn, articles: list[dict], repeat: int) -> tuple[float, list[dict]]:
+    best = float("inf")
+    result: list[dict] = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = fn(articles)
+        best = min(best, time.perf_counter() - t0)
+    return best, result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--fixture", default=FIXTURE)
+    parser.add_argument("--sizes", default="20,100,500,1000")
+    parser.add_argument("--repeat", type=int, default=1)
+    args = parser.parse_args()
+
+    articles = load_articles(args.fixture)
+    sizes = [int(s) for s in args.sizes.split(",") if s.strip()]
+
+    print(f"fixture: {args.fixture} ({len(articles)} titles)")
+    print(f"{'n':>6} {'pairwise_s':>11} {'lsh_s':>9} {'speedup':>8} {'kept_pw':>8} {'kept_lsh':>9} "
+          f"{'jaccard':>8} {'only_pw':>8} {'only_lsh':>9} {'identical':>9}")
+
+    for n in sizes:
+        pool = articles[:n]
+        t_pw, kept_pw = best_of(dedup.pairwise_dedup, pool, args.repeat)
+        t_lsh, kept_lsh = best_of(dedup.lsh_dedup, pool, args.repeat)
+
+        urls_pw = {a["url"] for a in kept_pw}
+        urls_lsh = {a["url"] for a in kept_lsh}
+        union = urls_pw | urls_lsh
+        jaccard = len(urls_pw & urls_lsh) / len(union) if union else 1.0
+        identical = [a["url"] for a in kept_pw] == [a["url"] for a in kept_lsh]
+
+        print(f"{len(pool):>6} {t_pw:>11.4f} {t_lsh:>9.4f} {t_pw / t_lsh if t_lsh else 0:>7.1f}x "
+              f"{len(kept_pw):>8} {len(kept_lsh):>9} {jaccard:>8.3f} {len(urls_pw - urls_lsh):>8} "
+              f"{len(urls_lsh - urls_pw):>9} {str(identical):>9}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Import-time profile of the Lambda entry point (cold-start cost).
+
+Runs `python -X importtime -c "import lambda_handler"` in fresh subprocesses and
+reports, as the median over runs:
+- total wall time of the import
+- the heaviest top-level imports (cumulative µs) and the repo's own modules
+- any module from LAZY_MODULES that was imported eagerly (these are deferred
+  to the call sites on purpose; exit status 1 if one shows up)
+
+A baseline profile is kept in scripts/fixtures/importtime_baseline.json so a
+change that drags a heavy dependency back into the init phase stands out.
+Absolute numbers depend on the machine; compare against a baseline taken on
+the same box.
+
+Usage:
+    python scripts/bench_import.py                  # 5 runs, compare with baseline
+    python scripts/bench_import.py --runs 15 --top 20
+    python scripts/bench_import.py --save-baseline  # overwrite the baseline
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BASELINE = os.path.join(ROOT, "scripts", "fixtures", "importtime_baseline.json")
+ENTRY = "lambda_handler"
+
+# Imported inside the functions that need them; must not load at init.
+LAZY_MODULES = ("tavily", "httpx", "asyncio")
+
+LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|( *)(\S+)$")
+
+
+def profile_once() -> tuple[float, dict[str, tuple[int, int, int]]]:
+    """Return (process wall ms, {module: (self µs, cumulative µs, depth)}) for the ENTRY subtree."""
+    env = {k: v for k, v in os.environ.items() if not k.startswith("PYTHON")}
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {ENTRY}"],
+        cwd=ROOT, env=env, capture_output=True, text=True, check=True
+    )
+    wall_ms = (time.perf_counter() - start) * 1000
+    rows = []
+    for line in proc.stderr.splitlines():
+        m = LINE.match(line)
+        if m:
+            rows.append((m.group(4), int(m.group(1)), int(m.group(2)), len(m.group(3)) // 2))
+
+    # -X importtime prints children before their parent, so ENTRY's subtree is the
+    # run of deeper lines right above it (interpreter startup imports are excluded).
+    end = next(i for i, row in enumerate(rows) if row[0] == ENTRY and row[3] == 0)
+    start = end
+    while start > 0 and rows[start - 1][3] > 0:
+        start -= 1
+    return wall_ms, {name: (self_us, cum_us, depth) for name, self_us, cum_us, depth in rows[start:end + 1]}
+
+
+def repo_modules() -> set[str]:
+    return {f[:-3] for f in os.listdir(ROOT) if f.endswith(".py")}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=12)
+    parser.add_argument("--baseline", default=BASELINE)
+    parser.add_argument("--save-baseline", action="store_true")
+    args = parser.parse_args()
+
+    walls, runs = [], []
+    for _ in range(args.runs):
+        wall_ms, modules = profile_once()
+        walls.append(wall_ms)
+        runs.append(modules)
+
+    names = set().union(*runs)
+    median_cum = {n: statistics.median(r[n][1] for r in runs if n in r) for n in names}
+    depth = {n: next(r[n][2] for r in runs if n in r) for n in names}
+    entry_ms = median_cum.get(ENTRY, 0) / 1000
+
+    baseline = {}
+    if os.path.exists(args.baseline) and not args.save_baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+
+    def delta(value_ms: float, key: str) -> str:
+        if key not in baseline:
+            return ""
+        return f"  (baseline {baseline[key]:.1f} ms, {value_ms - baseline[key]:+.1f})"
+
+    print(f"python {sys.version.split()[0]}, {args.runs} runs")
+    print(f"import {ENTRY}: {entry_ms:.1f} ms cumulative{delta(entry_ms, 'import_ms')}; "
+          f"process wall {statistics.median(walls):.1f} ms{delta(statistics.median(walls), 'process_ms')}")
+
+    # Direct imports of the entry module and of news_bot (depth 1-2).
+    top_level = sorted((n for n in names if 1 <= depth[n] <= 2), key=lambda n: -median_cum[n])
+    print(f"\nheaviest imports under {ENTRY}:")
+    for n in top_level[:args.top]:
+        print(f"  {median_cum[n] / 1000:8.1f} ms  {n}")
+
+    own = sorted(repo_modules() & names, key=lambda n: -median_cum[n])
+    print("\nrepo modules:")
+    for n in own:
+        print(f"  {median_cum[n] / 1000:8.1f} ms  {n}")
+
+    eager = [n for n in LAZY_MODULES if n in names]
+    if eager:
+        print(f"\nERROR: lazily-loaded modules imported at init: {', '.join(eager)}")
+
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump({"python": sys.version.split()[0], "runs": args.runs,
+                       "import_ms": round(entry_ms, 1), "process_ms": round(statistics.median(walls), 1),
+                       "modules_ms": {n: round(median_cum[n] / 1000, 1) for n in top_level[:args.top] + own}},
+                      f, indent=2, ensure_ascii=False)
+            f.write("\n")
+        print(f"\nbaseline written to {args.baseline}")
+
+    return 1 if eager else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
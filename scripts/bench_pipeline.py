@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+End-to-end offline benchmark of the news pipeline.
+
+Starts scripts/replay_server.py in-process, points the bot at it via
+HTTP_REPLAY_URL, and runs the same steps as news_bot.main() (collect → filter →
+dedup → LLM selection → Telegram → SQLite save) against a throwaway copy of
+web/data/news.db and a fresh state DB per run. The bot's date is pinned to the
+fixture date so recorded responses pass the date filters.
+
+Reports per run and as the median over runs:
+- wall time per stage (from run_metrics spans) and total
+- external calls, 429/5xx responses seen by the bot
+- LLM prompt/completion tokens (usage reported by the stand-in or recording)
+- Python heap peak (tracemalloc) and process max RSS
+
+Usage:
+    python scripts/bench_pipeline.py
+    python scripts/bench_pipeline.py --repeat 5 --latency-ms 80 --jitter-ms 40
+    python scripts/bench_pipeline.py --rate-5xx 0.1 --drop-rate 0.3 --chunk-ms 5
+    python scripts/bench_pipeline.py --no-streaming --json results.json
+    SELECTION_MODE=sharded python scripts/bench_pipeline.py
+    python scripts/bench_pipeline.py --host-down api.groq.com        # failover to the stand-in provider
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import resource
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from pathlib import Path
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import replay_server  # noqa: E402
+
+STAGES = ("collect", "filter", "dedup", "cross_day_dedup", "llm_selection", "telegram", "save_sqlite", "run")
+
+
+def configure_env(base_url: str, workdir: str, streaming: bool) -> None:
+    """Everything news_bot reads at import time must be set before importing it."""
+    os.environ.update({
+        "HTTP_REPLAY_URL": base_url,
+        "NEWS_BOT_STATE_DB": os.path.join(workdir, "state.db"),
+        "NEWS_BOT_SEARCH_DB": os.path.join(workdir, "search.db"),
+        "RUN_METRICS_LOG": "false",
+        "LLM_CACHE_BYPASS": "true",
+        "LLM_STREAMING": "true" if streaming else "false",
+        "NAVER_CLIENT_ID": "replay", "NAVER_CLIENT_SECRET": "replay",
+        "TAVILY_API_KEY": "replay", "GROQ_API_KEY": "replay", "OPENAI_API_KEY": "replay",
+        # Backup selection provider: no recordings, always answered by the stand-in model
+        "SELECTION_PROVIDERS": "groq,local",
+        "LOCAL_LLM_URL": "http://llm.stand-in/v1/chat/completions",
+        "TELEGRAM_BOT_TOKEN": "0:replay", "TELEGRAM_CHAT_ID": "1",
+    })
+    os.environ.pop("HTTP_RECORD_FILE", None)
+
+
+def run_once(nb, run_metrics, state_store, fixture_date: str, workdir: str, run_no: int, trace_memory: bool) -> dict:
+    # Fresh state (cursors, caches) and news.db copy so every run does the same work.
+    state_store.STATE_DB_PATH = Path(workdir) / f"state-{run_no}.db"
+    db_copy = Path(workdir) / f"news-{run_no}.db"
+    shutil.copy(os.path.join(ROOT, "web", "data", "news.db"), db_copy)
+    nb.NEWS_DB_PATH = db_copy
+
+    nb.NOW = datetime.fromisoformat(fixture_date).replace(hour=7, minute=20, tzinfo=nb.KST)
+    nb.TODAY_STR = nb.NOW.strftime("%Y-%m-%d")
+    nb.YESTERDAY = (nb.NOW - timedelta(days=1)).strftime("%Y-%m-%d")
+
+    run_metrics.start_run(nb.TODAY_STR)
+    if trace_memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    with run_metrics.span("run"):
+        final_news, _ = nb.process_news()
+        if final_news:
+            with run_metrics.span("telegram"):
+                nb.send_telegram(final_news)
+            with run_metrics.span("save_sqlite"):
+                nb.save_to_sqlite(final_news, "", nb.TODAY_STR)
+    total = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1] if trace_memory else 0
+    if trace_memory:
+        tracemalloc.stop()
+
+    records = run_metrics.records()
+    stage_ms = {}
+    for stage in STAGES:
+        # Parallel sides (국내/해외) overlap in time, so report the slower one.
+        durations = [r["duration_ms"] for r in records if r["kind"] == "stage" and r["name"] == stage]
+        stage_ms[stage] = max(durations) if durations else None
+    calls = [r for r in records if r["kind"] == "call"]
+    return {
+        "run": run_no,
+        "total_s": total,
+        "stage_ms": stage_ms,
+        "articles": len(final_news),
+        "calls": len(calls),
+        "status_429": sum(1 for r in calls if r.get("status") == "429"),
+        "status_5xx": sum(1 for r in calls if str(r.get("status", "")).startswith("5")),
+        "prompt_tokens": sum(r.get("prompt_tokens") or 0 for r in calls),
+        "completion_tokens": sum(r.get("completion_tokens") or 0 for r in calls),
+        "heap_peak_mb": peak / 1e6,
+    }
+
+
+def fmt(value, spec: str) -> str:
+    return "-" if value is None else format(value, spec)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--fixture", default=replay_server.FIXTURE)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--no-streaming", action="store_true")
+    parser.add_argument("--no-tracemalloc", action="store_true", help="skip heap tracing (it slows Python code ~2x)")
+    parser.add_argument("--json", help="also write raw results to this file")
+    replay_server.add_fault_arguments(parser)
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="bench_pipeline_")
+    server, state = replay_server.start_server(args.fixture, args)
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    configure_env(base_url, workdir, streaming=not args.no_streaming)
+    fixture_date = state.meta.get("date") or datetime.now().strftime("%Y-%m-%d")
+
+    import logging
+    import_start = time.perf_counter()
+    import news_bot as nb
+    import run_metrics
+    import state_store
+    import_s = time.perf_counter() - import_start
+    logging.getLogger().setLevel(logging.WARNING)
+
+    print(f"fixture: {args.fixture} (date {fixture_date}), replay server {base_url}, import news_bot {import_s:.2f}s")
+    header = ["run", "total_s", *STAGES, "calls", "429", "5xx", "prompt_tok", "compl_tok", "heap_mb", "articles"]
+    print("  ".join(f"{h:>13}" for h in header))
+
+    results = []
+    try:
+        for run_no in range(1, args.repeat + 1):
+            r = run_once(nb, run_metrics, state_store, fixture_date, workdir, run_no, not args.no_tracemalloc)
+            results.append(r)
+            cells = [r["run"], fmt(r["total_s"], ".3f"), *(fmt(r["stage_ms"][s], ".1f") for s in STAGES),
+                     r["calls"], r["status_429"], r["status_5xx"], r["prompt_tokens"], r["completion_tokens"],
+                     fmt(r["heap_peak_mb"], ".1f"), r["articles"]]
+            print("  ".join(f"{str(c):>13}" for c in cells))
+    finally:
+        server.shutdown()
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    median_stage = {
+        s: statistics.median([r["stage_ms"][s] for r in results if r["stage_ms"][s] is not None] or [0])
+        for s in STAGES
+    }
+    cells = ["median", fmt(statistics.median(r["total_s"] for r in results), ".3f"),
+             *(fmt(median_stage[s], ".1f") for s in STAGES)]
+    print("  ".join(f"{str(c):>13}" for c in cells))
+    max_rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(f"max RSS {max_rss_mb:.1f} MB; replay server: {json.dumps(state.stats)}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"fixture": args.fixture, "args": vars(args), "import_s": import_s,
+                       "max_rss_mb": max_rss_mb, "server": state.stats, "runs": results}, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
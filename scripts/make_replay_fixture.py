@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Synthesize an offline replay fixture from web/data/news.db.
+
+Builds paged Naver search results per keyword and a Tavily search response out of
+previously briefed articles, re-dated to the 36 hours before the fixture date,
+so scripts/replay_server.py can stand in for the collectors without network
+access. LLM and Telegram responses are left to the replay server's stand-ins.
+A recording made with HTTP_RECORD_FILE is a drop-in replacement.
+
+The Naver query parameters must match the bot's request exactly, so keep
+NAVER_PAGE_SIZE at its default (50) when replaying this fixture.
+
+Usage:
+    python scripts/make_replay_fixture.py                      # -> scripts/fixtures/replay_sample.jsonl
+    python scripts/make_replay_fixture.py --domestic 300 --overseas 40 --out /tmp/big.jsonl
+"""
+from __future__ import annotations
+
+import argparse
+import datetime as dt
+import json
+import os
+import random
+import sqlite3
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DB_PATH = os.path.join(ROOT, "web", "data", "news.db")
+OUT = os.path.join(ROOT, "scripts", "fixtures", "replay_sample.jsonl")
+
+# Mirrors news_bot.NAVER_KEYWORDS / NAVER_PAGE_SIZE (kept literal so this script needs no API deps).
+NAVER_KEYWORDS = ["AI보안", "정보보호", "해킹", "개인정보유출", "금융보안", "랜섬웨어", "개인정보보호법", "KISA 사이버"]
+NAVER_PAGE_SIZE = 50
+KST = dt.timezone(dt.timedelta(hours=9))
+
+
+def keyword_terms(keyword: str) -> list[str]:
+    return [t.lower() for t in keyword.replace("보안", " 보안").split() if len(t) >= 2]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--db", default=DB_PATH)
+    parser.add_argument("--out", default=OUT)
+    parser.add_argument("--domestic", type=int, default=160, help="domestic articles spread over the keywords")
+    parser.add_argument("--overseas", type=int, default=30)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    conn = sqlite3.connect(f"file:{args.db}?mode=ro", uri=True)
+    try:
+        date = conn.execute("SELECT MAX(date) FROM articles").fetchone()[0]
+        domestic = conn.execute(
+            "SELECT title, url, summary FROM articles WHERE category = '[국내]' ORDER BY date DESC, id DESC LIMIT ?",
+            (args.domestic,)
+        ).fetchall()
+        overseas = conn.execute(
+            """SELECT COALESCE(NULLIF(title_original, ''), title), url, summary FROM articles
+               WHERE category = '[해외]' ORDER BY date DESC, id DESC LIMIT ?""",
+            (args.overseas,)
+        ).fetchall()
+    finally:
+        conn.close()
+
+    run_at = dt.datetime.fromisoformat(date).replace(hour=7, tzinfo=KST)
+
+    # Assign each article a publish time in the 36h window and the keywords it would match.
+    pages: dict[str, list[dict]] = {kw: [] for kw in NAVER_KEYWORDS}
+    for i, (title, url, summary) in enumerate(domestic):
+        published = run_at - dt.timedelta(minutes=rng.randint(5, 36 * 60))
+        item = {
+            "title": title,
+            "originallink": url,
+            "link": url,
+            "description": summary or "",
+            "pubDate": published.strftime("%a, %d %b %Y %H:%M:%S +0900"),
+        }
+        text = f"{title} {summary}".lower()
+        matched = [kw for kw in NAVER_KEYWORDS if any(t in text for t in keyword_terms(kw))]
+        for kw in matched or [NAVER_KEYWORDS[i % len(NAVER_KEYWORDS)]]:
+            pages[kw].append(item)
+
+    with open(args.out, "w", encoding="utf-8") as f:
+        f.write(json.dumps({"meta": {"date": date, "source": "news.db", "seed": args.seed,
+                                     "domestic": len(domestic), "overseas": len(overseas)}}, ensure_ascii=False) + "\n")
+        for kw, items in pages.items():
+            items.sort(key=lambda it: dt.datetime.strptime(it["pubDate"], "%a, %d %b %Y %H:%M:%S %z"), reverse=True)
+            # One entry per page the bot may request (start = 1, 51, ...); always at least one.
+            for start in range(1, max(len(items), 1) + 1, NAVER_PAGE_SIZE):
+                page = items[start - 1:start - 1 + NAVER_PAGE_SIZE]
+                body = {"lastBuildDate": run_at.strftime("%a, %d %b %Y %H:%M:%S +0900"), "total": len(items),
+                        "start": start, "display": len(page), "items": page}
+                f.write(json.dumps({
+                    "method": "GET", "host": "openapi.naver.com", "path": "/v1/search/news.json",
+                    "query": {"query": kw, "display": str(NAVER_PAGE_SIZE), "start": str(start), "sort": "date"},
+                    "status": 200, "headers": {"Content-Type": "application/json"},
+                    "body": json.dumps(body, ensure_ascii=False),
+                }, ensure_ascii=False) + "\n")
+
+        results = []
+        for title, url, summary in overseas:
+            published = run_at - dt.timedelta(minutes=rng.randint(5, 36 * 60))
+            results.append({"title": title, "url": url, "content": summary or "", "score": 0.5,
+                            "published_date": published.astimezone(dt.timezone.utc).strftime("%a, %d %b %Y %H:%M:%S GMT")})
+        f.write(json.dumps({
+            "method": "POST", "host": "api.tavily.com", "path": "/search", "query": {},
+            "status": 200, "headers": {"Content-Type": "application/json"},
+            "body": json.dumps({"query": "Cyber Security Breach Hacking News", "results": results}, ensure_ascii=False),
+        }, ensure_ascii=False) + "\n")
+
+    print(f"wrote {args.out}: date {date}, {sum(len(v) for v in pages.values())} naver items "
+          f"over {len(pages)} keywords, {len(results)} tavily results")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
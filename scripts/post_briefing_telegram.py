@@ -2,12 +2,14 @@
 """
 Post today's briefing to Telegram.
 
-Triggered by GitHub Actions on push to web/data/news.db.
+Triggered by GitHub Actions on push to web/data/news.db (or, in the monthly
+layout, to web/data/news/*.db).
 Runs on GitHub infra (unrestricted internet), so api.telegram.org is reachable —
 unlike the Cowork sandbox, which is allowlist-blocked.
 
 Responsibilities (minimal — delivery only):
-- Read daily_briefings row for today's KST date from web/data/news.db.
+- Read daily_briefings row for today's KST date from web/data/news.db, or from
+  that month's shard (web/data/news/YYYY-MM.db) when the DB is partitioned.
 - If no row for today, exit 0 (nothing to deliver — this is a non-briefing push).
 - Build 3 Telegram blocks (article list, 종합요약, Vercel link).
 - Convert markdown bold (**...**) to Telegram HTML (<b>...</b>), escape HTML-sensitive chars.
@@ -30,6 +32,11 @@ import time
 
 import requests
 
+# Shared HTTP client from the repo root — keeps one connection alive across chunk sends.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import http_client  # noqa: E402
+import news_store  # noqa: E402
+
 DB_PATH = "web/data/news.db"
 KST = dt.timezone(dt.timedelta(hours=9))
 CHUNK = 4000
@@ -99,7 +106,7 @@ def send(token: str, chat_id: str, text: str) -> None:
     }
     for attempt in range(1, 4):
         try:
-            r = requests.post(url, data=payload, timeout=30)
+            r = http_client.post(url, data=payload, timeout=30)
             if r.ok:
                 return
             print(f"[WARN] Telegram send attempt {attempt} failed: {r.status_code} {r.text[:200]}", file=sys.stderr)
@@ -132,11 +139,12 @@ def main() -> int:
     today = dt.datetime.now(KST).strftime("%Y-%m-%d")
     print(f"[INFO] Target date: {today} KST")
 
-    if not os.path.exists(DB_PATH):
-        print(f"[ERROR] DB not found: {DB_PATH}", file=sys.stderr)
+    db_path = news_store.date_db_path(DB_PATH, today)
+    if not os.path.exists(db_path):
+        print(f"[ERROR] DB not found: {db_path}", file=sys.stderr)
         return 1
 
-    conn = sqlite3.connect(DB_PATH)
+    conn = sqlite3.connect(db_path)
     cur = conn.cursor()
 
     row = cur.execute(
@@ -32,6 +32,7 @@ rm -f .git/index.lock .git/HEAD.lock .git/config.lock .git/packed-refs.lock || t
 find .git/refs -name "*.lock" -type f -delete 2>/dev/null || true
 # sqlite journal
 rm -f web/data/news.db-journal web/data/news.db-shm web/data/news.db-wal || true
+rm -f web/data/news/*.db-journal web/data/news/*.db-shm web/data/news/*.db-wal || true
 # git process가 실제로 실행 중인지 확인 (있으면 안전상 중단)
 if pgrep -f "git .* $REPO_ROOT" >/dev/null 2>&1; then
   echo "[x] 다른 git 프로세스가 실행 중입니다. 중단합니다."
@@ -44,6 +45,8 @@ fi
 # ──────────────────────────────────────────────────────────────────
 TARGETS=(
   "web/data/news.db"
+  "web/data/news"
+  "web/data/daily"
   "scripts/post_briefing_telegram.py"
   "scripts/push_today.sh"
   "scripts/push_today_v2.sh"
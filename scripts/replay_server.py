@@ -0,0 +1,325 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for Naver, Tavily, Groq, OpenAI and Telegram.
+
+Replays recorded API responses from a JSONL fixture so the pipeline can run
+fully offline. Point the bot at it with HTTP_REPLAY_URL; http_client rewrites
+every request to {HTTP_REPLAY_URL}/{original host}{path}.
+
+Fixture format (one JSON object per line):
+    {"meta": {"date": "2026-08-21", ...}}                         # optional, first line
+    {"method": "GET", "host": "openapi.naver.com", "path": "/v1/search/news.json",
+     "query": {"query": "해킹", "start": "1", ...}, "status": 200,
+     "headers": {"Content-Type": "application/json"}, "body": "..."}
+
+Record one from live APIs with HTTP_RECORD_FILE=path (see http_client.py), or
+synthesize one from web/data/news.db with scripts/make_replay_fixture.py.
+
+Matching: requests are keyed by (method, host, path, query). Responses recorded
+under the same key are replayed in order and the last one repeats. Chat
+completion requests with no recorded response are answered by a stand-in
+model that picks the first 7 domestic and 3 overseas rows of the candidate
+table (or, for shard scoring prompts, scores every row), streaming SSE when
+the request asks for it. Telegram defaults to ok.
+
+Fault injection (seeded, per request):
+    --latency-ms / --jitter-ms   added before every response
+    --rate-429 / --rate-5xx      probability of a 429 (with Retry-After) or 503
+    --drop-rate                  probability of cutting an SSE stream midway
+    --chunk-ms                   delay between SSE chunks
+    --host-latency-ms HOST=MS    extra latency for one upstream host (repeatable)
+    --host-down HOST             answer every request to HOST with 503 (repeatable)
+
+The bot's local stand-in provider (llm_providers "local") points at the
+made-up host llm.stand-in, which has no recordings and is always answered by
+the stand-in model - e.g. --host-down api.groq.com exercises failover and
+--host-latency-ms api.groq.com=3000 exercises hedged requests.
+
+Usage:
+    python scripts/replay_server.py --fixture scripts/fixtures/replay_sample.jsonl --port 8765
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import re
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import http_client  # noqa: E402
+import prompt_codec  # noqa: E402
+
+FIXTURE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "replay_sample.jsonl")
+
+CHAT_PATH_SUFFIX = "/chat/completions"
+TABLE_ROW = re.compile(r"^(\d+)\|(국내|해외)\|", re.M)
+SCORING_FORMAT = '"s": 점수'
+CONTINUATION = re.compile(r"이미 선별된 id: \[([\d, ]*)\].*?\[국내\] (\d+)개, \[해외\] (\d+)개", re.S)
+
+
+def load_fixture(path: str) -> tuple[dict, dict[tuple, list[dict]]]:
+    meta: dict = {}
+    entries: dict[tuple, list[dict]] = {}
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            if "meta" in entry:
+                meta = entry["meta"]
+                continue
+            entries.setdefault(request_key(entry["method"], entry["host"], entry["path"], entry.get("query", {})), []).append(entry)
+    return meta, entries
+
+
+def request_key(method: str, host: str, path: str, query: dict) -> tuple:
+    return method.upper(), host, http_client.redact_path(path), tuple(sorted(query.items()))
+
+
+def stand_in_selection(messages: list[dict]) -> str:
+    """Pick the first 7 domestic / 3 overseas table rows, like a well-behaved model.
+
+    Continuation requests (news_bot.build_continuation_request) are honoured:
+    already-selected ids are skipped and only the requested counts are returned.
+    """
+    prompt = "\n".join(m.get("content", "") for m in messages if m.get("role") == "user")
+    rows = TABLE_ROW.findall(prompt)
+    want_kr, want_en, done = 7, 3, set()
+    continuation = CONTINUATION.search(messages[-1].get("content", "")) if messages else None
+    if continuation:
+        done = {int(i) for i in re.findall(r"\d+", continuation.group(1))}
+        want_kr, want_en = int(continuation.group(2)), int(continuation.group(3))
+    picks = ([int(i) for i, kind in rows if kind == "국내" and int(i) not in done][:want_kr]
+             + [int(i) for i, kind in rows if kind == "해외" and int(i) not in done][:want_en])
+    return json.dumps(
+        [{"id": i, "title": f"선별 기사 {i}", "summary": f"재생 서버가 생성한 {i}번 기사 요약입니다."} for i in picks],
+        ensure_ascii=False
+    )
+
+
+def stand_in_scores(messages: list[dict]) -> str:
+    """Score every table row (news_bot.score_shard), earlier rows higher."""
+    prompt = "\n".join(m.get("content", "") for m in messages if m.get("role") == "user")
+    rows = TABLE_ROW.findall(prompt)
+    return json.dumps([{"id": int(i), "s": max(0, 20 - int(i))} for i, _ in rows])
+
+
+def stand_in_analysis(messages: list[dict]) -> str:
+    return "## 1. 요약: 재생 서버 분석\n\n### A. 테마\n분석 내용 [1][2]\n\n## 2. 전략적 제언\n\n## 3. 생각해볼 질문\n"
+
+
+class ReplayState:
+    def __init__(self, meta: dict, entries: dict[tuple, list[dict]], args: argparse.Namespace):
+        self.meta = meta
+        self.entries = entries
+        self.args = args
+        self.rng = random.Random(args.seed)
+        self.lock = threading.Lock()
+        self.cursor: dict[tuple, int] = {}
+        self.stats = {"requests": 0, "replayed": 0, "synthesized": 0, "missing": 0,
+                      "injected_429": 0, "injected_5xx": 0, "dropped_streams": 0}
+
+    def next_entry(self, key: tuple) -> dict | None:
+        with self.lock:
+            recorded = self.entries.get(key)
+            if not recorded:
+                return None
+            i = self.cursor.get(key, 0)
+            self.cursor[key] = i + 1
+            return recorded[min(i, len(recorded) - 1)]
+
+    def roll(self, rate: float) -> bool:
+        with self.lock:
+            return rate > 0 and self.rng.random() < rate
+
+    def count(self, name: str) -> None:
+        with self.lock:
+            self.stats[name] += 1
+
+
+class ReplayHandler(BaseHTTPRequestHandler):
+    server_version = "ReplayServer/1.0"
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, fmt: str, *args) -> None:
+        if self.server.state.args.verbose:
+            super().log_message(fmt, *args)
+
+    def do_GET(self) -> None:
+        self.handle_request("GET")
+
+    def do_POST(self) -> None:
+        self.handle_request("POST")
+
+    def handle_request(self, method: str) -> None:
+        state: ReplayState = self.server.state
+        args = state.args
+        state.count("requests")
+
+        length = int(self.headers.get("Content-Length") or 0)
+        raw_body = self.rfile.read(length) if length else b""
+        parsed = urlparse(self.path)
+        host, _, path = parsed.path.lstrip("/").partition("/")
+        path = "/" + path
+        query = dict(parse_qsl(parsed.query))
+
+        delay = args.latency_ms + (state.rng.uniform(0, args.jitter_ms) if args.jitter_ms else 0)
+        delay += dict(args.host_latency_ms).get(host, 0.0)
+        if delay:
+            time.sleep(delay / 1000)
+
+        if host in args.host_down:
+            state.count("injected_5xx")
+            return self.send_body(503, {"Content-Type": "application/json"},
+                                  json.dumps({"error": {"message": "injected host outage"}}))
+        if state.roll(args.rate_429):
+            state.count("injected_429")
+            return self.send_body(429, {"Retry-After": "1", "Content-Type": "application/json"},
+                                  json.dumps({"error": {"message": "injected rate limit"}}))
+        if state.roll(args.rate_5xx):
+            state.count("injected_5xx")
+            return self.send_body(503, {"Content-Type": "application/json"},
+                                  json.dumps({"error": {"message": "injected outage"}}))
+
+        request_json: dict = {}
+        if raw_body:
+            try:
+                request_json = json.loads(raw_body)
+            except ValueError:
+                request_json = {}
+
+        entry = state.next_entry(request_key(method, host, path, query))
+        if entry is not None:
+            state.count("replayed")
+            if entry.get("headers", {}).get("Content-Type", "").startswith("text/event-stream"):
+                return self.send_sse_raw(entry["body"])
+            return self.send_body(entry["status"], entry.get("headers", {}), entry["body"])
+
+        if path.endswith(CHAT_PATH_SUFFIX):
+            state.count("synthesized")
+            messages = request_json.get("messages", [])
+            is_selection = any(prompt_codec.TABLE_HEADER in m.get("content", "") for m in messages)
+            is_scoring = is_selection and any(SCORING_FORMAT in m.get("content", "") for m in messages)
+            if is_scoring:
+                content = stand_in_scores(messages)
+            elif is_selection:
+                content = stand_in_selection(messages)
+            else:
+                content = stand_in_analysis(messages)
+            prompt_tokens = sum(prompt_codec.estimate_tokens(m.get("content", "")) for m in messages)
+            usage = {"prompt_tokens": prompt_tokens, "completion_tokens": prompt_codec.estimate_tokens(content)}
+            if request_json.get("stream"):
+                return self.send_sse(content, usage)
+            return self.send_body(200, {"Content-Type": "application/json"}, json.dumps({
+                "choices": [{"message": {"role": "assistant", "content": content}, "finish_reason": "stop"}],
+                "usage": usage,
+            }, ensure_ascii=False))
+
+        if host == "api.telegram.org":
+            state.count("synthesized")
+            return self.send_body(200, {"Content-Type": "application/json"}, json.dumps({"ok": True, "result": {}}))
+
+        state.count("missing")
+        return self.send_body(404, {"Content-Type": "application/json"},
+                              json.dumps({"error": f"no fixture for {method} {host}{path}"}))
+
+    def send_body(self, status: int, headers: dict, body: str) -> None:
+        data = body.encode("utf-8")
+        self.send_response(status)
+        for k, v in headers.items():
+            if k.lower() not in ("content-length", "transfer-encoding", "connection"):
+                self.send_header(k, v)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def start_stream(self) -> None:
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        self.close_connection = True
+
+    def send_sse(self, content: str, usage: dict) -> None:
+        state: ReplayState = self.server.state
+        self.start_stream()
+        pieces = [content[i:i + 24] for i in range(0, len(content), 24)]
+        drop_at = state.rng.randrange(1, max(2, len(pieces))) if state.roll(state.args.drop_rate) else None
+        for n, piece in enumerate(pieces):
+            if drop_at is not None and n == drop_at:
+                state.count("dropped_streams")
+                return
+            self.write_event({"choices": [{"delta": {"content": piece}, "finish_reason": None}]})
+        self.write_event({"choices": [{"delta": {}, "finish_reason": "stop"}], "usage": usage})
+        self.wfile.write(b"data: [DONE]\n\n")
+
+    def send_sse_raw(self, body: str) -> None:
+        self.start_stream()
+        for line in body.splitlines(keepends=True):
+            self.wfile.write(line.encode("utf-8"))
+            if line.startswith("data:") and self.server.state.args.chunk_ms:
+                time.sleep(self.server.state.args.chunk_ms / 1000)
+
+    def write_event(self, event: dict) -> None:
+        self.wfile.write(f"data: {json.dumps(event, ensure_ascii=False)}\n\n".encode("utf-8"))
+        self.wfile.flush()
+        if self.server.state.args.chunk_ms:
+            time.sleep(self.server.state.args.chunk_ms / 1000)
+
+
+def host_ms(value: str) -> tuple[str, float]:
+    host, _, ms = value.partition("=")
+    return host, float(ms)
+
+
+def add_fault_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--rate-429", type=float, default=0.0)
+    parser.add_argument("--rate-5xx", type=float, default=0.0)
+    parser.add_argument("--drop-rate", type=float, default=0.0)
+    parser.add_argument("--chunk-ms", type=float, default=0.0)
+    parser.add_argument("--host-latency-ms", type=host_ms, action="append", default=[], metavar="HOST=MS")
+    parser.add_argument("--host-down", action="append", default=[], metavar="HOST")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--verbose", action="store_true")
+
+
+def start_server(fixture: str, args: argparse.Namespace, port: int = 0) -> tuple[ThreadingHTTPServer, ReplayState]:
+    """Start the replay server on a background thread. Returns (server, state)."""
+    meta, entries = load_fixture(fixture)
+    server = ThreadingHTTPServer(("127.0.0.1", port), ReplayHandler)
+    server.daemon_threads = True
+    server.state = ReplayState(meta, entries, args)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, server.state
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--fixture", default=FIXTURE)
+    parser.add_argument("--port", type=int, default=8765)
+    add_fault_arguments(parser)
+    args = parser.parse_args()
+
+    server, state = start_server(args.fixture, args, args.port)
+    print(f"replaying {args.fixture} ({sum(len(v) for v in state.entries.values())} responses) "
+          f"on http://127.0.0.1:{server.server_address[1]}")
+    print(f"export HTTP_REPLAY_URL=http://127.0.0.1:{server.server_address[1]}")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
+        print(json.dumps(state.stats))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Summarise the run_metrics table across days.
+
+One line per run: total wall time, per-stage time (collect, llm_selection,
+telegram, save_sqlite), external-call counts, 429/5xx responses and LLM token
+usage. Use it to spot slow days, regressions after a deploy, or 429 storms.
+
+Usage:
+    python scripts/run_metrics_report.py               # last 14 days
+    python scripts/run_metrics_report.py --days 60
+    python scripts/run_metrics_report.py --db /tmp/news.db
+"""
+from __future__ import annotations
+
+import argparse
+import datetime as dt
+import os
+import sqlite3
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import news_store  # noqa: E402
+
+DB_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "web", "data", "news.db")
+
+STAGES = ("collect", "llm_selection", "telegram", "save_sqlite")
+
+QUERY = """
+SELECT
+    run_id,
+    MIN(run_date),
+    MAX(CASE WHEN kind = 'stage' AND name = 'run' THEN duration_ms END),
+    {stage_columns},
+    SUM(CASE WHEN kind = 'call' THEN 1 ELSE 0 END),
+    SUM(CASE WHEN kind = 'call' AND status = '429' THEN 1 ELSE 0 END),
+    SUM(CASE WHEN kind = 'call' AND status GLOB '5[0-9][0-9]' THEN 1 ELSE 0 END),
+    SUM(CASE WHEN kind = 'call' AND status = 'error' THEN 1 ELSE 0 END),
+    COALESCE(SUM(prompt_tokens), 0),
+    COALESCE(SUM(completion_tokens), 0)
+FROM run_metrics
+WHERE run_date >= date('now', ?)
+GROUP BY run_id
+ORDER BY MIN(created_at)
+"""
+
+
+def fmt_ms(value: float | None) -> str:
+    return "-" if value is None else f"{value / 1000:.1f}s"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--db", default=DB_PATH)
+    parser.add_argument("--days", type=int, default=14)
+    args = parser.parse_args()
+
+    # collect runs once per side in parallel, so report the slower side.
+    stage_columns = ",\n    ".join(
+        f"MAX(CASE WHEN kind = 'stage' AND name = '{stage}' THEN duration_ms END)" for stage in STAGES
+    )
+    # Partitioned (monthly) layout keeps run_metrics in each month's shard.
+    since = (dt.date.today() - dt.timedelta(days=args.days)).isoformat()
+    db_paths = news_store.article_db_paths(args.db, since) if news_store.is_partitioned(args.db) else [args.db]
+    rows = []
+    found = False
+    for db_path in db_paths:
+        conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+        try:
+            rows.extend(conn.execute(QUERY.format(stage_columns=stage_columns), (f"-{args.days} days",)).fetchall())
+            found = True
+        except sqlite3.OperationalError as e:
+            print(f"no run metrics in {db_path}: {e}", file=sys.stderr)
+        finally:
+            conn.close()
+    if not found:
+        return 1
+
+    header = ["date", "run", *STAGES, "calls", "429", "5xx", "conn_err", "prompt_tok", "compl_tok", "run_id"]
+    print("  ".join(f"{h:>13}" for h in header))
+    for run_id, run_date, run_ms, *rest in rows:
+        stage_ms = rest[:len(STAGES)]
+        calls, r429, r5xx, errors, prompt_tok, compl_tok = rest[len(STAGES):]
+        cells = [run_date, fmt_ms(run_ms), *(fmt_ms(v) for v in stage_ms),
+                 calls, r429, r5xx, errors, prompt_tok, compl_tok, run_id]
+        print("  ".join(f"{str(c):>13}" for c in cells))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
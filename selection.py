@@ -0,0 +1,269 @@
+"""
+샤드 방식 LLM 선별 (map-reduce)의 분할·병합 로직
+
+후보 전체를 한 프롬프트에 넣는 대신, 구분(국내/해외)별 우선순위 순서를 유지한 채
+고정 크기 샤드로 나눠 같은 점수 기준으로 동시에 채점하고(기사당 숫자 하나만 출력),
+점수를 모아 결정적으로 국내 7개 + 해외 3개를 고릅니다. 요약·번역은 뽑힌 기사에만 작성합니다.
+    - 후보가 수백 개로 늘어도 지연 시간은 가장 느린 샤드 하나 수준으로 유지
+    - 한 샤드가 429·깨진 응답으로 실패해도 나머지 샤드의 점수로 선별을 계속
+      (채점되지 않은 기사는 채점된 기사 뒤에 로컬 우선순위 순서로 붙음)
+
+tiered 모드는 로컬 우선순위 점수가 확실히 높거나 낮은 국내 기사를 LLM 없이 결정하고
+경합 구간만 같은 샤드 채점으로 보냅니다. 경계 부근의 확정 기사 일부도 함께 채점해
+로컬 결정과 LLM 판단의 일치율을 기록하므로 임계값을 조정할 근거가 남습니다.
+
+batch 모드도 선택한 id만 돌려받아 pick_ids()로 후보 원본을 찾고, 요약은 같은 방식으로 따로 작성합니다.
+
+HTTP 호출과 프롬프트는 news_bot.call_groq_batch_selection() / call_groq_sharded_selection() /
+call_groq_tiered_selection()에 있고,
+이 모듈은 순수 함수만 담아 재생 서버 없이도 동작을 확인할 수 있습니다.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+import prompt_codec
+
+# (국내, 해외) 선별 목표 - 해외가 모자라면 국내로 채워 총 10개
+DEFAULT_QUOTAS: Tuple[int, int] = (7, 3)
+
+
+def is_overseas(article: Dict[str, str]) -> bool:
+    return '[해외]' in article.get('category', '')
+
+
+def split_shards(items: List[Dict[str, str]], shard_size: int) -> List[List[Dict[str, str]]]:
+    """
+    후보를 구분별로 나눈 뒤 우선순위 순서대로 shard_size개씩 자릅니다.
+
+    Args:
+        items: 후보 기사 리스트 (구분별로 우선순위 순서)
+        shard_size: 샤드당 기사 수
+
+    Returns:
+        List[List[Dict]]: 국내 샤드들 → 해외 샤드들
+    """
+    shard_size = max(1, shard_size)
+    domestic = [a for a in items if not is_overseas(a)]
+    overseas = [a for a in items if is_overseas(a)]
+    return [
+        group[i:i + shard_size]
+        for group in (domestic, overseas)
+        for i in range(0, len(group), shard_size)
+    ]
+
+
+def parse_scores(items: List[Any], table: prompt_codec.CandidateTable) -> Dict[str, float]:
+    """
+    채점 응답 원소 [{"id": 번호, "s": 점수}]를 URL → 점수로 바꿉니다.
+    알 수 없는 id나 숫자가 아닌 점수는 건너뜁니다 (그 기사는 채점되지 않은 것으로 처리).
+    """
+    scores: Dict[str, float] = {}
+    for item in items:
+        if not isinstance(item, dict):
+            continue
+        try:
+            source = table.by_id.get(int(item.get('id')))
+            score = float(item.get('s'))
+        except (TypeError, ValueError):
+            continue
+        if source is not None and source.get('url'):
+            scores[source['url']] = score
+    return scores
+
+
+def pick_ids(items: List[Any], table: prompt_codec.CandidateTable) -> List[Dict[str, str]]:
+    """
+    선별 응답 원소 [{"id": 번호}]를 후보 원본으로 바꿉니다.
+    알 수 없는 id와 중복은 건너뛰고, 국내 → 해외 순서로 돌려줍니다 (구분 안에서는 응답 순서).
+    """
+    picked: List[Dict[str, str]] = []
+    seen = set()
+    for item in items:
+        if not isinstance(item, dict):
+            continue
+        try:
+            source = table.by_id.get(int(item.get('id')))
+        except (TypeError, ValueError):
+            continue
+        if source is None or source.get('url') in seen:
+            continue
+        seen.add(source.get('url'))
+        picked.append(source)
+    return [a for a in picked if not is_overseas(a)] + [a for a in picked if is_overseas(a)]
+
+
+def rank(items: List[Dict[str, str]], scores: Dict[str, float]) -> List[Dict[str, str]]:
+    """점수 높은 순 (같은 점수는 원래 우선순위 순), 채점되지 않은 기사는 뒤에 원래 순서로."""
+    scored = [a for a in items if a.get('url') in scores]
+    unscored = [a for a in items if a.get('url') not in scores]
+    scored.sort(key=lambda a: -scores[a['url']])  # 안정 정렬
+    return scored + unscored
+
+
+def merge_scored(
+    items: List[Dict[str, str]],
+    scores: Dict[str, float],
+    quotas: Tuple[int, int] = DEFAULT_QUOTAS,
+    min_score: Optional[float] = None
+) -> List[Dict[str, str]]:
+    """
+    샤드 점수를 모아 국내·해외 목표 수만큼 고릅니다 (결정적).
+
+    Args:
+        items: 전체 후보 (구분별로 우선순위 순서)
+        scores: URL → LLM 점수 (실패한 샤드의 기사는 없음)
+        quotas: (국내, 해외) 목표 수
+        min_score: 이 점수 미만으로 채점된 기사는 제외 (None이면 제한 없음)
+
+    Returns:
+        List[Dict]: 선택된 후보 원본, 국내 → 해외 순서
+    """
+    if min_score is not None:
+        items = [a for a in items if scores.get(a.get('url'), min_score) >= min_score]
+    return take_quotas(rank(items, scores), quotas)
+
+
+def take_quotas(ranked: List[Dict[str, str]], quotas: Tuple[int, int] = DEFAULT_QUOTAS) -> List[Dict[str, str]]:
+    """순위 순 후보에서 구분별 목표 수만큼 앞에서부터 고릅니다 (해외가 모자라면 국내로 채움)."""
+    domestic = [a for a in ranked if not is_overseas(a)]
+    overseas = [a for a in ranked if is_overseas(a)]
+
+    kr_quota, en_quota = quotas
+    picked_en = overseas[:en_quota]
+    # 해외 기사가 모자라면 국내 기사로 총 목표 수를 채움
+    picked_kr = domestic[:kr_quota + (en_quota - len(picked_en))]
+    return picked_kr + picked_en
+
+
+# ==========================================
+# 2단계(tiered) 선별: 로컬 점수로 확실한 기사는 직접 결정
+# ==========================================
+def split_tiers(
+    items: List[Dict[str, str]],
+    local_scores: Dict[str, float],
+    accept: float,
+    reject: float
+) -> Tuple[List[Dict[str, str]], List[Dict[str, str]], List[Dict[str, str]]]:
+    """
+    국내 후보를 로컬 점수로 확정 선택 / 경합 / 확정 제외로 나눕니다.
+    해외 기사는 한국어 키워드 점수가 의미 없으므로 모두 경합으로 둡니다.
+
+    Args:
+        items: 후보 기사 리스트 (구분별로 우선순위 순서)
+        local_scores: URL → 로컬 우선순위 점수
+        accept: 이 점수 이상이면 확정 선택
+        reject: 이 점수 미만이면 확정 제외
+
+    Returns:
+        (확정 선택 - 로컬 점수 높은 순, 경합 - 원래 순서, 확정 제외 - 로컬 점수 높은 순)
+    """
+    accepted, contested, rejected = [], [], []
+    for article in items:
+        score = local_scores.get(article.get('url'), 0)
+        if is_overseas(article) or reject <= score < accept:
+            contested.append(article)
+        elif score >= accept:
+            accepted.append(article)
+        else:
+            rejected.append(article)
+    accepted.sort(key=lambda a: -local_scores.get(a.get('url'), 0))
+    rejected.sort(key=lambda a: -local_scores.get(a.get('url'), 0))
+    return accepted, contested, rejected
+
+
+def pick_audit(
+    accepted: List[Dict[str, str]],
+    rejected: List[Dict[str, str]],
+    size: int
+) -> List[Dict[str, str]]:
+    """
+    합의도 측정용으로 LLM에도 채점을 맡길 경계 기사를 고릅니다
+    (확정 선택 중 점수가 가장 낮은 쪽 + 확정 제외 중 점수가 가장 높은 쪽, 반씩).
+    """
+    if size <= 0:
+        return []
+    from_rejected = min(len(rejected), size - min(len(accepted), size // 2))
+    from_accepted = min(len(accepted), size - from_rejected)
+    return accepted[len(accepted) - from_accepted:] + rejected[:from_rejected]
+
+
+def merge_tiered(
+    accepted: List[Dict[str, str]],
+    contested: List[Dict[str, str]],
+    scores: Dict[str, float],
+    quotas: Tuple[int, int] = DEFAULT_QUOTAS,
+    min_score: Optional[float] = None
+) -> List[Dict[str, str]]:
+    """
+    확정 선택 기사를 먼저 채우고, 남은 자리를 경합 기사의 LLM 점수 순으로 채웁니다.
+    LLM 점수가 없는 경합 기사(호출 실패)는 원래 우선순위 순서로 뒤에 붙습니다.
+    """
+    if min_score is not None:
+        contested = [a for a in contested if scores.get(a.get('url'), min_score) >= min_score]
+    return take_quotas(accepted + rank(contested, scores), quotas)
+
+
+def rank_correlation(xs: List[float], ys: List[float]) -> Optional[float]:
+    """스피어만 순위 상관계수 (동점은 평균 순위, 표본이 3개 미만이거나 분산이 없으면 None)."""
+    if len(xs) != len(ys) or len(xs) < 3:
+        return None
+
+    def ranks(values: List[float]) -> List[float]:
+        order = sorted(range(len(values)), key=lambda i: values[i])
+        result = [0.0] * len(values)
+        i = 0
+        while i < len(order):
+            j = i
+            while j + 1 < len(order) and values[order[j + 1]] == values[order[i]]:
+                j += 1
+            for k in range(i, j + 1):
+                result[order[k]] = (i + j) / 2
+            i = j + 1
+        return result
+
+    rx, ry = ranks(xs), ranks(ys)
+    mx, my = sum(rx) / len(rx), sum(ry) / len(ry)
+    cov = sum((a - mx) * (b - my) for a, b in zip(rx, ry))
+    var_x = sum((a - mx) ** 2 for a in rx)
+    var_y = sum((b - my) ** 2 for b in ry)
+    if not var_x or not var_y:
+        return None
+    return cov / (var_x * var_y) ** 0.5
+
+
+def tier_agreement(
+    accepted: List[Dict[str, str]],
+    rejected: List[Dict[str, str]],
+    local_scores: Dict[str, float],
+    llm_scores: Dict[str, float],
+    keep_score: float
+) -> Dict[str, Any]:
+    """
+    로컬 결정과 LLM 판단이 얼마나 일치하는지 계산합니다.
+
+    Args:
+        accepted / rejected: 로컬 확정 선택 / 확정 제외 기사
+        local_scores: URL → 로컬 점수
+        llm_scores: URL → LLM 점수 (경합 + 감사 표본)
+        keep_score: LLM이 이 점수 이상이면 "선택할 만함"으로 봄
+
+    Returns:
+        Dict: audited(감사 표본 수), agreed(일치 수), agreement(일치율 또는 None),
+              correlation(LLM이 채점한 국내 기사의 로컬·LLM 점수 순위 상관 또는 None)
+    """
+    audited = agreed = 0
+    for decided, keep in ((accepted, True), (rejected, False)):
+        for article in decided:
+            url = article.get('url')
+            if url in llm_scores:
+                audited += 1
+                agreed += (llm_scores[url] >= keep_score) == keep
+    urls = [url for url in llm_scores if url in local_scores]
+    return {
+        "audited": audited,
+        "agreed": agreed,
+        "agreement": agreed / audited if audited else None,
+        "correlation": rank_correlation(
+            [local_scores[url] for url in urls], [llm_scores[url] for url in urls]
+        ),
+    }
@@ -0,0 +1,359 @@
+"""
+뉴스봇 실행 상태 저장소 (SQLite)
+
+웹에 배포되는 news.db와 분리된 로컬 상태 DB입니다.
+실행 간에 유지해야 하는 수집 커서, LLM 응답 캐시, 기사별 요약, LLM 제공자별 지연 기록 등을 저장하며,
+git에는 커밋하지 않습니다.
+
+Lambda에서는 배포 패키지(/var/task)가 읽기 전용이라 기본 경로가 /tmp/state.db입니다.
+/tmp는 컨테이너가 웜 상태로 유지되는 동안만 남고, 하루 한 번 실행되는 함수는 매번
+콜드 스타트하므로 /tmp만으로는 커서·캐시·요약·지연 기록이 실행 간에 유지되지 않습니다.
+그래서 NEWS_BOT_STATE_S3_URI가 설정되어 있으면 lambda_handler가 실행 전에
+restore_from_s3()로 상태 DB를 내려받고, 실행 뒤 persist_to_s3()로 다시 올립니다
+(template.yaml은 전용 버킷을 만들어 이 값을 지정).
+
+환경변수:
+    NEWS_BOT_STATE_DB: 상태 DB 경로 (기본값: web/data/state.db, Lambda에서는 /tmp/state.db)
+    NEWS_BOT_STATE_S3_URI: 상태 DB를 보관할 S3 위치 (예: s3://bucket/state.db, 없으면 로컬 파일만 사용)
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from urllib.parse import urlparse
+from zoneinfo import ZoneInfo
+
+STATE_DB_PATH = Path(
+    os.environ.get("NEWS_BOT_STATE_DB")
+    or ("/tmp/state.db" if os.environ.get("AWS_LAMBDA_FUNCTION_NAME")
+        else Path(__file__).parent / "web" / "data" / "state.db")
+)
+
+STATE_S3_URI = os.environ.get("NEWS_BOT_STATE_S3_URI", "")
+
+KST = ZoneInfo("Asia/Seoul")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS collection_cursors (
+    source      TEXT NOT NULL,
+    keyword     TEXT NOT NULL,
+    high_water  TEXT NOT NULL,
+    updated_at  TEXT NOT NULL,
+    PRIMARY KEY (source, keyword)
+);
+
+CREATE TABLE IF NOT EXISTS llm_cache (
+    cache_key   TEXT PRIMARY KEY,
+    model       TEXT NOT NULL,
+    response    TEXT NOT NULL,
+    created_at  REAL NOT NULL,
+    expires_at  REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_llm_cache_expires ON llm_cache(expires_at);
+
+CREATE TABLE IF NOT EXISTS article_summaries (
+    url             TEXT PRIMARY KEY,
+    title           TEXT NOT NULL,
+    title_original  TEXT,
+    summary         TEXT NOT NULL,
+    updated_at      REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_article_summaries_updated ON article_summaries(updated_at);
+
+CREATE TABLE IF NOT EXISTS llm_latency (
+    provider    TEXT NOT NULL,
+    kind        TEXT NOT NULL,
+    elapsed_ms  REAL NOT NULL,
+    ok          INTEGER NOT NULL,
+    created_at  REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_llm_latency ON llm_latency(provider, kind, created_at);
+"""
+
+
+# 스키마를 이미 확인한 DB 경로 (웜 컨테이너에서는 호출마다 DDL을 반복하지 않음)
+_schema_ready: Set[str] = set()
+
+
+def connect() -> sqlite3.Connection:
+    """상태 DB에 연결하고 스키마를 보장합니다."""
+    path = str(STATE_DB_PATH)
+    if path not in _schema_ready or not os.path.exists(path):
+        STATE_DB_PATH.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(path)
+        conn.executescript(SCHEMA)
+        _schema_ready.add(path)
+        return conn
+    return sqlite3.connect(path)
+
+
+# ==========================================
+# S3 보관 (Lambda 실행 간 유지)
+# ==========================================
+# 이 프로세스가 이미 S3와 맞춘 상태인지 (웜 컨테이너는 직전 실행이 올린 파일을 그대로 가짐)
+_s3_synced = False
+
+
+def _s3_location() -> Tuple[str, str]:
+    parsed = urlparse(STATE_S3_URI)
+    if parsed.scheme != "s3" or not parsed.netloc or not parsed.path.strip("/"):
+        raise ValueError(f"NEWS_BOT_STATE_S3_URI 형식 오류: {STATE_S3_URI}")
+    return parsed.netloc, parsed.path.lstrip("/")
+
+
+def restore_from_s3() -> bool:
+    """
+    NEWS_BOT_STATE_S3_URI의 상태 DB를 STATE_DB_PATH로 내려받습니다.
+    웜 컨테이너에서 이미 맞춘 뒤라면 다시 받지 않습니다.
+
+    Returns:
+        bool: 내려받았으면 True (설정이 없거나, 이미 맞췄거나, 아직 올린 적이 없으면 False)
+    """
+    global _s3_synced
+    if not STATE_S3_URI or _s3_synced:
+        return False
+    # boto3는 Lambda 런타임에 포함되어 있고 S3 보관을 쓸 때만 필요
+    import boto3
+    from botocore.exceptions import ClientError
+
+    bucket, key = _s3_location()
+    STATE_DB_PATH.parent.mkdir(parents=True, exist_ok=True)
+    download = STATE_DB_PATH.with_name(STATE_DB_PATH.name + ".download")
+    try:
+        boto3.client("s3").download_file(bucket, key, str(download))
+    except ClientError as e:
+        if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey"):
+            _s3_synced = True
+            return False
+        raise
+    os.replace(download, STATE_DB_PATH)
+    _schema_ready.discard(str(STATE_DB_PATH))
+    _s3_synced = True
+    return True
+
+
+def persist_to_s3() -> bool:
+    """
+    상태 DB의 일관된 스냅샷(sqlite backup)을 NEWS_BOT_STATE_S3_URI에 올립니다.
+
+    Returns:
+        bool: 올렸으면 True (설정이 없거나 상태 DB가 없으면 False)
+    """
+    if not STATE_S3_URI or not STATE_DB_PATH.exists():
+        return False
+    import boto3
+
+    bucket, key = _s3_location()
+    snapshot = STATE_DB_PATH.with_name(STATE_DB_PATH.name + ".upload")
+    src = sqlite3.connect(str(STATE_DB_PATH))
+    dst = sqlite3.connect(str(snapshot))
+    try:
+        src.backup(dst)
+    finally:
+        dst.close()
+        src.close()
+    try:
+        boto3.client("s3").upload_file(str(snapshot), bucket, key)
+    finally:
+        snapshot.unlink(missing_ok=True)
+    return True
+
+
+# ==========================================
+# 수집 커서 (키워드별 high-water mark)
+# ==========================================
+def load_cursors(source: str) -> Dict[str, str]:
+    """
+    수집 소스의 키워드별 high-water mark를 읽습니다.
+
+    Args:
+        source: 수집 소스 이름 (예: "naver")
+
+    Returns:
+        Dict[str, str]: 키워드 → 마지막 성공 실행에서 본 가장 최신 발행 시각 (ISO 8601)
+    """
+    conn = connect()
+    try:
+        rows = conn.execute(
+            "SELECT keyword, high_water FROM collection_cursors WHERE source = ?",
+            (source,)
+        ).fetchall()
+    finally:
+        conn.close()
+    return dict(rows)
+
+
+def save_cursors(source: str, cursors: Dict[str, str]) -> None:
+    """
+    키워드별 high-water mark를 저장합니다. 기존 값보다 오래된 값으로는 되돌리지 않습니다.
+
+    Args:
+        source: 수집 소스 이름
+        cursors: 키워드 → 발행 시각 (ISO 8601)
+    """
+    if not cursors:
+        return
+    now_iso = datetime.now(KST).isoformat()
+    conn = connect()
+    try:
+        with conn:
+            conn.executemany(
+                """INSERT INTO collection_cursors (source, keyword, high_water, updated_at)
+                   VALUES (?, ?, ?, ?)
+                   ON CONFLICT(source, keyword) DO UPDATE SET
+                       high_water = MAX(high_water, excluded.high_water),
+                       updated_at = excluded.updated_at""",
+                [(source, kw, hw, now_iso) for kw, hw in cursors.items()]
+            )
+    finally:
+        conn.close()
+
+
+# ==========================================
+# LLM 응답 캐시 (내용 주소 기반)
+# ==========================================
+def llm_cache_key(endpoint: str, payload: Dict[str, Any]) -> str:
+    """
+    요청 내용(엔드포인트, 모델, 메시지, 샘플링 파라미터)의 해시로 캐시 키를 만듭니다.
+    프롬프트에 후보 기사가 포함되므로 후보 집합이 같아야 키가 같아집니다.
+    """
+    canonical = json.dumps(
+        {"endpoint": endpoint, "payload": payload},
+        ensure_ascii=False, sort_keys=True, separators=(",", ":")
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def llm_cache_get(cache_key: str) -> Optional[str]:
+    """만료되지 않은 캐시 응답을 반환합니다 (없으면 None)."""
+    conn = connect()
+    try:
+        row = conn.execute(
+            "SELECT response FROM llm_cache WHERE cache_key = ? AND expires_at > ?",
+            (cache_key, time.time())
+        ).fetchone()
+    finally:
+        conn.close()
+    return row[0] if row else None
+
+
+def llm_cache_put(cache_key: str, model: str, response: str, ttl_sec: float) -> None:
+    """응답을 캐시에 저장하고 만료된 항목을 정리합니다."""
+    now = time.time()
+    conn = connect()
+    try:
+        with conn:
+            conn.execute("DELETE FROM llm_cache WHERE expires_at <= ?", (now,))
+            conn.execute(
+                """INSERT OR REPLACE INTO llm_cache (cache_key, model, response, created_at, expires_at)
+                   VALUES (?, ?, ?, ?, ?)""",
+                (cache_key, model, response, now, now + ttl_sec)
+            )
+    finally:
+        conn.close()
+
+
+# ==========================================
+# 기사별 요약·번역 저장소
+# ==========================================
+def load_article_summaries(urls: Iterable[str], max_age_sec: float) -> Dict[str, Dict[str, str]]:
+    """
+    이미 요약·번역된 기사를 URL로 조회합니다.
+
+    Args:
+        urls: 조회할 기사 URL 목록
+        max_age_sec: 이보다 오래된 요약은 무시
+
+    Returns:
+        Dict[str, Dict]: URL → {"title", "title_original", "summary"}
+    """
+    urls = [u for u in set(urls) if u]
+    if not urls:
+        return {}
+    cutoff = time.time() - max_age_sec
+    found: Dict[str, Dict[str, str]] = {}
+    conn = connect()
+    try:
+        # SQLite 바인딩 변수 상한을 넘지 않도록 나눠서 조회
+        for i in range(0, len(urls), 500):
+            chunk = urls[i:i + 500]
+            placeholders = ",".join("?" * len(chunk))
+            rows = conn.execute(
+                f"""SELECT url, title, title_original, summary FROM article_summaries
+                    WHERE url IN ({placeholders}) AND updated_at > ?""",
+                (*chunk, cutoff)
+            ).fetchall()
+            for url, title, title_original, summary in rows:
+                found[url] = {"title": title, "title_original": title_original or "", "summary": summary}
+    finally:
+        conn.close()
+    return found
+
+
+def save_article_summaries(articles: List[Dict[str, str]], max_age_sec: float) -> None:
+    """선별 결과의 요약·번역을 URL 기준으로 저장하고 오래된 항목을 정리합니다."""
+    now = time.time()
+    rows = [
+        (a['url'], a['title'], a.get('title_original') or '', a['summary'], now)
+        for a in articles
+        if a.get('url') and a.get('title') and a.get('summary')
+    ]
+    conn = connect()
+    try:
+        with conn:
+            conn.execute("DELETE FROM article_summaries WHERE updated_at <= ?", (now - max_age_sec,))
+            if rows:
+                conn.executemany(
+                    """INSERT OR REPLACE INTO article_summaries
+                       (url, title, title_original, summary, updated_at) VALUES (?, ?, ?, ?, ?)""",
+                    rows
+                )
+    finally:
+        conn.close()
+
+
+# ==========================================
+# LLM 제공자별 지연·오류 기록 (헤지 기준 백분위 계산용)
+# ==========================================
+def load_llm_latencies(provider: str, kind: str, limit: int) -> List[Tuple[float, bool]]:
+    """
+    최근 호출 기록을 오래된 순으로 반환합니다.
+
+    Args:
+        provider: 제공자 이름 (예: "groq")
+        kind: 호출 종류 (예: "selection", "shard")
+        limit: 최대 개수
+
+    Returns:
+        List[Tuple[float, bool]]: (지연 ms, 성공 여부)
+    """
+    conn = connect()
+    try:
+        rows = conn.execute(
+            """SELECT elapsed_ms, ok FROM llm_latency WHERE provider = ? AND kind = ?
+               ORDER BY created_at DESC LIMIT ?""",
+            (provider, kind, limit)
+        ).fetchall()
+    finally:
+        conn.close()
+    return [(ms, bool(ok)) for ms, ok in reversed(rows)]
+
+
+def record_llm_latency(provider: str, kind: str, elapsed_ms: float, ok: bool, max_age_sec: float) -> None:
+    """호출 기록을 추가하고 오래된 기록을 정리합니다."""
+    now = time.time()
+    conn = connect()
+    try:
+        with conn:
+            conn.execute("DELETE FROM llm_latency WHERE created_at <= ?", (now - max_age_sec,))
+            conn.execute(
+                "INSERT INTO llm_latency (provider, kind, elapsed_ms, ok, created_at) VALUES (?, ?, ?, ?, ?)",
+                (provider, kind, elapsed_ms, int(ok), now)
+            )
+    finally:
+        conn.close()
@@ -0,0 +1,94 @@
+"""daily_export 매니페스트의 원본 DB 지문(source)과 어긋남 감지 단위 테스트 (임시 디렉터리의 DB만 사용)."""
+
+import gzip
+import json
+import sqlite3
+
+import pytest
+
+import daily_export
+import news_store
+
+NOW_ISO = "2026-01-01T09:00:00+09:00"
+
+
+@pytest.fixture(autouse=True)
+def auto_layout(monkeypatch):
+    monkeypatch.setattr(news_store, "LAYOUT", "")
+
+
+def articles(n=1):
+    return [{"category": "[국내]", "title": f"국내 {i}", "url": f"https://kr.example/{i}"} for i in range(n)]
+
+
+def manifest(db_path):
+    return json.loads((daily_export.export_dir(db_path) / daily_export.MANIFEST_NAME).read_text(encoding="utf-8"))
+
+
+def exported(db_path, date_str):
+    path = daily_export.export_dir(db_path) / f"{date_str}.json.gz"
+    return json.loads(gzip.decompress(path.read_bytes()))
+
+
+def save_and_export(db_path, date_str, n=1):
+    """news_bot.save_to_sqlite처럼 쓰기 전 지문을 잡고, 그 날짜만 내보냅니다."""
+    previous = daily_export.source_fingerprint(db_path)
+    news_store.save_daily_briefing(db_path, date_str, articles(n), "", NOW_ISO)
+    return daily_export.export_dates(db_path, [date_str], previous)
+
+
+def test_manifest_records_source_fingerprint(tmp_path):
+    db_path = tmp_path / "news.db"
+    news_store.save_daily_briefing(db_path, "2026-01-01", articles(2), "", NOW_ISO)
+    assert daily_export.export_dates(db_path) == ["2026-01-01"]
+    source = manifest(db_path)["source"]
+    assert source == daily_export.source_fingerprint(db_path)
+    assert source["file"] == "news.db"
+
+    news_store.split_by_month(db_path)
+    daily_export.export_dates(db_path)
+    assert manifest(db_path)["source"]["file"] == "news/catalog.db"
+
+
+def test_dated_export_catches_up_after_bypassing_writer(tmp_path):
+    db_path = tmp_path / "news.db"
+    assert save_and_export(db_path, "2026-01-01") == ["2026-01-01"]
+
+    # Cowork처럼 내보내기 없이 기존 날짜를 고치고 색인만 갱신
+    conn = sqlite3.connect(db_path)
+    with conn:
+        conn.execute("UPDATE articles SET title = '수정됨' WHERE date = '2026-01-01'")
+    conn.close()
+    news_store.rebuild_briefing_index(db_path)
+    assert manifest(db_path)["source"] != daily_export.source_fingerprint(db_path)
+
+    # 다음 날짜만 지정했어도 매니페스트가 어긋나 있었으므로 전체 비교
+    assert save_and_export(db_path, "2026-01-02") == ["2026-01-01", "2026-01-02"]
+    assert exported(db_path, "2026-01-01")["articles"][0]["title"] == "수정됨"
+    assert manifest(db_path)["source"] == daily_export.source_fingerprint(db_path)
+
+
+def test_dated_export_skips_full_compare_when_in_step(tmp_path):
+    db_path = tmp_path / "news.db"
+    save_and_export(db_path, "2026-01-01")
+    # 매니페스트에 없는 파일 변경은 지정 날짜만 내보낼 때 다시 보지 않음
+    (daily_export.export_dir(db_path) / "2026-01-01.json.gz").write_bytes(b"")
+    assert save_and_export(db_path, "2026-01-02") == ["2026-01-02"]
+
+
+def test_restamp_source_only_when_manifest_was_current(tmp_path):
+    db_path = tmp_path / "news.db"
+    save_and_export(db_path, "2026-01-01")
+
+    previous = daily_export.source_fingerprint(db_path)
+    news_store.save_analysis(db_path, "2026-01-01", "분석", NOW_ISO)
+    assert daily_export.restamp_source(db_path, previous)
+    assert manifest(db_path)["source"] == daily_export.source_fingerprint(db_path)
+
+    # 이미 어긋난 매니페스트는 맞다고 덮지 않음
+    stale = daily_export.source_fingerprint(db_path)
+    news_store.save_analysis(db_path, "2026-01-01", "분석 2", NOW_ISO)
+    previous = daily_export.source_fingerprint(db_path)
+    news_store.save_analysis(db_path, "2026-01-01", "분석 3", NOW_ISO)
+    assert not daily_export.restamp_source(db_path, previous)
+    assert manifest(db_path)["source"] == stale
@@ -0,0 +1,125 @@
+"""dedup 근사 중복 제거(MinHash/LSH)와 날짜 간 중복 색인 단위 테스트."""
+
+import json
+import os
+
+import pytest
+
+import dedup
+
+FIXTURE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                       "scripts", "fixtures", "dedup_titles.json")
+
+
+def load_fixture(n):
+    with open(FIXTURE, encoding="utf-8") as f:
+        rows = json.load(f)
+    rows.sort(key=lambda r: r["date"], reverse=True)
+    return [{"title": r["title"], "url": f"fixture://{i}"} for i, r in enumerate(rows[:n])]
+
+
+def urls(articles):
+    return [a["url"] for a in articles]
+
+
+@pytest.mark.parametrize("n", [20, 150])
+def test_lsh_matches_pairwise_on_recorded_titles(n):
+    articles = load_fixture(n)
+    assert urls(dedup.lsh_dedup(articles)) == urls(dedup.pairwise_dedup(articles))
+
+
+def test_similar_titles_keep_longer_one():
+    articles = [
+        {"title": "금융위, 전자금융 보안 가이드라인 개정", "url": "a"},
+        {"title": "금융위, 전자금융 보안 가이드라인 전면 개정 발표", "url": "b"},
+        {"title": "미국 CISA, 오픈소스 취약점 경보", "url": "c"},
+    ]
+    expected = ["b", "c"]
+    assert urls(dedup.lsh_dedup(articles)) == expected
+    assert urls(dedup.pairwise_dedup(articles)) == expected
+
+
+def test_keyword_overlap_alone_marks_duplicate():
+    # 어순이 달라 제목 유사도는 낮지만 핵심 키워드가 겹치면 같은 사건으로 봄
+    articles = [
+        {"title": "SK텔레콤 유심 정보 해킹 후속 조치", "url": "a"},
+        {"title": "후속 조치 발표… 유심 SK텔레콤", "url": "b"},
+    ]
+    assert dedup.keyword_overlap(
+        dedup.extract_keywords(articles[0]["title"]), dedup.extract_keywords(articles[1]["title"])
+    ) > dedup.KEYWORD_OVERLAP_THRESHOLD
+    assert urls(dedup.lsh_dedup(articles)) == urls(dedup.pairwise_dedup(articles)) == ["a"]
+
+
+
+# ==========================================
+# 날짜 간 중복 (최근 브리핑 색인)
+# ==========================================
+RECENT = [
+    {"category": "[국내]", "title": "금융위, 전자금융 보안 가이드라인 전면 개정 발표", "url": "https://kr.example/1"},
+    {"category": "[해외]", "title": "오픈소스 취약점 경보", "title_original": "CISA warns of open source flaw",
+     "url": "https://en.example/2"},
+]
+
+
+def test_normalize_url_ignores_scheme_www_and_trailing_slash():
+    assert dedup.normalize_url("https://www.Example.com/news/1/") == dedup.normalize_url("http://example.com/news/1")
+    assert dedup.normalize_url("https://example.com/a?id=1") != dedup.normalize_url("https://example.com/a?id=2")
+
+
+def test_recent_index_matches_url_title_and_original_title():
+    index = dedup.RecentBriefingIndex()
+    for row in RECENT:
+        index.add(row)
+    assert index.match({"title": "전혀 다른 제목", "url": "http://www.kr.example/1/"})[0] == "url"
+    assert index.match({"title": "금융위, 전자금융 보안 가이드라인 개정", "url": "https://other/1"})[0] == "title"
+    assert index.match({"title": "CISA warns of open source flaw", "url": "https://other/2"})[0] == "title"
+    assert index.match({"title": "랜섬웨어 조직 검거", "url": "https://other/3"}) == (None, None)
+
+
+@pytest.fixture
+def news_db(tmp_path, monkeypatch):
+    import news_bot
+    import news_store
+
+    monkeypatch.setattr(news_store, "LAYOUT", "")
+    db_path = tmp_path / "news.db"
+    news_store.save_daily_briefing(db_path, "2026-03-09", RECENT, "", "2026-03-09T07:20:00+09:00")
+    # 오늘 날짜 기사는 색인에서 빠져야 함 (같은 날 재실행이 자기 자신과 겹치지 않도록)
+    news_store.save_daily_briefing(
+        db_path, "2026-03-10", [{"category": "[국내]", "title": "오늘 기사", "url": "https://kr.example/today"}],
+        "", "2026-03-10T07:20:00+09:00"
+    )
+    monkeypatch.setattr(news_bot, "NEWS_DB_PATH", db_path)
+    monkeypatch.setattr(news_bot, "NOW", news_bot.datetime(2026, 3, 10, 7, 20, tzinfo=news_bot.KST))
+    monkeypatch.setattr(news_bot, "TODAY_STR", "2026-03-10")
+    monkeypatch.setattr(news_bot, "YESTERDAY", "2026-03-09")
+    monkeypatch.setattr(news_bot.warm_state, "WARM_STATE_DISABLE", True)
+    return news_bot
+
+
+CANDIDATES = [
+    {"title": "금융위, 전자금융 보안 가이드라인 개정", "url": "https://other/1"},
+    {"title": "랜섬웨어 조직 검거", "url": "https://other/3"},
+    {"title": "오늘 기사", "url": "https://kr.example/today"},
+]
+
+
+@pytest.mark.parametrize("mode, expected", [
+    ("drop", ["https://other/3", "https://kr.example/today"]),
+    ("demote", ["https://other/3", "https://kr.example/today", "https://other/1"]),
+    ("off", ["https://other/1", "https://other/3", "https://kr.example/today"]),
+])
+def test_cross_day_dedup_modes(news_db, monkeypatch, mode, expected):
+    monkeypatch.setattr(news_db, "CROSS_DAY_DEDUP_MODE", mode)
+    index = news_db.load_recent_briefing_index()
+    assert (index is None) == (mode == "off")
+    assert urls(news_db.filter_recent_duplicates(list(CANDIDATES), index)) == expected
+
+
+def test_cross_day_window_excludes_older_days(news_db, monkeypatch):
+    monkeypatch.setattr(news_db, "CROSS_DAY_DEDUP_MODE", "drop")
+    monkeypatch.setattr(news_db, "NOW", news_db.datetime(2026, 3, 20, 7, 20, tzinfo=news_db.KST))
+    monkeypatch.setattr(news_db, "TODAY_STR", "2026-03-20")
+    index = news_db.load_recent_briefing_index()
+    assert index is not None and len(index) == 0
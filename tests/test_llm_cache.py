@@ -0,0 +1,143 @@
+"""LLM 응답 캐시(state_store.llm_cache_*)와 news_bot 캐시 경유 호출 단위 테스트."""
+
+import json
+
+import pytest
+
+import llm_client
+import llm_providers
+import news_bot
+import state_store
+
+
+@pytest.fixture(autouse=True)
+def state_db(tmp_path, monkeypatch):
+    monkeypatch.setattr(state_store, "STATE_DB_PATH", tmp_path / "state.db")
+    monkeypatch.setattr(news_bot, "LLM_CACHE_BYPASS", False)
+    monkeypatch.setattr(news_bot, "LLM_CACHE_TTL_SEC", 3600.0)
+
+
+def ok_result(text):
+    res = llm_client.ChatResult()
+    res.status_code = 200
+    res.text = text
+    res.complete = True
+    res.provider = "groq"
+    return res
+
+
+def test_cache_key_is_content_addressed():
+    payload = {"model": "m", "messages": [{"role": "user", "content": "후보"}], "temperature": 0.2}
+    reordered = {"temperature": 0.2, "messages": [{"content": "후보", "role": "user"}], "model": "m"}
+    key = state_store.llm_cache_key("selection", payload)
+    assert key == state_store.llm_cache_key("selection", reordered)
+    assert key != state_store.llm_cache_key("openai", payload)
+    assert key != state_store.llm_cache_key("selection", {**payload, "temperature": 0.3})
+
+
+def test_miss_put_hit_and_expiry(monkeypatch):
+    key = state_store.llm_cache_key("selection", {"x": 1})
+    assert state_store.llm_cache_get(key) is None
+    state_store.llm_cache_put(key, "m", "[1]", ttl_sec=60)
+    assert state_store.llm_cache_get(key) == "[1]"
+
+    now = state_store.time.time()
+    monkeypatch.setattr(state_store.time, "time", lambda: now + 61)
+    assert state_store.llm_cache_get(key) is None
+
+
+def test_bypass_forces_miss_but_still_refreshes(monkeypatch):
+    key = state_store.llm_cache_key("selection", {"x": 2})
+    monkeypatch.setattr(news_bot, "LLM_CACHE_BYPASS", True)
+    news_bot._llm_cache_put(key, "m", "new")
+    assert news_bot._llm_cache_get(key) is None
+    assert state_store.llm_cache_get(key) == "new"
+
+
+def test_cache_errors_are_misses(monkeypatch):
+    def broken(*args, **kwargs):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(state_store, "llm_cache_get", broken)
+    monkeypatch.setattr(state_store, "llm_cache_put", broken)
+    assert news_bot._llm_cache_get("k") is None
+    news_bot._llm_cache_put("k", "m", "v")
+
+
+def test_second_identical_call_is_served_from_cache(monkeypatch):
+    calls = []
+
+    def fake_complete(payload, kind, validate, **kwargs):
+        calls.append(kind)
+        return ok_result(json.dumps([{"id": 1, "score": 7}]))
+
+    monkeypatch.setattr(llm_providers, "complete", fake_complete)
+    data = {"model": news_bot.GROQ_MODEL, "messages": [{"role": "user", "content": "채점"}]}
+    assert news_bot.call_groq_json_array(data, "shard") == [{"id": 1, "score": 7}]
+    assert news_bot.call_groq_json_array(data, "shard") == [{"id": 1, "score": 7}]
+    assert calls == ["shard"]
+
+    # 요청이 달라지면 다시 호출
+    news_bot.call_groq_json_array({**data, "temperature": 0.5}, "shard")
+    assert calls == ["shard", "shard"]
+
+
+def test_incomplete_response_is_not_cached(monkeypatch):
+    calls = []
+
+    def fake_complete(payload, kind, validate, **kwargs):
+        calls.append(kind)
+        res = ok_result('[{"id": 1}, {"id": 2')
+        res.complete = False
+        res.items = [{"id": 1}]
+        return res
+
+    monkeypatch.setattr(llm_providers, "complete", fake_complete)
+    data = {"model": news_bot.GROQ_MODEL, "messages": [{"role": "user", "content": "끊김"}]}
+    assert news_bot.call_groq_json_array(data, "shard") == [{"id": 1}]
+    news_bot.call_groq_json_array(data, "shard")
+    assert len(calls) == 2
+
+
+# ==========================================
+# 기사별 요약 캐시
+# ==========================================
+WINNER = {
+    "url": "https://en.example/1", "title": "오픈소스 취약점 경보",
+    "title_original": "CISA warns of open source flaw", "summary": "요약 문장",
+}
+
+
+def test_summary_store_hit_miss_and_expiry(monkeypatch):
+    assert news_bot.load_known_summaries([WINNER]) == {}
+    news_bot.save_known_summaries([WINNER, {"url": "https://kr.example/2", "title": "요약 없음"}])
+    assert news_bot.load_known_summaries([WINNER, {"url": "https://kr.example/2"}]) == {
+        WINNER["url"]: {"title": WINNER["title"], "title_original": WINNER["title_original"],
+                        "summary": WINNER["summary"]},
+    }
+
+    now = state_store.time.time()
+    monkeypatch.setattr(state_store.time, "time", lambda: now + news_bot.SUMMARY_CACHE_MAX_AGE_SEC + 1)
+    assert news_bot.load_known_summaries([WINNER]) == {}
+
+
+def test_hydrate_fills_only_missing_fields():
+    known = {WINNER["url"]: {"title": WINNER["title"], "title_original": WINNER["title_original"],
+                             "summary": WINNER["summary"]}}
+    selected = [{"url": WINNER["url"], "cached": True}, {"url": "https://other", "summary": "새 요약"}]
+    news_bot.hydrate_known_summaries(selected, known)
+    assert selected[0] == {k: WINNER[k] for k in ("url", "title", "title_original", "summary")}
+    assert selected[1] == {"url": "https://other", "summary": "새 요약"}
+
+
+def test_cached_winner_skips_summary_call(monkeypatch):
+    monkeypatch.setattr(news_bot.warm_state, "WARM_STATE_DISABLE", True)
+    news_bot.save_known_summaries([WINNER])
+
+    def no_call(*args, **kwargs):
+        raise AssertionError("요약이 저장된 기사는 LLM을 부르지 않아야 함")
+
+    monkeypatch.setattr(llm_providers, "complete", no_call)
+    result = news_bot.summarize_winners([{"url": WINNER["url"], "category": "[해외]", "title": "CISA",
+                                          "published_date": "2026-03-10", "description": ""}])
+    assert [(r["url"], r["summary"]) for r in result] == [(WINNER["url"], WINNER["summary"])]
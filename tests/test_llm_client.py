@@ -0,0 +1,70 @@
+"""llm_client.JSONArrayStreamParser 단위 테스트."""
+
+from llm_client import JSONArrayStreamParser
+
+
+def feed_all(chunks):
+    parser = JSONArrayStreamParser()
+    completed = []
+    for chunk in chunks:
+        completed.extend(parser.feed(chunk))
+    return parser, completed
+
+
+def test_plain_array_in_one_chunk():
+    parser, completed = feed_all(['[{"id": 1}, {"id": 2}]'])
+    assert completed == [{"id": 1}, {"id": 2}]
+    assert parser.items == completed
+    assert parser.errors == 0
+
+
+def test_elements_split_across_chunks():
+    text = '```json\n[{"id": 1, "title": "보안"}, {"id": 2, "title": "금융"}]\n```'
+    parser = JSONArrayStreamParser()
+    per_chunk = [parser.feed(text[i:i + 3]) for i in range(0, len(text), 3)]
+    assert parser.items == [{"id": 1, "title": "보안"}, {"id": 2, "title": "금융"}]
+    # 원소는 닫는 괄호가 도착한 조각에서 바로 완성됨
+    assert sum(len(done) for done in per_chunk) == 2
+
+
+def test_element_reported_as_soon_as_closed():
+    parser = JSONArrayStreamParser()
+    assert parser.feed('[{"id": 1') == []
+    assert parser.feed('}, {"id"') == [{"id": 1}]
+    assert parser.feed(': 2}]') == [{"id": 2}]
+
+
+def test_wrapped_articles_object():
+    parser, completed = feed_all(['{"articles": [', '{"id": 3}, ', '{"id": 4}', ']}'])
+    assert completed == [{"id": 3}, {"id": 4}]
+
+
+def test_wrapper_key_with_brackets_is_ignored():
+    parser, completed = feed_all(['{"note [x]": "}", "articles": [{"id": 5}]}'])
+    assert completed == [{"id": 5}]
+
+
+def test_strings_with_escaped_quotes_and_brackets():
+    chunks = ['[{"title": "\\"랜섬웨어\\" [속보] {긴급}", ', '"summary": "a\\\\"}, ', '{"title": "]}"}]']
+    parser, completed = feed_all(chunks)
+    assert completed == [
+        {"title": '"랜섬웨어" [속보] {긴급}', "summary": "a\\"},
+        {"title": "]}"},
+    ]
+    assert parser.errors == 0
+
+
+def test_nested_objects_stay_inside_element():
+    parser, completed = feed_all(['[{"id": 1, "meta": {"score": [1, 2]}}]'])
+    assert completed == [{"id": 1, "meta": {"score": [1, 2]}}]
+
+
+def test_truncated_stream_keeps_completed_elements():
+    parser, completed = feed_all(['[{"id": 1}, {"id": 2, "tit'])
+    assert completed == [{"id": 1}]
+
+
+def test_malformed_element_counts_error():
+    parser, completed = feed_all(['[{"id": 1,}, {"id": 2}]'])
+    assert completed == [{"id": 2}]
+    assert parser.errors == 1
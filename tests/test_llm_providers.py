@@ -0,0 +1,148 @@
+"""llm_providers 장애 전환·헤지·재시도 대기 제공자 순서 단위 테스트 (HTTP는 가짜 chat_completion)."""
+
+import threading
+import time
+
+import pytest
+
+import llm_client
+import llm_providers
+import rate_limit
+import state_store
+
+
+def result(status=200, items=None):
+    res = llm_client.ChatResult()
+    res.status_code = status
+    res.items = items or []
+    res.complete = status == 200
+    return res
+
+
+@pytest.fixture
+def providers(monkeypatch, tmp_path):
+    """가짜 제공자 a, b와 URL별 응답 함수 표 (behaviors[url](cancel) -> ChatResult)."""
+    monkeypatch.setattr(state_store, "STATE_DB_PATH", tmp_path / "state.db")
+    # 테스트마다 새 리미터 (재시도 대기가 다른 테스트로 새지 않도록)
+    monkeypatch.setattr(rate_limit, "_limiters", {})
+    a = llm_providers.Provider("a", "http://a", "model-a", "key")
+    b = llm_providers.Provider("b", "http://b", "model-b", "key")
+    monkeypatch.setattr(llm_providers, "PROVIDERS", {"a": a, "b": b})
+    monkeypatch.setattr(llm_providers, "SELECTION_PROVIDERS", ["a", "b"])
+
+    behaviors = {}
+    calls = []
+
+    def fake_chat_completion(url, headers, payload, timeout, stream=True, parse_array=False,
+                             limiter=None, cancel=None):
+        calls.append(payload["model"])
+        started = time.monotonic()
+        res = behaviors[url](cancel)
+        res.elapsed_ms = (time.monotonic() - started) * 1000
+        return res
+
+    monkeypatch.setattr(llm_client, "chat_completion", fake_chat_completion)
+    return a, b, behaviors, calls
+
+
+def slow(seconds):
+    """cancel되면 바로, 아니면 seconds 뒤에 응답하는 제공자."""
+    def respond(cancel):
+        if cancel.wait(seconds):
+            res = llm_client.ChatResult()
+            res.cancelled = True
+            return res
+        return result(items=[{"id": 1}])
+    return respond
+
+
+def complete():
+    return llm_providers.complete({"messages": []}, "selection", lambda r: r.ok and r.complete, timeout=10)
+
+
+def test_server_error_fails_over_to_next_provider(providers):
+    a, b, behaviors, calls = providers
+    behaviors["http://a"] = lambda cancel: result(status=503)
+    behaviors["http://b"] = lambda cancel: result(items=[{"id": 1}])
+
+    res = complete()
+    assert res.provider == "b" and res.ok
+    assert calls == ["model-a", "model-b"]
+
+
+def test_all_failures_return_first_failure(providers):
+    a, b, behaviors, calls = providers
+    behaviors["http://a"] = lambda cancel: result(status=429)
+    behaviors["http://b"] = lambda cancel: result(status=500)
+
+    res = complete()
+    assert res.provider == "a" and res.status_code == 429
+    # 반환하지 않은 실패(b)는 여기서 재시도 대기를 잡아 둠
+    assert b.limiter.blocked_for() > 0
+    assert a.limiter.blocked_for() == 0
+
+
+def test_no_hedge_without_latency_samples(providers):
+    a, b, behaviors, calls = providers
+    behaviors["http://a"] = slow(0.3)
+    behaviors["http://b"] = lambda cancel: result(items=[{"id": 2}])
+
+    res = complete()
+    assert res.provider == "a"
+    assert calls == ["model-a"]
+
+
+def test_slow_primary_is_hedged_and_loser_cancelled(monkeypatch, providers):
+    a, b, behaviors, calls = providers
+    monkeypatch.setattr(llm_providers, "LLM_HEDGE_MIN_SEC", 0.05)
+    for _ in range(llm_providers.LLM_HEDGE_MIN_SAMPLES):
+        a.record("selection", 50, True)
+    cancelled = threading.Event()
+
+    def stuck(cancel):
+        res = slow(5)(cancel)
+        if res.cancelled:
+            cancelled.set()
+        return res
+
+    behaviors["http://a"] = stuck
+    behaviors["http://b"] = lambda cancel: result(items=[{"id": 2}])
+
+    started = time.monotonic()
+    res = complete()
+    assert res.provider == "b"
+    assert time.monotonic() - started < 2
+    assert calls == ["model-a", "model-b"]
+    # 진 쪽(a)은 취소되고, 취소된 호출은 지연 표본에 들어가지 않음
+    assert cancelled.wait(2)
+    assert a.error_rate("selection") == 0
+
+
+def test_blocked_provider_moves_to_back_of_chain(providers):
+    a, b, behaviors, calls = providers
+    a.limiter.blocked_until = time.monotonic() + 30
+    assert [p.name for p in llm_providers.chain("selection")] == ["b", "a"]
+
+    behaviors["http://a"] = lambda cancel: result(items=[{"id": 1}])
+    behaviors["http://b"] = lambda cancel: result(items=[{"id": 2}])
+    res = complete()
+    # a의 재시도 대기를 기다리지 않고 b로 바로 보냄
+    assert res.provider == "b"
+    assert calls == ["model-b"]
+
+
+def test_all_blocked_prefers_soonest_release(providers):
+    a, b, _, _ = providers
+    now = time.monotonic()
+    a.limiter.blocked_until = now + 30
+    b.limiter.blocked_until = now + 5
+    assert [p.name for p in llm_providers.chain("selection")] == ["b", "a"]
+
+
+def test_high_error_rate_moves_provider_back(providers):
+    a, b, _, _ = providers
+    for _ in range(llm_providers.LLM_HEDGE_MIN_SAMPLES):
+        a.record("selection", 50, False)
+    assert [p.name for p in llm_providers.chain("selection")] == ["b", "a"]
+    # 다른 호출 종류의 순서에는 영향 없음
+    assert [p.name for p in llm_providers.chain("summary")] == ["a", "b"]
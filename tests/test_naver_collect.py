@@ -0,0 +1,254 @@
+"""네이버 수집(_fetch_naver_keyword 페이지 탐색·search_naver_news·collect_candidates) 단위 테스트 (HTTP는 가짜 응답)."""
+
+import threading
+import time
+from datetime import datetime, timedelta
+
+import pytest
+import requests
+
+import http_client
+import news_bot
+import state_store
+
+TODAY = datetime(2026, 3, 10, 7, 20)
+
+
+class FakeResponse:
+    def __init__(self, items, status_code=200):
+        self.status_code = status_code
+        self._items = items
+
+    def json(self):
+        return {"items": self._items}
+
+
+def naver_item(n, published):
+    return {
+        "title": f"<b>기사</b> {n}",
+        "originallink": f"https://news.example/{n}",
+        "description": f"설명 {n}",
+        "pubDate": published.strftime(news_bot.NAVER_PUBDATE_FORMAT),
+    }
+
+
+def page_of(start, hours_ago):
+    return [naver_item(start + i, TODAY - timedelta(hours=h)) for i, h in enumerate(hours_ago)]
+
+
+@pytest.fixture(autouse=True)
+def fixed_dates(monkeypatch, tmp_path):
+    monkeypatch.setattr(news_bot, "TODAY_STR", TODAY.strftime("%Y-%m-%d"))
+    monkeypatch.setattr(news_bot, "YESTERDAY", (TODAY - timedelta(days=1)).strftime("%Y-%m-%d"))
+    monkeypatch.setattr(news_bot, "NAVER_PAGE_SIZE", 2)
+    monkeypatch.setattr(news_bot, "NAVER_MAX_PAGES", 5)
+    monkeypatch.setattr(state_store, "STATE_DB_PATH", tmp_path / "state.db")
+
+
+def serve_pages(monkeypatch, pages):
+    """start 오프셋별 응답(리스트 또는 예외)을 돌려주는 가짜 http_client.get을 설치합니다."""
+    calls = []
+
+    def fake_get(url, headers=None, params=None, timeout=None):
+        calls.append(params["start"])
+        page = pages[params["start"]]
+        if isinstance(page, Exception):
+            raise page
+        return page if isinstance(page, FakeResponse) else FakeResponse(page)
+
+    monkeypatch.setattr(http_client, "get", fake_get)
+    return calls
+
+
+def far_deadline():
+    return news_bot.time.monotonic() + 30
+
+
+def test_pages_until_high_water_mark(monkeypatch):
+    calls = serve_pages(monkeypatch, {
+        1: page_of(1, [1, 2]),
+        3: page_of(3, [3, 4]),
+        5: page_of(5, [5, 6]),
+    })
+    high_water = (TODAY - timedelta(hours=3, minutes=30)).isoformat()
+    articles, newest = news_bot._fetch_naver_keyword("해킹", {}, far_deadline(), high_water)
+    # 두 번째 페이지의 가장 오래된 기사(4시간 전)가 high-water mark보다 오래되어 멈춤
+    assert calls == [1, 3]
+    assert [a["url"] for a in articles] == [f"https://news.example/{n}" for n in (1, 2, 3, 4)]
+    assert newest == (TODAY - timedelta(hours=1)).isoformat()
+    assert articles[0]["title"] == "기사 1"
+
+
+def test_without_cursor_pages_until_yesterday(monkeypatch):
+    calls = serve_pages(monkeypatch, {
+        1: page_of(1, [1, 2]),
+        3: page_of(3, [20, 40]),
+        5: page_of(5, [50, 60]),
+    })
+    articles, _ = news_bot._fetch_naver_keyword("해킹", {}, far_deadline())
+    # 두 번째 페이지에 그제 기사가 나와 멈추고, 그 기사는 날짜 필터에서 빠짐
+    assert calls == [1, 3]
+    assert len(articles) == 3
+
+
+def test_short_page_stops_paging(monkeypatch):
+    calls = serve_pages(monkeypatch, {1: page_of(1, [1])})
+    articles, newest = news_bot._fetch_naver_keyword("해킹", {}, far_deadline())
+    assert calls == [1] and len(articles) == 1 and newest is not None
+
+
+def test_later_page_failure_keeps_earlier_pages_without_cursor(monkeypatch):
+    serve_pages(monkeypatch, {
+        1: page_of(1, [1, 2]),
+        3: requests.exceptions.ConnectionError("reset"),
+    })
+    articles, newest = news_bot._fetch_naver_keyword("해킹", {}, far_deadline())
+    assert [a["url"] for a in articles] == ["https://news.example/1", "https://news.example/2"]
+    assert newest is None
+
+
+def test_later_page_error_status_does_not_advance_cursor(monkeypatch):
+    serve_pages(monkeypatch, {1: page_of(1, [1, 2]), 3: FakeResponse([], status_code=500)})
+    articles, newest = news_bot._fetch_naver_keyword("해킹", {}, far_deadline())
+    assert len(articles) == 2 and newest is None
+
+
+def test_first_page_failure_raises(monkeypatch):
+    serve_pages(monkeypatch, {1: requests.exceptions.ConnectionError("down")})
+    with pytest.raises(requests.exceptions.RequestException):
+        news_bot._fetch_naver_keyword("해킹", {}, far_deadline())
+
+
+def test_saved_cursor_never_moves_backwards():
+    state_store.save_cursors("naver", {"해킹": "2026-03-10T06:00:00", "AI보안": "2026-03-09T10:00:00"})
+    state_store.save_cursors("naver", {"해킹": "2026-03-10T05:00:00"})
+    assert state_store.load_cursors("naver") == {
+        "해킹": "2026-03-10T06:00:00",
+        "AI보안": "2026-03-09T10:00:00",
+    }
+
+
+@pytest.fixture
+def naver_keys(monkeypatch):
+    monkeypatch.setattr(news_bot, "NAVER_ID", "id")
+    monkeypatch.setattr(news_bot, "NAVER_SECRET", "secret")
+    monkeypatch.setattr(news_bot, "NAVER_KEYWORDS", ["해킹", "랜섬웨어", "금융보안"])
+    monkeypatch.setattr(news_bot, "NAVER_MAX_CONCURRENCY", 3)
+    monkeypatch.setattr(news_bot, "CANDIDATE_LIMIT", 100)
+
+
+def serve_keywords(monkeypatch, handler):
+    """키워드별로 handler(keyword)가 돌려준 기사 목록(한 페이지)을 응답하는 가짜 http_client.get."""
+    def fake_get(url, headers=None, params=None, timeout=None):
+        return FakeResponse(handler(params["query"]))
+
+    monkeypatch.setattr(http_client, "get", fake_get)
+
+
+def test_keywords_are_fetched_concurrently(monkeypatch, naver_keys):
+    # 세 키워드 요청이 동시에 진행 중이어야만 통과하는 barrier (순차 실행이면 타임아웃)
+    barrier = threading.Barrier(3, timeout=5)
+
+    def handler(keyword):
+        barrier.wait()
+        return [naver_item(keyword, TODAY - timedelta(hours=1))]
+
+    serve_keywords(monkeypatch, handler)
+    articles, _ = news_bot.search_naver_news()
+    assert sorted(a["url"] for a in articles) == sorted(
+        f"https://news.example/{kw}" for kw in ("해킹", "랜섬웨어", "금융보안")
+    )
+
+
+def test_deadline_returns_partial_results(monkeypatch, naver_keys):
+    monkeypatch.setattr(news_bot, "NAVER_DEADLINE_SEC", 0.3)
+    release = threading.Event()
+
+    def handler(keyword):
+        if keyword == "랜섬웨어":
+            release.wait(5)
+        return [naver_item(keyword, TODAY - timedelta(hours=1))]
+
+    serve_keywords(monkeypatch, handler)
+    started = time.monotonic()
+    try:
+        articles, cursors = news_bot.search_naver_news()
+    finally:
+        release.set()
+    assert time.monotonic() - started < 2
+    assert {a["url"] for a in articles} == {"https://news.example/해킹", "https://news.example/금융보안"}
+    # 마감에 걸린 키워드는 커서를 돌려주지 않음
+    assert set(cursors) == {"해킹", "금융보안"}
+
+
+def test_failed_keyword_does_not_drop_others(monkeypatch, naver_keys):
+    def handler(keyword):
+        if keyword == "해킹":
+            raise requests.exceptions.ConnectionError("down")
+        # 같은 기사가 두 키워드에 걸려도 한 번만 남음
+        return [naver_item("shared", TODAY - timedelta(hours=1))]
+
+    serve_keywords(monkeypatch, handler)
+    articles, cursors = news_bot.search_naver_news()
+    assert [a["url"] for a in articles] == ["https://news.example/shared"]
+    assert set(cursors) == {"랜섬웨어", "금융보안"}
+
+
+DISTINCT_TITLES = {"해킹": "은행 랜섬웨어 피해 확산", "랜섬웨어": "제로데이 취약점 긴급 패치", "금융보안": "금감원 전자금융 감독규정 개정"}
+
+
+@pytest.fixture
+def collect_env(monkeypatch, naver_keys):
+    """collect_candidates()용 환경: 해외 수집은 즉시 빈 결과, 최근 브리핑 색인 없음."""
+    monkeypatch.setattr(news_bot, "search_tavily_news", lambda: [])
+    monkeypatch.setattr(news_bot, "load_recent_briefing_index", lambda: None)
+    monkeypatch.setattr(news_bot, "PIPELINE_DEADLINE_SEC", 10)
+    monkeypatch.setattr(news_bot, "NAVER_DEADLINE_SEC", 10)
+    release = threading.Event()
+    finished = threading.Event()
+
+    def handler(keyword):
+        # 랜섬웨어 키워드만 release 전까지 응답하지 않음
+        if keyword == "랜섬웨어":
+            release.wait(5)
+            finished.set()
+        item = naver_item(keyword, TODAY - timedelta(hours=1))
+        item["title"] = DISTINCT_TITLES[keyword]
+        return [item]
+
+    serve_keywords(monkeypatch, handler)
+    yield release, finished
+    release.set()
+
+
+def test_sufficient_partial_results_stop_waiting(monkeypatch, collect_env):
+    monkeypatch.setattr(news_bot, "NAVER_SUFFICIENT_CANDIDATES", 2)
+    started = time.monotonic()
+    kr, en, cursors = news_bot.collect_candidates()
+    assert time.monotonic() - started < 2
+    assert {a["url"] for a in kr} == {"https://news.example/해킹", "https://news.example/금융보안"}
+    assert en == []
+    assert set(cursors) == {"해킹", "금융보안"}
+
+
+def test_abandoned_collector_does_not_touch_returned_cursors(monkeypatch, collect_env):
+    release, finished = collect_env
+    monkeypatch.setattr(news_bot, "PIPELINE_DEADLINE_SEC", 0.3)
+    kr, _, cursors = news_bot.collect_candidates()
+    # 마감 시점까지 끝난 키워드의 부분 결과로 진행
+    assert set(cursors) == {"해킹", "금융보안"}
+    assert len(kr) == 2
+
+    # 버려진 수집 스레드가 뒤늦게 끝나도 이미 돌려준 커서는 바뀌지 않음
+    release.set()
+    assert finished.wait(5)
+    time.sleep(0.1)
+    assert set(cursors) == {"해킹", "금융보안"}
+
+
+def test_without_threshold_waits_for_all_keywords(monkeypatch, collect_env):
+    release, _ = collect_env
+    threading.Timer(0.2, release.set).start()
+    kr, _, cursors = news_bot.collect_candidates()
+    assert len(kr) == 3
+    assert set(cursors) == {"해킹", "랜섬웨어", "금융보안"}
@@ -0,0 +1,250 @@
+"""news_store 마이그레이션·날짜 색인·월별 분할 단위 테스트 (임시 디렉터리의 DB만 사용)."""
+
+import sqlite3
+
+import pytest
+
+import news_store
+
+NOW_ISO = "2026-01-01T09:00:00+09:00"
+
+
+@pytest.fixture(autouse=True)
+def auto_layout(monkeypatch):
+    # NEWS_DB_LAYOUT 환경변수와 무관하게 카탈로그 존재 여부로 판단
+    monkeypatch.setattr(news_store, "LAYOUT", "")
+
+
+def articles(domestic=1, overseas=0):
+    return (
+        [{"category": "[국내]", "title": f"국내 {i}", "url": f"https://kr.example/{i}"} for i in range(domestic)]
+        + [{"category": "[해외]", "title": f"해외 {i}", "url": f"https://en.example/{i}"} for i in range(overseas)]
+    )
+
+
+def index_rows(db_path):
+    conn = news_store.connect_index(db_path)
+    try:
+        return {
+            row[0]: row[1:]
+            for row in conn.execute(
+                "SELECT date, article_count, prev_date, next_date FROM briefing_index ORDER BY date"
+            )
+        }
+    finally:
+        conn.close()
+
+
+def test_migrate_fresh_db(tmp_path):
+    conn = news_store.connect(tmp_path / "news.db")
+    try:
+        assert conn.execute("PRAGMA user_version").fetchone()[0] == news_store.SCHEMA_VERSION
+        tables = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+        assert {"articles", "daily_briefings", "briefing_index"} <= tables
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0].lower() == "delete"
+        # 이미 최신이면 아무것도 적용하지 않음
+        assert news_store.migrate(conn) == news_store.SCHEMA_VERSION
+    finally:
+        conn.close()
+
+
+def test_migrate_legacy_db_backfills_index(tmp_path):
+    db_path = tmp_path / "news.db"
+    conn = sqlite3.connect(db_path, isolation_level=None)
+    news_store.migrate(conn, news_store.MIGRATIONS[:1])
+    conn.executemany(
+        "INSERT INTO articles (date, category, title, url, created_at) VALUES (?, ?, ?, ?, ?)",
+        [
+            ("2026-01-01", "[국내]", "a", "https://a", NOW_ISO),
+            ("2026-01-01", "[해외]", "b", "https://b", NOW_ISO),
+            ("2026-01-03", "[국내]", "c", "https://c", NOW_ISO),
+        ]
+    )
+    conn.execute("INSERT INTO daily_briefings VALUES ('2026-01-03', '분석', ?)", (NOW_ISO,))
+    assert news_store.migrate(conn) == news_store.SCHEMA_VERSION
+    rows = conn.execute(
+        "SELECT date, article_count, domestic_count, overseas_count, has_analysis, prev_date, next_date "
+        "FROM briefing_index ORDER BY date"
+    ).fetchall()
+    conn.close()
+    assert rows == [
+        ("2026-01-01", 2, 1, 1, 0, None, "2026-01-03"),
+        ("2026-01-03", 1, 1, 0, 1, "2026-01-01", None),
+    ]
+
+
+def test_migrate_rolls_back_failed_step(tmp_path):
+    conn = sqlite3.connect(tmp_path / "news.db", isolation_level=None)
+    broken = news_store.MIGRATIONS[:1] + [(2, "CREATE INDEX idx_missing ON no_such_table(x)")]
+    with pytest.raises(sqlite3.OperationalError):
+        news_store.migrate(conn, broken)
+    assert conn.execute("PRAGMA user_version").fetchone()[0] == 0
+    conn.close()
+
+
+def test_save_replaces_same_date_in_one_transaction(tmp_path):
+    db_path = tmp_path / "news.db"
+    news_store.save_daily_briefing(db_path, "2026-01-01", articles(3), "분석", NOW_ISO)
+    assert news_store.save_daily_briefing(db_path, "2026-01-01", articles(1, 1), "", NOW_ISO) == 2
+    conn = news_store.connect(db_path)
+    try:
+        assert conn.execute("SELECT COUNT(*) FROM articles").fetchone() == (2,)
+        # 빈 분석으로 재저장하면 이전 분석 행도 지워짐
+        assert conn.execute("SELECT COUNT(*) FROM daily_briefings").fetchone() == (0,)
+    finally:
+        conn.close()
+
+
+def test_failed_write_rolls_back(tmp_path):
+    db_path = tmp_path / "news.db"
+    news_store.save_daily_briefing(db_path, "2026-01-01", articles(2), "", NOW_ISO)
+    with pytest.raises(RuntimeError):
+        with news_store.write_transaction(db_path) as conn:
+            conn.execute("DELETE FROM articles")
+            raise RuntimeError("중단")
+    conn = news_store.connect(db_path)
+    try:
+        assert conn.execute("SELECT COUNT(*) FROM articles").fetchone() == (2,)
+    finally:
+        conn.close()
+
+
+def test_save_links_and_relinks_neighbours(tmp_path):
+    db_path = tmp_path / "news.db"
+    for date_str in ("2026-01-01", "2026-01-05", "2026-01-03"):
+        news_store.save_daily_briefing(db_path, date_str, articles(), "", NOW_ISO)
+    assert index_rows(db_path) == {
+        "2026-01-01": (1, None, "2026-01-03"),
+        "2026-01-03": (1, "2026-01-01", "2026-01-05"),
+        "2026-01-05": (1, "2026-01-03", None),
+    }
+
+    # 기사가 없어진 날짜는 색인에서 빠지고 이웃끼리 연결됨
+    news_store.save_daily_briefing(db_path, "2026-01-03", [], "", NOW_ISO)
+    assert index_rows(db_path) == {
+        "2026-01-01": (1, None, "2026-01-05"),
+        "2026-01-05": (1, "2026-01-01", None),
+    }
+
+
+def test_split_by_month_and_relink_across_shards(tmp_path):
+    db_path = tmp_path / "news.db"
+    news_store.save_daily_briefing(db_path, "2026-01-30", articles(2, 1), "1월 분석", NOW_ISO)
+    news_store.save_daily_briefing(db_path, "2026-02-02", articles(1), "", NOW_ISO)
+    assert not news_store.is_partitioned(db_path)
+
+    counts = news_store.split_by_month(db_path)
+    assert counts == {"2026-01": 3, "2026-02": 1}
+    assert news_store.is_partitioned(db_path)
+    assert [p.name for p in news_store.article_db_paths(db_path)] == ["2026-01.db", "2026-02.db"]
+    assert [p.name for p in news_store.article_db_paths(db_path, "2026-02-01", "2026-02-28")] == ["2026-02.db"]
+
+    shard = sqlite3.connect(news_store.shard_path(db_path, "2026-01"))
+    try:
+        assert shard.execute("SELECT DISTINCT date FROM articles").fetchall() == [("2026-01-30",)]
+        assert shard.execute("SELECT analysis FROM daily_briefings").fetchall() == [("1월 분석",)]
+    finally:
+        shard.close()
+    assert index_rows(db_path) == {
+        "2026-01-30": (3, None, "2026-02-02"),
+        "2026-02-02": (1, "2026-01-30", None),
+    }
+
+    # 분할 뒤의 쓰기: 새 달 샤드가 생기고 카탈로그의 앞뒤 연결이 달 경계를 넘어 갱신됨
+    news_store.save_daily_briefing(db_path, "2026-03-01", articles(1), "", NOW_ISO)
+    news_store.save_daily_briefing(db_path, "2026-01-31", articles(1), "", NOW_ISO)
+    assert news_store.shard_path(db_path, "2026-03").exists()
+    assert index_rows(db_path) == {
+        "2026-01-30": (3, None, "2026-01-31"),
+        "2026-01-31": (1, "2026-01-30", "2026-02-02"),
+        "2026-02-02": (1, "2026-01-31", "2026-03-01"),
+        "2026-03-01": (1, "2026-02-02", None),
+    }
+
+    news_store.save_daily_briefing(db_path, "2026-02-02", [], "", NOW_ISO)
+    assert index_rows(db_path)["2026-01-31"] == (1, "2026-01-30", "2026-03-01")
+    assert index_rows(db_path)["2026-03-01"] == (1, "2026-01-31", None)
+
+
+def test_save_analysis_updates_index_flag(tmp_path):
+    db_path = tmp_path / "news.db"
+    news_store.save_daily_briefing(db_path, "2026-01-01", articles(), "", NOW_ISO)
+    assert news_store.save_analysis(db_path, "2026-01-01", "분석", NOW_ISO) is False
+    assert news_store.save_analysis(db_path, "2026-01-01", "수정", NOW_ISO) is True
+    conn = news_store.connect_index(db_path)
+    try:
+        assert conn.execute("SELECT has_analysis FROM briefing_index").fetchone() == (1,)
+    finally:
+        conn.close()
+
+
+def insert_raw(db_path, date_str, n=1, category="[국내]"):
+    """news_store를 거치지 않는 작성자(Cowork)처럼 articles에 직접 넣습니다."""
+    conn = sqlite3.connect(db_path)
+    with conn:
+        conn.executemany(
+            "INSERT INTO articles (date, category, title, url, created_at) VALUES (?, ?, ?, ?, ?)",
+            [(date_str, category, f"raw {i}", f"https://raw.example/{date_str}/{i}", NOW_ISO) for i in range(n)]
+        )
+    conn.close()
+
+
+def test_rebuild_index_picks_up_raw_writes(tmp_path):
+    db_path = tmp_path / "news.db"
+    news_store.save_daily_briefing(db_path, "2026-01-01", articles(), "", NOW_ISO)
+    insert_raw(db_path, "2026-01-02", 2)
+    assert "2026-01-02" not in index_rows(db_path)
+
+    assert news_store.rebuild_briefing_index(db_path) == 2
+    assert index_rows(db_path) == {
+        "2026-01-01": (1, None, "2026-01-02"),
+        "2026-01-02": (2, "2026-01-01", None),
+    }
+
+
+def test_rebuild_index_reads_every_shard(tmp_path):
+    db_path = tmp_path / "news.db"
+    news_store.save_daily_briefing(db_path, "2026-01-30", articles(2), "", NOW_ISO)
+    news_store.save_daily_briefing(db_path, "2026-02-02", articles(1), "", NOW_ISO)
+    news_store.split_by_month(db_path)
+    insert_raw(news_store.shard_path(db_path, "2026-02"), "2026-02-03")
+
+    assert news_store.rebuild_briefing_index(db_path) == 3
+    assert index_rows(db_path) == {
+        "2026-01-30": (2, None, "2026-02-02"),
+        "2026-02-02": (1, "2026-01-30", "2026-02-03"),
+        "2026-02-03": (1, "2026-02-02", None),
+    }
+
+
+def test_news_db_newer_than_catalog_wins_until_folded(tmp_path):
+    db_path = tmp_path / "news.db"
+    news_store.save_daily_briefing(db_path, "2026-01-01", articles(), "", NOW_ISO)
+    news_store.split_by_month(db_path)
+    # 분할 뒤 news_bot은 샤드에, Cowork는 남아 있는 news.db에 씀
+    news_store.save_daily_briefing(db_path, "2026-01-02", articles(2), "", NOW_ISO)
+    assert news_store.date_db_path(db_path, "2026-01-02") == news_store.shard_path(db_path, "2026-01")
+    insert_raw(db_path, "2026-02-01", 3)
+
+    assert news_store.catalog_is_stale(db_path)
+    assert news_store.date_db_path(db_path, "2026-02-01") == db_path
+    assert news_store.index_db_path(db_path) == db_path
+
+    assert news_store.fold_stale_catalog(db_path) == ["2026-02-01"]
+    assert not news_store.catalog_is_stale(db_path)
+    assert news_store.index_db_path(db_path) == tmp_path / "news" / news_store.CATALOG_NAME
+    # 샤드에만 있던 01-02도 남고 새 날짜가 이어짐
+    assert index_rows(db_path) == {
+        "2026-01-01": (1, None, "2026-01-02"),
+        "2026-01-02": (2, "2026-01-01", "2026-02-01"),
+        "2026-02-01": (3, "2026-01-02", None),
+    }
+
+
+def test_explicit_layout_ignores_stale_catalog(tmp_path, monkeypatch):
+    db_path = tmp_path / "news.db"
+    news_store.save_daily_briefing(db_path, "2026-01-01", articles(), "", NOW_ISO)
+    news_store.split_by_month(db_path)
+    insert_raw(db_path, "2026-01-02")
+    monkeypatch.setattr(news_store, "LAYOUT", "monthly")
+    assert news_store.is_partitioned(db_path)
@@ -0,0 +1,54 @@
+"""prompt_codec 후보 표 인코딩·디코딩 단위 테스트."""
+
+import prompt_codec
+
+
+def candidates(domestic, overseas, desc="설명 " * 40):
+    return (
+        [{"category": "[국내]", "title": f"국내|{i}\n제목", "url": f"https://kr.example/{i}",
+          "published_date": "2026-01-01", "description": desc} for i in range(domestic)]
+        + [{"category": "[해외]", "title": f"Overseas {i}", "url": f"https://en.example/{i}",
+            "published_date": "2026-01-01", "description": desc} for i in range(overseas)]
+    )
+
+
+def test_rows_are_numbered_and_cleaned():
+    table = prompt_codec.encode_candidates(candidates(1, 1), token_budget=10_000)
+    lines = table.text.split("\n")
+    assert lines[0] == prompt_codec.TABLE_HEADER
+    assert lines[1].startswith("1|국내|2026-01-01|국내 0 제목|")
+    assert lines[2].startswith("2|해외|")
+    assert table.dropped == 0
+
+
+def test_cached_articles_skip_description():
+    items = candidates(1, 0)
+    table = prompt_codec.encode_candidates(items, token_budget=10_000, cached_urls={items[0]["url"]})
+    assert table.text.split("\n")[1].endswith(prompt_codec.CACHED_MARK)
+
+
+def test_budget_shrinks_descriptions_then_drops_tail():
+    items = candidates(12, 6)
+    full = prompt_codec.encode_candidates(items, token_budget=100_000)
+    assert full.desc_chars == prompt_codec.DESC_CHAR_STEPS[0]
+
+    no_desc = prompt_codec.encode_candidates(items, token_budget=0, min_per_category=(100, 100))
+    assert no_desc.desc_chars == 0 and no_desc.dropped == 0
+
+    tight = prompt_codec.encode_candidates(items, token_budget=0, min_per_category=(7, 3))
+    assert tight.dropped == 8
+    kinds = [row.split("|")[1] for row in tight.text.split("\n")[1:]]
+    assert kinds.count("국내") == 7 and kinds.count("해외") == 3
+
+
+def test_decode_restores_source_fields():
+    items = candidates(1, 1)
+    table = prompt_codec.encode_candidates(items, token_budget=10_000)
+    decoded = table.decode([{"id": 2, "title": "번역 제목"}, {"id": "1"}, {"id": 99}, {"url": "https://x"}])
+    assert decoded[0] == {
+        "title": "번역 제목", "url": "https://en.example/0", "category": "[해외]",
+        "detected_date": "2026-01-01", "title_original": "Overseas 0",
+    }
+    assert decoded[1]["url"] == "https://kr.example/0" and "title_original" not in decoded[1]
+    assert decoded[2] == {"id": 99}
+    assert decoded[3] == {"url": "https://x"}
@@ -0,0 +1,72 @@
+"""rate_limit 헤더 해석·버킷 동기화 단위 테스트."""
+
+import time
+
+import pytest
+
+import rate_limit
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("12", 12.0),
+    ("7.66s", 7.66),
+    ("350ms", 0.35),
+    ("2m59.56s", 179.56),
+    ("1h2m", 3720.0),
+    ("", None),
+    (None, None),
+    ("soon", None),
+    ("1m soon", None),
+])
+def test_parse_duration(value, expected):
+    if expected is None:
+        assert rate_limit.parse_duration(value) is None
+    else:
+        assert rate_limit.parse_duration(value) == pytest.approx(expected)
+
+
+def test_parse_retry_after_http_date():
+    future = time.strftime("%a, %d %b %Y %H:%M:%S GMT", time.gmtime(time.time() + 30))
+    assert 25 <= rate_limit.parse_retry_after(future) <= 31
+    assert rate_limit.parse_retry_after("3") == 3.0
+    assert rate_limit.parse_retry_after("not a date") is None
+
+
+def test_unknown_limits_do_not_wait():
+    limiter = rate_limit.RateLimiter("test")
+    assert limiter.acquire(tokens=10_000) < 0.01
+
+
+def test_observe_syncs_buckets_from_headers():
+    limiter = rate_limit.RateLimiter("test")
+    limiter.observe({
+        "x-ratelimit-limit-requests": "30",
+        "x-ratelimit-remaining-requests": "0",
+        "x-ratelimit-reset-requests": "2s",
+        "X-RateLimit-Limit-Tokens": "6000",
+        "X-RateLimit-Remaining-Tokens": "5000",
+        "X-RateLimit-Reset-Tokens": "10s",
+    })
+    now = time.monotonic()
+    assert limiter.requests.capacity == 30
+    # 소진된 30개가 2초 동안 고르게 충전된다고 보므로 1개는 약 1/15초 뒤
+    assert limiter.requests.wait_time(1, now) == pytest.approx(2 / 30, abs=0.01)
+    assert limiter.requests.wait_time(30, now) == pytest.approx(2.0, abs=0.01)
+    assert limiter.tokens.level == pytest.approx(5000, abs=1)
+    assert limiter.tokens.wait_time(4000, now) == 0.0
+
+
+def test_backoff_honours_retry_after_and_blocks_limiter(monkeypatch):
+    monkeypatch.setattr(rate_limit.random, "uniform", lambda low, high: high)
+    limiter = rate_limit.RateLimiter("test")
+    wait = limiter.backoff(0, {"Retry-After": "5"})
+    assert 5.0 <= wait <= 5.5
+    assert limiter.blocked_until - time.monotonic() > 4.5
+
+
+def test_backoff_without_retry_after_is_capped(monkeypatch):
+    monkeypatch.setattr(rate_limit.random, "uniform", lambda low, high: high)
+    monkeypatch.setattr(rate_limit, "RATE_LIMIT_BACKOFF_MAX_SEC", 4.0)
+    limiter = rate_limit.RateLimiter("test")
+    assert limiter.backoff(0) == pytest.approx(rate_limit.RATE_LIMIT_BACKOFF_BASE_SEC, abs=0.05)
+    assert limiter.backoff(10) == pytest.approx(4.0, abs=0.05)
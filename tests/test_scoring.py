@@ -0,0 +1,65 @@
+"""scoring 키워드 매처가 기존 부분 문자열 방식과 같은 점수·제외 판정을 내는지 검증합니다."""
+
+import json
+import os
+
+import pytest
+
+import scoring
+
+FIXTURE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                       "scripts", "fixtures", "dedup_titles.json")
+
+
+def baseline_score(title, desc):
+    """기존 calculate_priority_score의 키워드 부분 (티어마다 `k in title or k in desc`)."""
+    title, desc = title.lower(), desc.lower()
+    return sum(
+        weight
+        for weight, keywords in scoring.PRIORITY_KEYWORD_TIERS.values()
+        for k in keywords
+        if k in title or k in desc
+    )
+
+
+def baseline_excluded(title, desc):
+    title, desc = title.lower(), desc.lower()
+    return any(kw in title or kw in desc for kw in scoring.EXCLUDE_KEYWORDS)
+
+
+@pytest.mark.parametrize("title, desc", [
+    ("AI 보안 강화… AI보안 전담 조직 신설", ""),
+    ("KISA, CVE-2026-1234 제로데이 경보", "금융권 대상 랜섬웨어 침해 정황"),
+    ("신한은행 보안사고", "은행권 전자금융거래법 개정 추진"),
+    ("법 개정안 국회 통과", "개인정보보호법 시행령 재개정"),
+    ("채용 박람회 개최", "보안 인력 모집"),
+    ("해킹", "해킹"),
+    ("", ""),
+])
+def test_scores_and_exclusion_match_baseline(title, desc):
+    assert scoring.PRIORITY_SCORER.score(title, desc) == baseline_score(title, desc)
+    assert scoring.EXCLUDE_MATCHER.contains_any(f"{title}\n{desc}") == baseline_excluded(title, desc)
+
+
+def test_scores_match_baseline_on_recorded_titles():
+    with open(FIXTURE, encoding="utf-8") as f:
+        rows = json.load(f)
+    # 설명 자리에 다른 기사 제목을 넣어 두 필드 조합도 함께 확인
+    pairs = [(rows[i]["title"], rows[-1 - i]["title"]) for i in range(len(rows))]
+    mismatched = [
+        (title, desc) for title, desc in pairs
+        if scoring.PRIORITY_SCORER.score(title, desc) != baseline_score(title, desc)
+        or scoring.EXCLUDE_MATCHER.contains_any(f"{title}\n{desc}") != baseline_excluded(title, desc)
+    ]
+    assert mismatched == []
+    assert any(scoring.PRIORITY_SCORER.score(title, desc) for title, desc in pairs)
+
+
+def test_keyword_does_not_match_across_title_and_description():
+    # 제목 끝 "해"와 설명 첫 "킹"이 이어져 "해킹"으로 잡히면 안 됨
+    assert scoring.PRIORITY_SCORER.score("보안 정책 발표 해", "킹") == 0
+
+
+def test_matcher_finds_overlapping_keywords():
+    matcher = scoring.KeywordMatcher(["보안", "보안사고", "안사"])
+    assert matcher.find("대형 보안사고 발생") == {"보안", "보안사고", "안사"}
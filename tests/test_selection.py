@@ -0,0 +1,172 @@
+"""선별 모드(샤드·2단계)의 분할·병합 로직과 news_bot 동시 호출 단위 테스트 (LLM 호출은 가짜)."""
+
+import threading
+
+import pytest
+
+import news_bot
+import selection
+import state_store
+
+
+def article(n, category="[국내]"):
+    return {
+        "category": category,
+        "title": f"기사 {n}",
+        "url": f"https://news.example/{n}",
+        "description": f"설명 {n}",
+        "published_date": "2026-03-10",
+    }
+
+
+def urls(articles):
+    return [a["url"] for a in articles]
+
+
+@pytest.fixture(autouse=True)
+def state_db(tmp_path, monkeypatch):
+    monkeypatch.setattr(state_store, "STATE_DB_PATH", tmp_path / "state.db")
+
+
+# ==========================================
+# 샤드 방식 (map-reduce)
+# ==========================================
+def test_split_shards_keeps_category_and_priority_order():
+    items = [article(1), article("e1", "[해외]"), article(2), article(3), article("e2", "[해외]")]
+    shards = selection.split_shards(items, 2)
+    assert [urls(s) for s in shards] == [
+        urls([article(1), article(2)]),
+        urls([article(3)]),
+        urls([article("e1", "[해외]"), article("e2", "[해외]")]),
+    ]
+
+
+def test_merge_scored_ranks_unscored_after_scored():
+    items = [article(n) for n in range(1, 10)] + [article(f"e{n}", "[해외]") for n in range(1, 5)]
+    # 국내 1~4번 샤드가 실패해 점수가 없음
+    scores = {a["url"]: float(n) for n, a in enumerate(items) if a["url"] not in urls(items[:4])}
+    picked = selection.merge_scored(items, scores)
+    domestic = [a for a in picked if not selection.is_overseas(a)]
+    assert urls(domestic) == urls([article(n) for n in (9, 8, 7, 6, 5, 1, 2)])
+    assert urls(picked[7:]) == urls([article(f"e{n}", "[해외]") for n in (4, 3, 2)])
+
+
+def test_merge_scored_min_score_drops_penalized_and_fills_with_domestic():
+    items = [article(n) for n in range(1, 12)] + [article("e1", "[해외]")]
+    scores = {a["url"]: 5.0 for a in items}
+    scores[items[0]["url"]] = -10.0
+    picked = selection.merge_scored(items, scores, min_score=0)
+    assert items[0]["url"] not in urls(picked)
+    # 해외가 1개뿐이므로 국내로 총 10개를 채움
+    assert len(picked) == 10 and urls(picked[-1:]) == urls(items[-1:])
+
+
+def test_score_candidates_scores_shards_concurrently_and_tolerates_failure(monkeypatch):
+    items = [article(n) for n in range(1, 7)]
+    monkeypatch.setattr(news_bot, "SELECTION_SHARD_SIZE", 2)
+    monkeypatch.setattr(news_bot, "SELECTION_MAX_CONCURRENCY", 3)
+    # 세 샤드가 동시에 채점 중이어야만 통과하는 barrier (순차 실행이면 타임아웃)
+    barrier = threading.Barrier(3, timeout=5)
+
+    def fake_score_shard(shard):
+        barrier.wait()
+        if shard[0]["url"] == items[2]["url"]:
+            return None
+        return {a["url"]: 1.0 for a in shard}
+
+    monkeypatch.setattr(news_bot, "score_shard", fake_score_shard)
+    scores = news_bot.score_candidates(items)
+    assert set(scores) == set(urls(items[:2] + items[4:]))
+
+
+# ==========================================
+# 2단계(tiered) 방식
+# ==========================================
+def test_split_tiers_partitions_domestic_and_keeps_overseas_contested():
+    items = [article(1), article(2), article(3), article("e1", "[해외]"), article(4)]
+    local = {items[0]["url"]: 12, items[1]["url"]: 30, items[2]["url"]: 2, items[4]["url"]: 27}
+    accepted, contested, rejected = selection.split_tiers(items, local, accept=25, reject=5)
+    assert urls(accepted) == urls([article(2), article(4)])   # 로컬 점수 높은 순
+    assert urls(contested) == urls([article(1), article("e1", "[해외]")])
+    assert urls(rejected) == urls([article(3)])
+
+
+def test_pick_audit_takes_both_sides_of_the_boundary():
+    accepted = [article(n) for n in (1, 2, 3)]
+    rejected = [article(n) for n in (7, 8, 9)]
+    assert urls(selection.pick_audit(accepted, rejected, 4)) == urls([article(n) for n in (2, 3, 7, 8)])
+    # 한쪽이 모자라면 다른 쪽에서 채움
+    assert urls(selection.pick_audit([], rejected, 2)) == urls(rejected[:2])
+    assert selection.pick_audit(accepted, rejected, 0) == []
+
+
+def test_merge_tiered_fills_accepted_first_then_llm_order():
+    accepted = [article(n) for n in (1, 2)]
+    contested = [article(n) for n in (3, 4, 5)] + [article("e1", "[해외]")]
+    scores = {article(5)["url"]: 9.0, article(3)["url"]: 1.0, article("e1", "[해외]")["url"]: 3.0}
+    picked = selection.merge_tiered(accepted, contested, scores, quotas=(4, 1))
+    # 경합 중 채점되지 않은 4번은 채점된 기사 뒤로
+    assert urls(picked) == urls([article(n) for n in (1, 2, 5, 3)] + [article("e1", "[해외]")])
+
+
+def test_tiered_selection_sends_only_contested_and_audit_to_llm(monkeypatch):
+    items = [article(n) for n in range(1, 7)] + [article("e1", "[해외]")]
+    local = dict(zip(urls(items), [40, 30, 12, 10, 3, 1, 0]))
+    monkeypatch.setattr(news_bot, "calculate_priority_score", lambda a: local[a["url"]])
+    monkeypatch.setattr(news_bot, "SELECTION_TIER_ACCEPT", 25)
+    monkeypatch.setattr(news_bot, "SELECTION_TIER_REJECT", 5)
+    monkeypatch.setattr(news_bot, "SELECTION_TIER_AUDIT", 2)
+    monkeypatch.setattr(news_bot.llm_providers, "ready", lambda: True)
+    monkeypatch.setattr(news_bot, "summarize_winners", lambda winners: [news_bot.local_summary_item(w) for w in winners])
+    sent = []
+
+    def fake_score_candidates(batch):
+        sent.extend(urls(batch))
+        return {url: 5.0 for url in urls(batch)}
+
+    monkeypatch.setattr(news_bot, "score_candidates", fake_score_candidates)
+    result = news_bot.call_groq_tiered_selection(items)
+    # 확정 선택 중 가장 낮은 2번, 확정 제외 중 가장 높은 5번이 감사 표본으로 함께 채점됨
+    assert sent == urls([article(n) for n in (2, 3, 4, 5)] + [article("e1", "[해외]")])
+    assert urls(result)[:2] == urls([article(1), article(2)])
+    assert article(6)["url"] not in urls(result)
+
+
+def test_tiered_selection_without_llm_uses_local_order(monkeypatch):
+    items = [article(n) for n in range(1, 4)]
+    local = dict(zip(urls(items), [30, 10, 1]))
+    monkeypatch.setattr(news_bot, "calculate_priority_score", lambda a: local[a["url"]])
+    monkeypatch.setattr(news_bot.llm_providers, "ready", lambda: False)
+
+    def unexpected(*args):
+        raise AssertionError("LLM 없이도 채점을 시도함")
+
+    monkeypatch.setattr(news_bot, "score_candidates", unexpected)
+    result = news_bot.call_groq_tiered_selection(items)
+    assert urls(result) == urls(items[:2])
+    assert result[1]["summary"] == "설명 2"
+
+
+# ==========================================
+# 선택 기사 동시 요약
+# ==========================================
+def test_summarize_winners_runs_concurrently_and_falls_back_per_article(monkeypatch):
+    winners = [article(1), article(2), article("e1", "[해외]")]
+    monkeypatch.setattr(news_bot, "SUMMARY_MAX_CONCURRENCY", 3)
+    # 세 요약 요청이 동시에 진행 중이어야만 통과하는 barrier (순차 실행이면 타임아웃)
+    barrier = threading.Barrier(3, timeout=5)
+
+    def fake_summarize_one(winner):
+        barrier.wait()
+        if winner["url"] == winners[1]["url"]:
+            return None
+        if selection.is_overseas(winner):
+            # 모델이 다른 기사의 id를 돌려준 응답은 쓰지 않음
+            return {**news_bot.local_summary_item(article(9)), "summary": "엉뚱한 요약"}
+        return {**news_bot.local_summary_item(winner), "title": "다듬은 제목", "summary": "LLM 요약"}
+
+    monkeypatch.setattr(news_bot, "summarize_one", fake_summarize_one)
+    result = news_bot.summarize_winners(winners)
+    assert urls(result) == urls(winners)
+    assert [r["summary"] for r in result] == ["LLM 요약", "설명 2", "설명 e1"]
+    assert result[0]["title"] == "다듬은 제목"
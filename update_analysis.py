@@ -8,12 +8,15 @@ GitHub Actions에서 repository_dispatch 이벤트로 호출됩니다.
 """
 
 import os
-import sqlite3
 import sys
 from datetime import datetime
 from pathlib import Path
 from zoneinfo import ZoneInfo
 
+import daily_export
+import news_search
+import news_store
+
 def main():
     date_str = os.environ.get("ANALYSIS_DATE", "")
     analysis = os.environ.get("ANALYSIS_TEXT", "")
@@ -24,35 +27,38 @@ def main():
 
     db_path = Path(__file__).parent / "web" / "data" / "news.db"
 
-    if not db_path.exists():
+    if not news_store.index_db_path(db_path).exists():
         print(f"DB not found: {db_path}")
         sys.exit(1)
 
     now_iso = datetime.now(ZoneInfo("Asia/Seoul")).isoformat()
 
-    conn = sqlite3.connect(str(db_path))
-    cursor = conn.cursor()
-
-    # Check if briefing exists for this date
-    cursor.execute("SELECT date FROM daily_briefings WHERE date = ?", (date_str,))
-    row = cursor.fetchone()
+    # 쓰기 전 DB 지문 - 매니페스트가 이때의 DB와 맞았으면 이 날짜만 내보내면 됨
+    try:
+        previous_source = daily_export.source_fingerprint(db_path)
+    except Exception as e:
+        print(f"Warning: DB fingerprint failed, exporting all dates: {e}", file=sys.stderr)
+        previous_source = None
 
-    if row:
-        cursor.execute(
-            "UPDATE daily_briefings SET analysis = ?, created_at = ? WHERE date = ?",
-            (analysis, now_iso, date_str)
-        )
+    if news_store.save_analysis(db_path, date_str, analysis, now_iso):
         print(f"Updated analysis for {date_str}")
     else:
-        cursor.execute(
-            "INSERT INTO daily_briefings (date, analysis, created_at) VALUES (?, ?, ?)",
-            (date_str, analysis, now_iso)
-        )
         print(f"Inserted analysis for {date_str}")
 
     print(f"Analysis length: {len(analysis)} chars")
-    conn.commit()
-    conn.close()
+
+    # 분석 저장은 이미 끝났으므로 파생 산출물 갱신 실패는 경고만 남김
+    try:
+        changed = daily_export.export_dates(db_path, [date_str], previous_source)
+        print(f"Exported {len(changed)} daily JSON file(s)")
+    except Exception as e:
+        print(f"Warning: daily JSON export failed for {date_str}: {e}", file=sys.stderr)
+
+    try:
+        news_search.index_dates(db_path, [date_str])
+        print(f"Search index updated for {date_str}")
+    except Exception as e:
+        print(f"Warning: search index update failed for {date_str}: {e}", file=sys.stderr)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,182 @@
+"""
+Lambda 웜 컨테이너 상태 관리
+
+Lambda는 같은 컨테이너를 재사용할 때 모듈 스코프를 유지하므로, 날짜와 무관한
+자원을 여기에 보관해 두면 재실행·수동 트리거 시 준비 비용을 건너뛸 수 있습니다.
+    - Tavily 클라이언트 (자체 requests 세션과 keep-alive 커넥션 포함)
+    - 최근 브리핑 중복 색인 (news.db 파일과 날짜 범위가 같을 때만 재사용)
+    - 공유 HTTP 세션 (http_client 모듈 스코프, 여기서는 상태 점검만 담당)
+키워드 매처(scoring)는 모듈 로드 시 한 번 컴파일되어 별도 관리 없이 유지됩니다.
+
+각 자원은 키(자원을 만든 입력값)와 생성 시각을 함께 저장하고, 꺼낼 때마다
+    - 키가 바뀌었거나 (news.db 갱신, 날짜 변경, 재생 서버 주소 변경)
+    - 최대 보관 시간을 넘었거나
+    - 마지막 사용 후 유휴 시간을 넘었거나 (keep-alive 커넥션을 품은 자원)
+    - 상태 점검 함수가 실패하면
+폐기하고 새로 만듭니다. 실행이 실패하면 lambda_handler가 전체를 무효화합니다.
+API 키 등 환경변수는 Lambda 설정을 바꾸면 새 컨테이너에서 모듈째 다시 로드되므로 따로 비교하지 않습니다.
+
+환경변수:
+    WARM_STATE_DISABLE: true면 매 호출마다 새로 생성 (기본값: false)
+    WARM_STATE_MAX_AGE_SEC: 자원 최대 보관 시간 (기본값: 21600 = 6시간)
+    HTTP_SESSION_MAX_IDLE_SEC: 이 시간 이상 쉬었던 HTTP 세션은 폐기 (기본값: 240)
+"""
+
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Optional
+
+import http_client
+
+WARM_STATE_DISABLE = os.environ.get("WARM_STATE_DISABLE", "").lower() in ("1", "true", "yes")
+WARM_STATE_MAX_AGE_SEC = float(os.environ.get("WARM_STATE_MAX_AGE_SEC", "21600"))
+# NAT·로드밸런서가 유휴 TCP 연결을 끊는 시간(보통 350초)보다 짧게
+HTTP_SESSION_MAX_IDLE_SEC = float(os.environ.get("HTTP_SESSION_MAX_IDLE_SEC", "240"))
+
+logger = logging.getLogger(__name__)
+
+
+class _Entry:
+    def __init__(self, value: Any, key: Hashable, dispose: Optional[Callable[[Any], None]]):
+        self.value = value
+        self.key = key
+        self.dispose = dispose
+        self.created_at = time.monotonic()
+        self.last_used = self.created_at
+        self.hits = 0
+
+
+_lock = threading.Lock()
+_entries: Dict[str, _Entry] = {}
+_invocations = 0
+
+
+def _dispose(name: str, entry: _Entry) -> None:
+    if entry.dispose is None:
+        return
+    try:
+        entry.dispose(entry.value)
+    except Exception as e:
+        logger.warning(f"   ⚠️ 웜 상태 자원 정리 실패 ({name}): {e}")
+
+
+def get(
+    name: str,
+    factory: Callable[[], Any],
+    key: Hashable = None,
+    health_check: Optional[Callable[[Any], bool]] = None,
+    dispose: Optional[Callable[[Any], None]] = None,
+    max_age_sec: Optional[float] = None,
+    max_idle_sec: Optional[float] = None
+) -> Any:
+    """
+    보관된 자원을 반환하고, 없거나 무효하면 factory로 새로 만들어 보관합니다.
+
+    Args:
+        name: 자원 이름
+        factory: 자원 생성 함수 (예외는 호출부로 전달, 실패한 자원은 보관하지 않음)
+        key: 자원을 만든 입력값 (이전 값과 다르면 새로 생성)
+        health_check: 재사용 전 상태 점검 함수 (False 또는 예외면 새로 생성)
+        dispose: 폐기 시 호출할 정리 함수 (예: 세션 close)
+        max_age_sec: 최대 보관 시간 (기본값: WARM_STATE_MAX_AGE_SEC)
+        max_idle_sec: 마지막 사용 후 이 시간이 지나면 새로 생성 (커넥션을 품은 자원용)
+
+    Returns:
+        보관되었거나 새로 만든 자원
+    """
+    max_age = WARM_STATE_MAX_AGE_SEC if max_age_sec is None else max_age_sec
+    with _lock:
+        entry = _entries.pop(name, None)
+
+    if entry is not None:
+        reason = None
+        if WARM_STATE_DISABLE:
+            reason = "비활성화"
+        elif entry.key != key:
+            reason = "입력 변경"
+        elif time.monotonic() - entry.created_at > max_age:
+            reason = "보관 시간 초과"
+        elif max_idle_sec is not None and time.monotonic() - entry.last_used > max_idle_sec:
+            reason = "유휴 시간 초과"
+        elif health_check is not None:
+            try:
+                if not health_check(entry.value):
+                    reason = "상태 점검 실패"
+            except Exception as e:
+                reason = f"상태 점검 오류: {e}"
+
+        if reason is None:
+            entry.hits += 1
+            entry.last_used = time.monotonic()
+            with _lock:
+                _entries[name] = entry
+            logger.debug(f"   ♻️ 웜 상태 재사용: {name} ({entry.hits}회째)")
+            return entry.value
+
+        logger.info(f"   🔄 웜 상태 재생성: {name} ({reason})")
+        _dispose(name, entry)
+
+    value = factory()
+    with _lock:
+        _entries[name] = _Entry(value, key, dispose)
+    return value
+
+
+def invalidate(name: Optional[str] = None) -> None:
+    """자원 하나(name) 또는 전체를 폐기합니다. 공유 HTTP 세션도 함께 닫습니다."""
+    with _lock:
+        if name is None:
+            removed = list(_entries.items())
+            _entries.clear()
+        else:
+            entry = _entries.pop(name, None)
+            removed = [(name, entry)] if entry is not None else []
+    for entry_name, entry in removed:
+        _dispose(entry_name, entry)
+    if name is None:
+        http_client.close_session()
+
+
+def check_http_session() -> None:
+    """오래 쉬었던 공유 HTTP 세션은 끊긴 keep-alive 커넥션을 재사용하지 않도록 닫습니다."""
+    idle = http_client.idle_seconds()
+    if idle is not None and idle > HTTP_SESSION_MAX_IDLE_SEC:
+        logger.info(f"   🔄 HTTP 세션 재생성 ({idle:.0f}초 유휴)")
+        http_client.close_session()
+
+
+def begin_invocation(reset: bool = False) -> Dict[str, Any]:
+    """
+    Lambda 호출 시작 시 웜 상태를 점검합니다.
+
+    Args:
+        reset: True면 보관된 자원을 모두 폐기 (수동 트리거의 강제 초기화용)
+
+    Returns:
+        Dict: 호출 번호, 웜 여부, 보관 중인 자원 목록
+    """
+    global _invocations
+    _invocations += 1
+    warm = _invocations > 1
+
+    if reset or WARM_STATE_DISABLE:
+        invalidate()
+    else:
+        check_http_session()
+
+    summary = {"invocation": _invocations, "warm": warm, "resources": stats()}
+    if warm:
+        logger.info(f"♻️ 웜 컨테이너 재사용 ({_invocations}번째 호출, 보관 자원 {len(summary['resources'])}개)")
+    return summary
+
+
+def stats() -> Dict[str, Dict[str, Any]]:
+    """보관 중인 자원별 생성 후 경과 시간과 재사용 횟수를 반환합니다."""
+    now = time.monotonic()
+    with _lock:
+        return {
+            name: {"age_sec": round(now - entry.created_at, 1), "hits": entry.hits}
+            for name, entry in _entries.items()
+        }
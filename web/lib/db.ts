@@ -1,28 +1,141 @@
 import path from 'path';
 import fs from 'fs';
+import crypto from 'crypto';
+import zlib from 'zlib';
 import type { Article, DailyBriefing, DailyData } from './types';
-import type { Database } from 'sql.js';
+import type { Database, SqlJsStatic } from 'sql.js';
 import initSqlJs from 'sql.js';
 
-let cachedDb: Database | null = null;
+// Per-date static exports written by the Python pipeline (daily_export.py).
+// When present, page loads read one small gzip file instead of the whole DB.
+interface DailyManifestEntry {
+  article_count: number;
+  domestic_count: number;
+  overseas_count: number;
+  has_analysis: boolean;
+  prev_date: string | null;
+  next_date: string | null;
+  sha: string;
+}
+
+interface DailyManifest {
+  version: number;
+  latest: string | null;
+  // DB file (relative to data/) and its content hash at export time
+  source?: { file: string; sha: string };
+  dates: Record<string, DailyManifestEntry>;
+}
+
+let cachedManifest: DailyManifest | null | undefined;
+
+function getDailyManifest(): DailyManifest | null {
+  if (cachedManifest !== undefined) return cachedManifest;
+
+  const manifestPath = path.join(process.cwd(), 'data', 'daily', 'index.json');
+  cachedManifest = fs.existsSync(manifestPath)
+    ? (JSON.parse(fs.readFileSync(manifestPath, 'utf-8')) as DailyManifest)
+    : null;
+  return cachedManifest;
+}
+
+// The manifest is only trusted on its own when it was exported from the DB file
+// that is deployed. A writer that skips daily_export.py (the Cowork prompt pushes
+// only the DB) leaves it behind; then dates come from both and the DB wins.
+let cachedManifestCurrent: boolean | undefined;
+
+async function manifestCurrent(manifest: DailyManifest): Promise<boolean> {
+  if (cachedManifestCurrent !== undefined) return cachedManifestCurrent;
+
+  const source = manifest.source;
+  const sourcePath = source ? path.join(process.cwd(), 'data', source.file) : null;
+  cachedManifestCurrent =
+    !!source &&
+    source.file === (await indexDbFile()) &&
+    !!sourcePath &&
+    fs.existsSync(sourcePath) &&
+    crypto.createHash('sha256').update(fs.readFileSync(sourcePath)).digest('hex').slice(0, 16) === source.sha;
+  if (!cachedManifestCurrent) {
+    console.warn('data/daily/index.json does not match the deployed DB; merging its dates with the DB');
+  }
+  return cachedManifestCurrent;
+}
 
-async function getDb(): Promise<Database | null> {
-  if (cachedDb) return cachedDb;
+function readDailyExport(date: string): Omit<DailyData, 'prevDate' | 'nextDate'> | null {
+  const filePath = path.join(process.cwd(), 'data', 'daily', `${date}.json.gz`);
+  if (!fs.existsSync(filePath)) return null;
+  const doc = JSON.parse(zlib.gunzipSync(fs.readFileSync(filePath)).toString('utf-8'));
+  return { briefing: doc.briefing ?? null, articles: doc.articles };
+}
+
+// Partitioned layout (news_store.py, NEWS_DB_LAYOUT=monthly): data/news/catalog.db
+// holds briefing_index and data/news/YYYY-MM.db holds each month's rows, so a
+// page only loads the catalog plus one small shard instead of the whole archive.
+const dbCache = new Map<string, Database>();
+let sqlJs: SqlJsStatic | null = null;
+
+async function openDbFile(file: string): Promise<Database | null> {
+  const cached = dbCache.get(file);
+  if (cached) return cached;
 
-  const dbPath = path.join(process.cwd(), 'data', 'news.db');
+  const dbPath = path.join(process.cwd(), 'data', file);
   if (!fs.existsSync(dbPath)) {
     return null;
   }
 
-  const SQL = await initSqlJs();
-  const buffer = fs.readFileSync(dbPath);
-  const db = new SQL.Database(buffer);
-  cachedDb = db;
+  if (!sqlJs) sqlJs = await initSqlJs();
+  const db = new sqlJs.Database(fs.readFileSync(dbPath));
+  dbCache.set(file, db);
   return db;
 }
 
-async function queryAll<T>(sql: string, params: unknown[] = []): Promise<T[]> {
-  const db = await getDb();
+// A news.db holding a later date than the catalog was written by something that
+// bypasses news_store (the Cowork prompt) after the split, so the shards are the
+// stale copy; serve news.db instead, like news_store.is_partitioned does.
+let partitioned: boolean | null = null;
+
+async function isPartitioned(): Promise<boolean> {
+  if (partitioned === null) {
+    const catalog = await openDbFile('news/catalog.db');
+    partitioned = catalog !== null;
+    const singlePath = path.join(process.cwd(), 'data', 'news.db');
+    if (catalog && fs.existsSync(singlePath)) {
+      const indexed = await queryOne<{ latest: string | null }>(
+        'SELECT MAX(date) AS latest FROM briefing_index',
+        [],
+        'news/catalog.db'
+      );
+      // Read once without caching so the monthly layout keeps its small memory footprint
+      const single = new sqlJs!.Database(fs.readFileSync(singlePath));
+      const latest = (single.exec('SELECT MAX(date) FROM articles')[0]?.values[0]?.[0] as string | null) ?? null;
+      single.close();
+      if (latest !== null && (indexed?.latest == null || latest > indexed.latest)) {
+        console.warn(
+          `data/news.db has ${latest}, newer than data/news/catalog.db (${indexed?.latest}); ` +
+            'ignoring the monthly shards until `python news_store.py reindex` folds it in'
+        );
+        partitioned = false;
+      }
+    }
+  }
+  return partitioned;
+}
+
+// DB holding briefing_index (and, in the single-file layout, everything else).
+async function indexDbFile(): Promise<string> {
+  return (await isPartitioned()) ? 'news/catalog.db' : 'news.db';
+}
+
+// DB holding articles/daily_briefings for one date.
+async function dateDbFile(date: string): Promise<string> {
+  return (await isPartitioned()) ? `news/${date.slice(0, 7)}.db` : 'news.db';
+}
+
+async function getDb(file?: string): Promise<Database | null> {
+  return openDbFile(file ?? (await indexDbFile()));
+}
+
+async function queryAll<T>(sql: string, params: unknown[] = [], file?: string): Promise<T[]> {
+  const db = await getDb(file);
   if (!db) return [];
 
   const stmt = db.prepare(sql);
@@ -38,34 +151,117 @@ async function queryAll<T>(sql: string, params: unknown[] = []): Promise<T[]> {
   return results;
 }
 
-async function queryOne<T>(sql: string, params: unknown[] = []): Promise<T | null> {
-  const results = await queryAll<T>(sql, params);
+async function queryOne<T>(sql: string, params: unknown[] = [], file?: string): Promise<T | null> {
+  const results = await queryAll<T>(sql, params, file);
   return results.length > 0 ? results[0] : null;
 }
 
-export async function getAllDates(): Promise<string[]> {
-  const rows = await queryAll<{ date: string }>(
-    'SELECT DISTINCT date FROM articles ORDER BY date DESC'
-  );
+// briefing_index is maintained by the Python writer (news_store.py); older DB
+// files without it fall back to scanning articles. Writers that insert into
+// articles directly (the Cowork prompt) leave it stale until they run
+// `python news_store.py reindex`, so in the single-file layout it is only used
+// when it covers the same dates as articles.
+let hasBriefingIndex: boolean | null = null;
+
+async function briefingIndexReady(): Promise<boolean> {
+  if (hasBriefingIndex === null) {
+    const row = await queryOne<{ name: string }>(
+      "SELECT name FROM sqlite_master WHERE type = 'table' AND name = 'briefing_index'"
+    );
+    hasBriefingIndex = row !== null && ((await isPartitioned()) || (await briefingIndexFresh()));
+  }
+  return hasBriefingIndex;
+}
+
+async function briefingIndexFresh(): Promise<boolean> {
+  type Coverage = { days: number; latest: string | null };
+  const indexed = await queryOne<Coverage>('SELECT COUNT(*) AS days, MAX(date) AS latest FROM briefing_index');
+  const actual = await queryOne<Coverage>('SELECT COUNT(DISTINCT date) AS days, MAX(date) AS latest FROM articles');
+  const fresh = indexed?.days === actual?.days && indexed?.latest === actual?.latest;
+  if (!fresh) {
+    console.warn(
+      `briefing_index is stale (${indexed?.days} dates up to ${indexed?.latest}, ` +
+        `articles has ${actual?.days} up to ${actual?.latest}); scanning articles instead`
+    );
+  }
+  return fresh;
+}
+
+async function getDbDates(): Promise<string[]> {
+  const sql = (await briefingIndexReady())
+    ? 'SELECT date FROM briefing_index ORDER BY date DESC'
+    : 'SELECT DISTINCT date FROM articles ORDER BY date DESC';
+  const rows = await queryAll<{ date: string }>(sql);
   return rows.map((r) => r.date);
 }
 
+export async function getAllDates(): Promise<string[]> {
+  const manifest = getDailyManifest();
+  const dates = manifest ? Object.keys(manifest.dates) : [];
+  if (manifest && (await manifestCurrent(manifest))) {
+    return dates.sort().reverse();
+  }
+
+  const dbDates = await getDbDates();
+  if (!manifest) return dbDates;
+  return Array.from(new Set([...dates, ...dbDates])).sort().reverse();
+}
+
 export async function getLatestDate(): Promise<string | null> {
   const dates = await getAllDates();
   return dates.length > 0 ? dates[0] : null;
 }
 
 export async function getDailyData(date: string): Promise<DailyData> {
-  const briefing = await queryOne<DailyBriefing>(
+  const manifest = getDailyManifest();
+  const entry = manifest?.dates[date];
+  const exported = entry ? readDailyExport(date) : null;
+  if (manifest && (await manifestCurrent(manifest)) && entry && exported) {
+    return { ...exported, prevDate: entry.prev_date, nextDate: entry.next_date };
+  }
+
+  let briefing = await queryOne<DailyBriefing>(
     'SELECT * FROM daily_briefings WHERE date = ?',
-    [date]
+    [date],
+    await dateDbFile(date)
   );
 
-  const articles = await queryAll<Article>(
+  let articles = await queryAll<Article>(
     'SELECT * FROM articles WHERE date = ? ORDER BY id ASC',
-    [date]
+    [date],
+    await dateDbFile(date)
   );
 
+  if (manifest) {
+    // Stale manifest: the DB is authoritative, the export only fills dates the DB lacks.
+    if (articles.length === 0 && exported) {
+      ({ briefing, articles } = exported);
+    }
+    const dates = await getAllDates();
+    const i = dates.indexOf(date);
+    return {
+      briefing: briefing ?? null,
+      articles,
+      prevDate: i >= 0 && i + 1 < dates.length ? dates[i + 1] : null,
+      nextDate: i > 0 ? dates[i - 1] : null,
+    };
+  }
+
+  if (await briefingIndexReady()) {
+    const entry = await queryOne<{ prev_date: string | null; next_date: string | null }>(
+      'SELECT prev_date, next_date FROM briefing_index WHERE date = ?',
+      [date]
+    );
+    if (entry) {
+      return {
+        briefing: briefing ?? null,
+        articles,
+        prevDate: entry.prev_date,
+        nextDate: entry.next_date,
+      };
+    }
+  }
+
   const prevRow = await queryOne<{ date: string }>(
     'SELECT date FROM articles WHERE date < ? GROUP BY date ORDER BY date DESC LIMIT 1',
     [date]